@@ -15,7 +15,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich import print as rprint
 
-from src.core.converter import FileConverter
+from src.core.converter import FileConverter, OUTPUT_EXTENSIONS
 from src.utils.config import Config
 from src.utils.logger import setup_logger
 
@@ -61,10 +61,7 @@ def convert(
         output_path.mkdir(parents=True, exist_ok=True)
         
         # Generar ruta de salida
-        if format == "sqlite":
-            output_file = output_path / f"{table_name}.db"
-        else:
-            output_file = output_path / f"{table_name}.sql"
+        output_file = output_path / f"{table_name}{OUTPUT_EXTENSIONS.get(format, '.sql')}"
         
         # Mostrar información
         console.print(Panel(f"[bold blue]Conversión de Archivo[/bold blue]\n"
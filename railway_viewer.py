@@ -8,12 +8,25 @@ import pandas as pd
 import sys
 import os
 from pathlib import Path
+from dotenv import load_dotenv
 
 # Agregar src al path
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from src.writers.mysql_writer import MySQLWriter
 
+# Cargar variables de entorno desde .env (en Railway ya vienen definidas)
+load_dotenv()
+
+# Variables de entorno obligatorias para la conexión
+REQUIRED_ENV_VARS = ['MYSQLHOST', 'MYSQLUSER', 'MYSQLPASSWORD', 'MYSQLDATABASE']
+
+# Tablas de prueba que no se muestran (patrón LIKE, filtrado en el servidor)
+EXCLUDED_TABLES_LIKE = '%\\_test'
+
+# Antigüedad máxima (segundos) de los conteos exactos guardados en _table_stats
+TABLE_STATS_MAX_AGE = 3600
+
 # Configuración de página
 st.set_page_config(
     page_title="Visor de Base de Datos MySQL",
@@ -21,15 +34,25 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource
 def get_mysql_connection():
-    """Obtener conexión MySQL usando variables de entorno"""
+    """
+    Obtener conexión MySQL usando variables de entorno
+    
+    El escritor (y su pool de conexiones) se crea una sola vez por proceso
+    y se comparte entre sesiones y recargas de la página.
+    """
+    missing = [name for name in REQUIRED_ENV_VARS if not os.getenv(name)]
+    if missing:
+        raise ValueError(f"Faltan variables de entorno de MySQL: {', '.join(missing)}")
+    
     db_config = {
         'type': 'mysql',
-        'host': os.getenv('MYSQLHOST', 'shinkansen.proxy.rlwy.net'),
-        'port': int(os.getenv('MYSQLPORT', '50498')),
-        'user': os.getenv('MYSQLUSER', 'root'),
-        'password': os.getenv('MYSQLPASSWORD', 'OZLeLlikuBETQMzrldNVSJNryrYEZkZJ'),
-        'database': os.getenv('MYSQLDATABASE', 'railway'),
+        'host': os.environ['MYSQLHOST'],
+        'port': int(os.getenv('MYSQLPORT', '3306')),
+        'user': os.environ['MYSQLUSER'],
+        'password': os.environ['MYSQLPASSWORD'],
+        'database': os.environ['MYSQLDATABASE'],
         'charset': 'utf8mb4',
         'ssl_disabled': True
     }
@@ -71,33 +94,28 @@ def main():
             with st.spinner("📊 Cargando información de tablas..."):
                 mysql_writer = st.session_state.mysql_writer
                 
-                with mysql_writer.engine.connect() as conn:
-                    from sqlalchemy import text
-                    overview_result = conn.execute(text(
-                        """
-                        SELECT table_name, table_rows
-                        FROM information_schema.tables
-                        WHERE table_schema = DATABASE()
-                        """
-                    ))
-                    rows = overview_result.fetchall()
-                    
-                    tables_info = []
-                    total_rows = 0
-                    for name, approx_count in rows:
-                        if name.endswith('_test'):
-                            continue
-                        count_val = int(approx_count) if approx_count is not None else 0
-                        total_rows += count_val
-                        tables_info.append({'name': name, 'count': count_val})
-                    
-                    # Ordenar por nombre para una mejor UX
-                    tables_info.sort(key=lambda t: t['name'])
-                    
-                    st.session_state.tables_data = {
-                        'tables': tables_info,
-                        'total_rows': total_rows
-                    }
+                # Conteos exactos guardados (si no están vencidos), nombres con conteo
+                # aproximado y columnas: una conexión y una transacción de lectura
+                snapshot = mysql_writer.get_overview_snapshot(
+                    max_age_seconds=TABLE_STATS_MAX_AGE,
+                    exclude_like=EXCLUDED_TABLES_LIKE
+                )
+                exact_counts = snapshot['stats']
+                
+                tables_info = []
+                total_rows = 0
+                for table_info in snapshot['tables']:
+                    if table_info['name'] in exact_counts:
+                        table_info['count'] = exact_counts[table_info['name']]
+                        table_info['exact'] = True
+                    total_rows += table_info['count']
+                    tables_info.append(table_info)
+                
+                st.session_state.tables_data = {
+                    'tables': tables_info,
+                    'total_rows': total_rows,
+                    'columns': snapshot['columns']
+                }
         
         # Mostrar datos cargados
         tables_data = st.session_state.tables_data
@@ -111,22 +129,21 @@ def main():
             try:
                 with st.spinner("🧮 Calculando conteos exactos de todas las tablas..."):
                     mysql_writer = st.session_state.mysql_writer
-                    from sqlalchemy import text
+                    # Recalcula y guarda en _table_stats para próximas cargas
+                    exact_counts = mysql_writer.refresh_table_stats(
+                        [t['name'] for t in tables_data['tables']]
+                    )
                     refreshed = []
                     total_exact = 0
-                    with mysql_writer.engine.connect() as conn:
-                        for t in tables_data['tables']:
-                            name = t['name']
-                            try:
-                                exact = conn.execute(text(f"SELECT COUNT(*) FROM `{name}`")).scalar()
-                                exact_int = int(exact or 0)
-                            except Exception:
-                                exact_int = int(t.get('count') or 0)
-                            refreshed.append({'name': name, 'count': exact_int})
-                            total_exact += exact_int
+                    for t in tables_data['tables']:
+                        name = t['name']
+                        exact_int = exact_counts.get(name, int(t.get('count') or 0))
+                        refreshed.append({'name': name, 'count': exact_int, 'exact': name in exact_counts})
+                        total_exact += exact_int
                     st.session_state.tables_data = {
                         'tables': refreshed,
-                        'total_rows': total_exact
+                        'total_rows': total_exact,
+                        'columns': tables_data['columns']
                     }
                 st.success("Conteos exactos actualizados")
                 st.rerun()
@@ -135,15 +152,20 @@ def main():
 
         st.markdown(f"**📋 Encontradas {len(tables_data['tables'])} tablas:**")
         
-        # Mostrar resumen de tablas sin recargar
-        col1, col2, col3 = st.columns(3)
-        
-        for i, table_info in enumerate(tables_data['tables']):
-            with [col1, col2, col3][i % 3]:
-                st.metric(
-                    f"📊 {table_info['name']}",
-                    f"{table_info['count']:,} filas"
-                )
+        # Mostrar resumen de tablas en un único elemento (no un st.metric por tabla)
+        overview_df = pd.DataFrame([
+            {
+                "Tabla": f"📊 {table_info['name']}",
+                "Filas": table_info['count'],
+                "Conteo": "exacto" if table_info.get('exact') else "aprox."
+            }
+            for table_info in tables_data['tables']
+        ])
+        st.dataframe(
+            overview_df,
+            use_container_width=True,
+            hide_index=True
+        )
         
         st.markdown(f"**📈 Total de filas en todas las tablas (aprox.): {tables_data['total_rows']:,}**")
         
@@ -160,37 +182,33 @@ def main():
             # Calcular conteo exacto automáticamente al seleccionar la tabla
             auto_exact_key = f"exact_count_{selected_table}"
             # Recalcular si nunca se calculó o si cambió la tabla
+            selected_info = next(t for t in tables_data['tables'] if t['name'] == selected_table)
             if st.session_state.get('last_selected_table') != selected_table:
                 st.session_state['last_selected_table'] = selected_table
-                st.session_state[auto_exact_key] = None
+                # Si el conteo viene de _table_stats ya es exacto
+                st.session_state[auto_exact_key] = selected_info['count'] if selected_info.get('exact') else None
             
-            if st.session_state.get(auto_exact_key) is None:
-                with st.spinner(f"🧮 Calculando conteo exacto de {selected_table}..."):
-                    try:
-                        from sqlalchemy import text
-                        with mysql_writer.engine.connect() as conn:
-                            exact_total = conn.execute(text(f"SELECT COUNT(*) FROM `{selected_table}`")).scalar()
-                        st.session_state[auto_exact_key] = int(exact_total)
-                        # Actualizar cache de tablas y total global
-                        for t in tables_data['tables']:
-                            if t['name'] == selected_table:
-                                t['count'] = st.session_state[auto_exact_key]
-                                break
-                        tables_data['total_rows'] = sum(t['count'] for t in tables_data['tables'])
-                    except Exception as e:
-                        st.warning(f"No se pudo obtener conteo exacto: {e}")
-            
-            # Cache para estructura de tabla
-            cache_key = f"structure_{selected_table}"
-            if cache_key not in st.session_state:
+            # La estructura ya viene del listado; solo se consulta si falta o si
+            # hace falta el conteo exacto (ambos en una sola consulta)
+            needs_count = st.session_state.get(auto_exact_key) is None
+            if needs_count or selected_table not in tables_data['columns']:
                 with st.spinner(f"📋 Cargando estructura de {selected_table}..."):
-                    with mysql_writer.engine.connect() as conn:
-                        from sqlalchemy import text
-                        desc_result = conn.execute(text(f"DESCRIBE `{selected_table}`"))
-                        columns_info = list(desc_result)
-                        st.session_state[cache_key] = columns_info
+                    profile = mysql_writer.get_table_profile(selected_table, include_row_count=needs_count)
+                
+                if 'error' in profile:
+                    st.warning(f"No se pudo obtener la estructura y el conteo exacto: {profile['error']}")
+                else:
+                    tables_data['columns'][selected_table] = profile['columns']
+                    
+                    if needs_count:
+                        st.session_state[auto_exact_key] = profile['row_count']
+                        mysql_writer.update_table_stats({selected_table: profile['row_count']})
+                        # Actualizar cache de la tabla y ajustar el total con la diferencia
+                        tables_data['total_rows'] += profile['row_count'] - selected_info['count']
+                        selected_info['count'] = profile['row_count']
+                        selected_info['exact'] = True
             
-            columns_info = st.session_state[cache_key]
+            columns_info = tables_data['columns'].get(selected_table, [])
             
             col1, col2 = st.columns([1, 2])
             
@@ -199,10 +217,10 @@ def main():
                 structure_data = []
                 for col_info in columns_info:
                     structure_data.append({
-                        "Columna": col_info[0],
-                        "Tipo": col_info[1],
-                        "Nulo": col_info[2],
-                        "Clave": col_info[3] or ""
+                        "Columna": col_info['name'],
+                        "Tipo": col_info['type'],
+                        "Nulo": "YES" if col_info['null'] else "NO",
+                        "Clave": col_info['key'] or ""
                     })
                 st.dataframe(structure_data, hide_index=True)
             
@@ -228,14 +246,11 @@ def main():
                 offset = (current_page - 1) * page_size
                 
                 with st.spinner(f"📥 Cargando {page_size} filas de {selected_table} (página {current_page}/{total_pages})..."):
-                    query = f"SELECT * FROM `{selected_table}` LIMIT {page_size} OFFSET {offset}"
-                    
                     try:
                         mysql_writer = st.session_state.mysql_writer
                         
-                        # Usar pandas para mostrar los datos
-                        import sqlalchemy
-                        df = pd.read_sql(query, mysql_writer.engine)
+                        # Leer solo la página pedida (cursor del lado del servidor)
+                        df = mysql_writer.read_table_page(selected_table, page_size, offset)
                         
                         # Guardar datos en session_state
                         st.session_state.current_data = {
@@ -292,7 +307,8 @@ def main():
     col1, col2 = st.columns(2)
     with col1:
         if st.button("🔄 Recargar Conexión"):
-            # Limpiar cache de conexión
+            # Limpiar cache de conexión (incluido el engine compartido)
+            get_mysql_connection.clear()
             for key in ['tables_data', 'connected', 'current_data']:
                 if key in st.session_state:
                     del st.session_state[key]
@@ -12,9 +12,19 @@ from .validators import DataValidator
 from .exceptions import ConversionError, ValidationError
 from src.readers import CSVReader, ExcelReader, JSONReader
 from src.readers.robust_access_reader import RobustAccessReader
-from src.writers import SQLWriter, SQLiteWriter, SupabaseWriter, CSVWriter, ExcelWriter, JSONWriter
+from src.writers import SQLWriter, SQLiteWriter, SupabaseWriter, CSVWriter, ExcelWriter, JSONWriter, ParquetWriter
 from src.utils.logger import get_logger
 
+# Extensión de archivo de salida por formato
+OUTPUT_EXTENSIONS = {
+    "sqlite": ".db",
+    "csv": ".csv",
+    "excel": ".xlsx",
+    "json": ".json",
+    "parquet": ".parquet",
+    "sql": ".sql"
+}
+
 class FileConverter:
     """
     Clase principal para convertir archivos a diferentes formatos de base de datos
@@ -24,14 +34,16 @@ class FileConverter:
         self.validator = DataValidator()
         self.logger = get_logger(__name__)
         
-        # Inicializar readers
+        # Inicializar readers (una instancia por tipo: .accdb y .mdb comparten caché)
+        excel_reader = ExcelReader()
+        access_reader = RobustAccessReader()
         self.readers = {
             '.csv': CSVReader(),
-            '.xlsx': ExcelReader(),
-            '.xls': ExcelReader(),
+            '.xlsx': excel_reader,
+            '.xls': excel_reader,
             '.json': JSONReader(),
-            '.accdb': RobustAccessReader(),
-            '.mdb': RobustAccessReader()
+            '.accdb': access_reader,
+            '.mdb': access_reader
         }
         
         # Inicializar writers
@@ -41,7 +53,8 @@ class FileConverter:
             'supabase': SupabaseWriter(),
             'csv': CSVWriter(),
             'excel': ExcelWriter(),
-            'json': JSONWriter()
+            'json': JSONWriter(),
+            'parquet': ParquetWriter()
         }
     
     def convert_file(
@@ -60,11 +73,13 @@ class FileConverter:
             output_path: Ruta del archivo de salida
             output_format: Formato de salida (sql, sqlite, supabase)
             table_name: Nombre de la tabla
-            **kwargs: Argumentos adicionales para el writer
+            **kwargs: Argumentos adicionales para el writer; 'preview_rows' (no se
+                pasa al writer) añade al resultado 'preview' con las primeras filas leídas
         
         Returns:
             Dict con información del resultado de la conversión
         """
+        preview_rows = kwargs.pop('preview_rows', 0)
         try:
             self.logger.info(f"Iniciando conversión: {input_path} -> {output_format}")
             
@@ -89,6 +104,9 @@ class FileConverter:
                 'table_name': table_name,
                 'format': output_format
             })
+            if preview_rows:
+                # Evita que la interfaz vuelva a leer el origen para la vista previa
+                result['preview'] = df.head(preview_rows)
             
             self.logger.info(f"Conversión completada exitosamente: {output_path}")
             return result
@@ -124,10 +142,14 @@ class FileConverter:
         if not input_path.exists():
             raise ValidationError(f"El directorio de entrada no existe: {input_dir}")
         
-        # Obtener archivos soportados
-        supported_files = []
-        for ext in self.validator.SUPPORTED_FORMATS['input']:
-            supported_files.extend(input_path.glob(f"*{ext}"))
+        # Obtener archivos soportados en una sola pasada por el directorio
+        # (la extensión se compara igual que en validate_file_format)
+        input_extensions = set(self.validator.SUPPORTED_FORMATS['input'])
+        with os.scandir(input_path) as entries:
+            supported_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in input_extensions
+            )
         
         if not supported_files:
             self.logger.warning(f"No se encontraron archivos soportados en: {input_dir}")
@@ -435,11 +457,9 @@ class FileConverter:
         from datetime import datetime
         
         # Configuración por defecto
+        extension = OUTPUT_EXTENSIONS.get(output_format, f".{output_format}")
         if not naming_config:
-            if output_format == 'sqlite':
-                return f"{table_name}_{year}.db"
-            else:
-                return f"{table_name}_{year}.{output_format}"
+            return f"{table_name}_{year}{extension}"
         
         # Crear patrón base
         base_name = table_name.lower() if naming_config.get('lowercase_names', True) else table_name
@@ -476,10 +496,4 @@ class FileConverter:
             # Mantener solo letras, números, guiones y guiones bajos
             base_name = re.sub(r'[^a-zA-Z0-9_-]', '', base_name)
         
-        # Añadir extensión
-        if output_format == 'sqlite':
-            extension = 'db'
-        else:
-            extension = output_format
-            
-        return f"{base_name}.{extension}"
\ No newline at end of file
+        return f"{base_name}{extension}"
\ No newline at end of file
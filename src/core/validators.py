@@ -12,7 +12,7 @@ class DataValidator:
     
     SUPPORTED_FORMATS = {
         'input': ['.csv', '.xlsx', '.xls', '.json', '.accdb', '.mdb'],
-        'output': ['sql', 'sqlite', 'postgresql', 'supabase', 'csv', 'excel', 'json']
+        'output': ['sql', 'sqlite', 'postgresql', 'supabase', 'csv', 'excel', 'json', 'parquet']
     }
     
     def __init__(self):
@@ -6,6 +6,13 @@ import pandas as pd
 from typing import Dict, Any
 from src.utils.logger import get_logger
 
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    duckdb = None
+    DUCKDB_AVAILABLE = False
+
 class CSVReader:
     """Clase para leer archivos CSV"""
     
@@ -64,6 +71,88 @@ class CSVReader:
             self.logger.error(f"Error leyendo archivo CSV {file_path}: {str(e)}")
             raise
     
+    def _query_duckdb(self, query: str, params: list) -> pd.DataFrame:
+        """Ejecuta una consulta sobre el CSV con DuckDB (sin cargarlo en pandas)"""
+        with duckdb.connect() as con:
+            return con.execute(query, params).df()
+    
+    def count_rows(self, file_path: str) -> int:
+        """
+        Cuenta las filas de un CSV sin cargarlo completo
+        
+        Args:
+            file_path: Ruta del archivo CSV
+            
+        Returns:
+            Número de filas de datos
+        """
+        if DUCKDB_AVAILABLE:
+            try:
+                result = self._query_duckdb("SELECT COUNT(*) AS n FROM read_csv_auto(?)", [str(file_path)])
+                return int(result['n'].iloc[0])
+            except Exception as e:
+                self.logger.warning(f"Error contando filas con DuckDB: {str(e)}")
+        
+        return sum(len(chunk) for chunk in pd.read_csv(file_path, usecols=[0], chunksize=100000))
+    
+    def read_page(self, file_path: str, offset: int, limit: int) -> pd.DataFrame:
+        """
+        Lee una página de filas de un CSV
+        
+        Args:
+            file_path: Ruta del archivo CSV
+            offset: Filas a saltar desde el inicio
+            limit: Número máximo de filas de la página
+            
+        Returns:
+            DataFrame con las filas de la página
+        """
+        if DUCKDB_AVAILABLE:
+            try:
+                df = self._query_duckdb(
+                    "SELECT * FROM read_csv_auto(?) LIMIT ? OFFSET ?", [str(file_path), limit, offset]
+                )
+                df.index = range(offset, offset + len(df))
+                return df
+            except Exception as e:
+                self.logger.warning(f"Error leyendo página con DuckDB: {str(e)}")
+        
+        df = self.read(file_path, skiprows=range(1, offset + 1), nrows=limit)
+        df.index = range(offset, offset + len(df))
+        return df
+    
+    def top_values(self, file_path: str, column: str, limit: int = 10) -> pd.Series:
+        """
+        Valores más frecuentes de una columna en todo el archivo
+        
+        Args:
+            file_path: Ruta del archivo CSV
+            column: Nombre de la columna
+            limit: Número de valores a devolver
+            
+        Returns:
+            Serie con los conteos, indexada por valor y ordenada de mayor a menor
+        """
+        if DUCKDB_AVAILABLE:
+            try:
+                quoted = '"' + column.replace('"', '""') + '"'
+                result = self._query_duckdb(
+                    f"SELECT {quoted} AS valor, COUNT(*) AS n FROM read_csv_auto(?) "
+                    f"WHERE {quoted} IS NOT NULL GROUP BY 1 ORDER BY n DESC LIMIT ?",
+                    [str(file_path), limit]
+                )
+                return result.set_index('valor')['n']
+            except Exception as e:
+                self.logger.warning(f"Error agregando con DuckDB: {str(e)}")
+        
+        counts = None
+        for chunk in pd.read_csv(file_path, usecols=[column], chunksize=100000):
+            chunk_counts = chunk[column].value_counts()
+            counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0)
+        if counts is None:
+            return pd.Series(dtype='int64')
+        return counts.sort_values(ascending=False).head(limit).astype('int64')
+    
     def get_info(self, file_path: str) -> Dict[str, Any]:
         """
         Obtiene información del archivo CSV sin cargarlo completamente
@@ -52,6 +52,52 @@ class ExcelReader:
             self.logger.error(f"Error leyendo archivo Excel {file_path}: {str(e)}")
             raise
     
+    def count_rows(self, file_path: str, sheet_name: str = None) -> int:
+        """
+        Cuenta las filas de datos de una hoja sin construir el DataFrame
+        
+        En .xlsx se usa la dimensión que guarda la propia hoja (openpyxl en
+        modo solo lectura); si falta, se lee únicamente la primera columna.
+        
+        Args:
+            file_path: Ruta del archivo Excel
+            sheet_name: Nombre de la hoja (None para la primera)
+            
+        Returns:
+            Número de filas de datos (sin la cabecera)
+        """
+        if str(file_path).lower().endswith('.xlsx'):
+            try:
+                from openpyxl import load_workbook
+                workbook = load_workbook(file_path, read_only=True)
+                try:
+                    sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+                    if sheet.max_row is not None:
+                        return max(sheet.max_row - 1, 0)
+                finally:
+                    workbook.close()
+            except Exception as e:
+                self.logger.warning(f"Error leyendo dimensiones del Excel: {str(e)}")
+        
+        return len(pd.read_excel(file_path, sheet_name=sheet_name or 0, usecols=[0]))
+    
+    def read_page(self, file_path: str, offset: int, limit: int, sheet_name: str = None) -> pd.DataFrame:
+        """
+        Lee una página de filas de una hoja
+        
+        Args:
+            file_path: Ruta del archivo Excel
+            offset: Filas a saltar desde el inicio
+            limit: Número máximo de filas de la página
+            sheet_name: Nombre de la hoja (None para la primera)
+            
+        Returns:
+            DataFrame con las filas de la página
+        """
+        df = self.read(file_path, sheet_name, skiprows=range(1, offset + 1), nrows=limit)
+        df.index = range(offset, offset + len(df))
+        return df
+    
     def get_sheet_names(self, file_path: str) -> List[str]:
         """
         Obtiene la lista de nombres de hojas en el archivo Excel
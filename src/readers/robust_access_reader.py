@@ -4,30 +4,59 @@ Implementación mejorada con múltiples métodos de fallback
 """
 
 import pandas as pd
+import hashlib
+import json
 import os
 import platform
 import subprocess
-import tempfile
 import shutil
 import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Dict, Any, List, Optional, Union, Tuple
 from pathlib import Path
 from src.utils.logger import get_logger
 
+try:
+    import pyarrow.csv as pa_csv
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa_csv = None
+    ARROW_AVAILABLE = False
+
 class RobustAccessReader:
     """
     Reader robusto para archivos de Microsoft Access con múltiples métodos de fallback
     """
     
+    # Firmas en la cabecera (a partir del byte 4) de archivos .mdb (Jet) y .accdb (ACE)
+    ACCESS_SIGNATURES = (b"Standard Jet DB", b"Standard ACE DB")
+    
+    # Resúmenes de años persistidos entre reinicios (uno por archivo, ruta y fecha de modificación)
+    SUMMARY_CACHE_DIR = Path("data/cache/year_summary")
+    
+    # Tablas completas y tablas separadas por año que se conservan en memoria
+    # (la instancia se comparte entre sesiones; se descartan las menos usadas)
+    TABLE_CACHE_SIZE = 32
+    YEAR_CACHE_SIZE = 32
+    
     def __init__(self):
         self.logger = get_logger(__name__)
         self.system = platform.system().lower()
-        self._cache: Dict[Tuple[str, str], pd.DataFrame] = {}
-        self._year_cache: Dict[Tuple[str, str, int], pd.DataFrame] = {}
+        self._cache: 'OrderedDict[Tuple[str, str, float], pd.DataFrame]' = OrderedDict()
+        self._year_cache: 'OrderedDict[Tuple[str, str, float], Dict[int, pd.DataFrame]]' = OrderedDict()
+        self._year_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._summary_cache: Dict[Tuple[str, float, int], Dict[str, Any]] = {}
         self._cache_lock = threading.Lock()
         self._temp_dir = None
         self._access_support_checked = False
         self._access_supported = False
+        self._access_support_info: Optional[Dict[str, Any]] = None
+        self._mdbtools_available: Optional[bool] = None
+        # La instancia se comparte entre hilos: las comprobaciones del sistema se hacen una vez
+        self._probe_lock = threading.Lock()
+        # Conexiones ODBC abiertas por cada hilo (ver _odbc_connection)
+        self._odbc_local = threading.local()
     
     def read(self, file_path: str, table_name: Optional[str] = None) -> pd.DataFrame:
         """
@@ -48,14 +77,18 @@ class RobustAccessReader:
         if file_path.stat().st_size == 0:
             raise ValueError(f"El archivo está vacío: {file_path}")
         
+        if not self.has_access_signature(file_path):
+            raise ValueError(f"El archivo no es una base de datos Access válida: {file_path.name}")
+        
         self.logger.info(f"Leyendo archivo Access: {file_path.name} ({file_path.stat().st_size / 1024 / 1024:.2f} MB)")
         
-        # Caché por tabla para evitar re-lecturas costosas
+        # Caché por tabla para evitar re-lecturas costosas (invalidada si cambia el archivo)
         if table_name:
-            cache_key = (str(file_path.resolve()), str(table_name))
+            cache_key = (str(file_path.resolve()), str(table_name), file_path.stat().st_mtime)
             with self._cache_lock:
                 if cache_key in self._cache:
                     self.logger.debug(f"Usando caché para tabla '{table_name}'")
+                    self._cache.move_to_end(cache_key)
                     return self._cache[cache_key]
         
         # Intentar diferentes métodos en orden de preferencia
@@ -77,9 +110,13 @@ class RobustAccessReader:
                     self.logger.info(f"✅ Éxito con {method.__name__}: {len(df)} filas, {len(df.columns)} columnas")
                     # Guardar en caché si se especificó tabla
                     if table_name:
-                        cache_key = (str(file_path.resolve()), str(table_name))
                         with self._cache_lock:
+                            # Las versiones anteriores de la tabla (otra fecha de modificación) ya no sirven
+                            for stale_key in [key for key in self._cache if key[:2] == cache_key[:2]]:
+                                del self._cache[stale_key]
                             self._cache[cache_key] = df
+                            while len(self._cache) > self.TABLE_CACHE_SIZE:
+                                self._cache.popitem(last=False)
                     return df
                     
             except Exception as e:
@@ -117,16 +154,8 @@ class RobustAccessReader:
             if table_name not in tables:
                 raise ValueError(f"Tabla '{table_name}' no encontrada. Tablas disponibles: {tables}")
             
-            # Exportar tabla a CSV temporal
-            temp_csv = self._export_table_mdbtools(file_path, table_name)
-            
-            # Leer CSV
-            df = pd.read_csv(temp_csv, encoding='utf-8')
-            
-            # Limpiar archivo temporal
-            os.unlink(temp_csv)
-            
-            return df
+            # Leer la exportación directamente de la tubería, sin CSV temporal
+            return self._export_table_mdbtools(file_path, table_name)
             
         except Exception as e:
             self.logger.error(f"Error con mdb-tools: {str(e)}")
@@ -135,13 +164,8 @@ class RobustAccessReader:
     def _try_pyodbc(self, file_path: Path, table_name: Optional[str] = None) -> Optional[pd.DataFrame]:
         """Intenta usar pyodbc (método para Windows)"""
         try:
-            import pyodbc
-            
-            # Crear string de conexión
-            conn_str = f"Driver={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={file_path};"
-            
-            # Conectar
-            with pyodbc.connect(conn_str, timeout=30) as conn:
+            # Conectar (conexión del hilo reutilizada entre tablas del mismo archivo)
+            with self._odbc_connection(file_path) as conn:
                 # Obtener tablas si no se especifica
                 if not table_name:
                     cursor = conn.cursor()
@@ -162,6 +186,54 @@ class RobustAccessReader:
             self.logger.error(f"Error con pyodbc: {str(e)}")
             raise
     
+    @contextmanager
+    def _odbc_connection(self, file_path: Union[str, Path]):
+        """
+        Conexión ODBC al archivo Access, abierta una vez por hilo y archivo
+        
+        Abrir la base inicializa el motor Jet/ACE, que cuesta más que muchas
+        consultas pequeñas; la conexión se reutiliza entre tablas, vistas
+        previas y páginas. Las conexiones de pyodbc no se comparten entre
+        hilos, así que cada hilo guarda las suyas. Si el archivo cambia se
+        abre una nueva, y un error ODBC descarta la conexión.
+        
+        Args:
+            file_path: Ruta del archivo Access
+            
+        Yields:
+            Conexión pyodbc
+        """
+        import pyodbc
+        
+        file_path = Path(file_path)
+        file_key = str(file_path.resolve())
+        key = (file_key, file_path.stat().st_mtime)
+        connections = getattr(self._odbc_local, 'connections', None)
+        if connections is None:
+            connections = self._odbc_local.connections = {}
+        
+        conn = connections.get(key)
+        if conn is None:
+            # Cerrar las conexiones a versiones anteriores del mismo archivo
+            for old_key in [k for k in connections if k[0] == file_key]:
+                try:
+                    connections.pop(old_key).close()
+                except Exception:
+                    pass
+            conn_str = f"Driver={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={file_path};"
+            conn = pyodbc.connect(conn_str, timeout=30)
+            connections[key] = conn
+        
+        try:
+            yield conn
+        except pyodbc.Error:
+            connections.pop(key, None)
+            try:
+                conn.close()
+            except Exception:
+                pass
+            raise
+    
     def _try_sqlalchemy(self, file_path: Path, table_name: Optional[str] = None) -> Optional[pd.DataFrame]:
         """Intenta usar SQLAlchemy"""
         try:
@@ -196,30 +268,28 @@ class RobustAccessReader:
         )
     
     def check_access_support(self) -> Dict[str, Any]:
-        """Verifica si el sistema puede leer archivos Access"""
+        """Verifica si el sistema puede leer archivos Access (el resultado se guarda)"""
         if self._access_support_checked:
-            return {
-                'supported': self._access_supported,
-                'system': self.system,
-                'drivers_available': self._check_drivers(),
-                'supported_methods': self._get_supported_methods()
-            }
-        
-        self._access_support_checked = True
-        
-        # Verificar métodos disponibles
-        supported_methods = self._get_supported_methods()
+            return dict(self._access_support_info)
         
-        # Determinar si Access está soportado
-        self._access_supported = len(supported_methods) > 0
+        with self._probe_lock:
+            if not self._access_support_checked:
+                # Verificar métodos disponibles
+                supported_methods = self._get_supported_methods()
+                
+                # Determinar si Access está soportado
+                self._access_supported = len(supported_methods) > 0
+                
+                self._access_support_info = {
+                    'supported': self._access_supported,
+                    'system': self.system,
+                    'drivers_available': self._check_drivers(),
+                    'supported_methods': supported_methods,
+                    'error_message': self._get_error_message(supported_methods)
+                }
+                self._access_support_checked = True
         
-        return {
-            'supported': self._access_supported,
-            'system': self.system,
-            'drivers_available': self._check_drivers(),
-            'supported_methods': supported_methods,
-            'error_message': self._get_error_message(supported_methods)
-        }
+        return dict(self._access_support_info)
     
     def _get_supported_methods(self) -> List[str]:
         """Obtiene lista de métodos soportados"""
@@ -269,13 +339,15 @@ class RobustAccessReader:
             return []
     
     def _check_mdbtools(self) -> bool:
-        """Verifica si mdb-tools está instalado"""
-        try:
-            result = subprocess.run(['mdb-tables', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            return False
+        """Verifica si mdb-tools está instalado (se comprueba una sola vez)"""
+        if self._mdbtools_available is None:
+            try:
+                result = subprocess.run(['mdb-tables', '--version'], 
+                                      capture_output=True, text=True, timeout=5)
+                self._mdbtools_available = result.returncode == 0
+            except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+                self._mdbtools_available = False
+        return self._mdbtools_available
     
     def _list_tables_mdbtools(self, file_path: Path) -> List[str]:
         """Lista las tablas usando mdb-tools"""
@@ -289,32 +361,52 @@ class RobustAccessReader:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Error listando tablas: {e.stderr}")
     
-    def _export_table_mdbtools(self, file_path: Path, table_name: str) -> str:
-        """Exporta una tabla a CSV usando mdb-tools"""
+    def _export_table_mdbtools(self, file_path: Path, table_name: str) -> pd.DataFrame:
+        """Exporta una tabla con mdb-tools y la lee desde stdout"""
+        process = subprocess.Popen(
+            ['mdb-export', str(file_path), table_name],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8'
+        )
         try:
-            # Crear archivo temporal
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.csv')
-            os.close(temp_fd)
-            
-            # Exportar tabla
-            result = subprocess.run(
-                ['mdb-export', str(file_path), table_name],
-                capture_output=True, text=True, check=True, timeout=60
-            )
-            
-            # Escribir a archivo temporal
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(result.stdout)
-            
-            return temp_path
+            df = pd.read_csv(process.stdout)
+        except pd.errors.EmptyDataError:
+            df = pd.DataFrame()
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.wait(timeout=60)
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"Error exportando tabla {table_name}: {stderr}")
+        return df
+    
+    @classmethod
+    def has_access_signature(cls, file_path: Union[str, Path]) -> bool:
+        """
+        Comprueba la firma Jet/ACE de la cabecera sin abrir la base de datos
+        
+        Args:
+            file_path: Ruta del archivo
             
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Error exportando tabla {table_name}: {e.stderr}")
+        Returns:
+            True si la cabecera corresponde a un archivo Access
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                header = f.read(19)
+        except OSError:
+            return False
+        return header[4:19] in cls.ACCESS_SIGNATURES
     
     def get_table_names(self, file_path: str) -> List[str]:
         """Obtiene la lista de tablas disponibles"""
         file_path = Path(file_path)
         
+        # Evitar lanzar mdb-tables/pyodbc sobre archivos que no son Access
+        if not self.has_access_signature(file_path):
+            self.logger.error(f"El archivo no es una base de datos Access válida: {file_path.name}")
+            return []
+        
         # Intentar con mdb-tools primero (más confiable)
         if self._check_mdbtools():
             try:
@@ -327,9 +419,7 @@ class RobustAccessReader:
         
         # Intentar con pyodbc como fallback
         try:
-            import pyodbc
-            conn_str = f"Driver={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={file_path};"
-            with pyodbc.connect(conn_str, timeout=30) as conn:
+            with self._odbc_connection(file_path) as conn:
                 cursor = conn.cursor()
                 tables = [table.table_name for table in cursor.tables(tableType='TABLE')]
                 if tables:
@@ -341,6 +431,248 @@ class RobustAccessReader:
         self.logger.error("No se pudieron detectar tablas")
         return []
     
+    def _get_cached_table(self, file_path: Path, table_name: str) -> Optional[pd.DataFrame]:
+        """Devuelve la tabla si ya fue leída completa por read()"""
+        cache_key = (str(file_path.resolve()), str(table_name), file_path.stat().st_mtime)
+        with self._cache_lock:
+            df = self._cache.get(cache_key)
+            if df is not None:
+                self._cache.move_to_end(cache_key)
+            return df
+    
+    def read_arrow(self, file_path: str, table_name: str) -> pd.DataFrame:
+        """
+        Lee una tabla completa con tipos respaldados por Arrow
+        
+        Con mdb-tools la exportación se analiza directamente con el lector CSV
+        de pyarrow, sin pasar por columnas 'object' de pandas.
+        
+        Args:
+            file_path: Ruta del archivo Access
+            table_name: Nombre de la tabla
+            
+        Returns:
+            DataFrame con dtypes pd.ArrowDtype
+        """
+        if not ARROW_AVAILABLE:
+            raise RuntimeError("pyarrow no está instalado")
+        
+        file_path = Path(file_path)
+        
+        if self.has_access_signature(file_path) and self._check_mdbtools():
+            process = subprocess.Popen(
+                ['mdb-export', str(file_path), table_name],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            try:
+                table = pa_csv.read_csv(process.stdout)
+                if process.wait() == 0:
+                    return table.to_pandas(types_mapper=pd.ArrowDtype)
+            except Exception as e:
+                self.logger.warning(f"Error leyendo {table_name} con pyarrow: {str(e)}")
+            finally:
+                process.kill()
+                process.wait()
+        
+        # Resto de métodos: lectura normal y conversión de tipos
+        return self.read(file_path, table_name).convert_dtypes(dtype_backend="pyarrow")
+    
+    def read_preview(
+        self,
+        file_path: str,
+        table_name: str,
+        limit: int = 100,
+        dtype_backend: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Lee solo las primeras filas de una tabla (para vistas previas)
+        
+        Con mdb-tools se corta la exportación al llegar a 'limit' filas, en
+        lugar de exportar y cargar la tabla completa.
+        
+        Args:
+            file_path: Ruta del archivo Access
+            table_name: Nombre de la tabla
+            limit: Número máximo de filas
+            dtype_backend: 'pyarrow' o 'numpy_nullable' para tipos no-object (None: por defecto)
+            
+        Returns:
+            DataFrame con las primeras filas
+        """
+        file_path = Path(file_path)
+        # read_csv/read_sql no aceptan dtype_backend=None
+        backend_kwargs = {'dtype_backend': dtype_backend} if dtype_backend else {}
+        
+        cached = self._get_cached_table(file_path, table_name)
+        if cached is not None:
+            preview = cached.head(limit)
+            return preview.convert_dtypes(**backend_kwargs) if dtype_backend else preview
+        
+        if self._check_mdbtools():
+            process = subprocess.Popen(
+                ['mdb-export', str(file_path), table_name],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding='utf-8'
+            )
+            try:
+                return pd.read_csv(process.stdout, nrows=limit, **backend_kwargs)
+            except pd.errors.EmptyDataError:
+                return pd.DataFrame()
+            except Exception as e:
+                self.logger.warning(f"Error con mdb-tools en vista previa de {table_name}: {str(e)}")
+            finally:
+                process.kill()
+                process.wait()
+        
+        try:
+            with self._odbc_connection(file_path) as conn:
+                return pd.read_sql(f"SELECT TOP {int(limit)} * FROM [{table_name}]", conn, **backend_kwargs)
+        except Exception as e:
+            self.logger.warning(f"Error con pyodbc en vista previa de {table_name}: {str(e)}")
+        
+        # Último recurso: lectura completa
+        preview = self.read(file_path, table_name).head(limit)
+        return preview.convert_dtypes(**backend_kwargs) if dtype_backend else preview
+    
+    def read_page(self, file_path: str, table_name: str, offset: int, limit: int) -> pd.DataFrame:
+        """
+        Lee una página de filas de una tabla sin cargarla completa en memoria
+        
+        Con mdb-tools se recorre la exportación saltando las primeras 'offset'
+        filas y se corta al completar la página.
+        
+        Args:
+            file_path: Ruta del archivo Access
+            table_name: Nombre de la tabla
+            offset: Filas a saltar desde el inicio
+            limit: Número máximo de filas de la página
+            
+        Returns:
+            DataFrame con las filas de la página
+        """
+        file_path = Path(file_path)
+        
+        cached = self._get_cached_table(file_path, table_name)
+        if cached is not None:
+            return cached.iloc[offset:offset + limit]
+        
+        if self._check_mdbtools():
+            process = subprocess.Popen(
+                ['mdb-export', str(file_path), table_name],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding='utf-8'
+            )
+            try:
+                df = pd.read_csv(process.stdout, skiprows=range(1, offset + 1), nrows=limit)
+                df.index = range(offset, offset + len(df))
+                return df
+            except pd.errors.EmptyDataError:
+                return pd.DataFrame()
+            except Exception as e:
+                self.logger.warning(f"Error con mdb-tools leyendo página de {table_name}: {str(e)}")
+            finally:
+                process.kill()
+                process.wait()
+        
+        try:
+            with self._odbc_connection(file_path) as conn:
+                # Access SQL no tiene OFFSET: se saltan filas en el cursor
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT * FROM [{table_name}]")
+                if offset:
+                    cursor.skip(offset)
+                rows = cursor.fetchmany(limit)
+                columns = [column[0] for column in cursor.description]
+                return pd.DataFrame.from_records(
+                    rows, columns=columns, index=range(offset, offset + len(rows))
+                )
+        except Exception as e:
+            self.logger.warning(f"Error con pyodbc leyendo página de {table_name}: {str(e)}")
+        
+        # Último recurso: lectura completa
+        return self.read(file_path, table_name).iloc[offset:offset + limit]
+    
+    def count_rows(self, file_path: str, table_name: str) -> int:
+        """
+        Cuenta las filas de una tabla sin cargarla completa en memoria
+        
+        Args:
+            file_path: Ruta del archivo Access
+            table_name: Nombre de la tabla
+            
+        Returns:
+            Número de filas
+        """
+        file_path = Path(file_path)
+        
+        cached = self._get_cached_table(file_path, table_name)
+        if cached is not None:
+            return len(cached)
+        
+        if self._check_mdbtools():
+            # mdb-count existe desde mdbtools 0.9
+            if shutil.which('mdb-count'):
+                try:
+                    result = subprocess.run(
+                        ['mdb-count', str(file_path), table_name],
+                        capture_output=True, text=True, check=True, timeout=60
+                    )
+                    return int(result.stdout.strip())
+                except (subprocess.SubprocessError, ValueError) as e:
+                    self.logger.warning(f"Error con mdb-count en {table_name}: {str(e)}")
+            
+            # Contar recorriendo la exportación por bloques (memoria constante)
+            process = subprocess.Popen(
+                ['mdb-export', str(file_path), table_name],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding='utf-8'
+            )
+            try:
+                return sum(len(chunk) for chunk in pd.read_csv(process.stdout, chunksize=50000))
+            except pd.errors.EmptyDataError:
+                return 0
+            except Exception as e:
+                self.logger.warning(f"Error con mdb-tools contando {table_name}: {str(e)}")
+            finally:
+                process.kill()
+                process.wait()
+        
+        try:
+            with self._odbc_connection(file_path) as conn:
+                return int(conn.cursor().execute(f"SELECT COUNT(*) FROM [{table_name}]").fetchone()[0])
+        except Exception as e:
+            self.logger.warning(f"Error con pyodbc contando {table_name}: {str(e)}")
+        
+        # Último recurso: lectura completa
+        return len(self.read(file_path, table_name))
+
+    def get_table_metadata(
+        self,
+        file_path: str,
+        table_name: str,
+        sample_rows: int = 3,
+        dtype_backend: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Obtiene filas, columnas y tipos de una tabla sin materializarla
+
+        Combina un conteo (COUNT(*) / mdb-count) con una lectura de las
+        primeras 'sample_rows' filas, de la que se deducen columnas y tipos.
+
+        Args:
+            file_path: Ruta del archivo Access
+            table_name: Nombre de la tabla
+            sample_rows: Filas a conservar como muestra
+            dtype_backend: Backend de tipos de la muestra (ver read_preview)
+
+        Returns:
+            Dict con 'row_count', 'columns', 'dtypes' y 'sample'
+        """
+        sample = self.read_preview(file_path, table_name, sample_rows, dtype_backend)
+        return {
+            'row_count': self.count_rows(file_path, table_name),
+            'columns': list(sample.columns),
+            'dtypes': {str(column): str(dtype) for column, dtype in sample.dtypes.items()},
+            'sample': sample
+        }
+
     def get_info(self, file_path: str) -> Dict[str, Any]:
         """Obtiene información detallada del archivo Access"""
         file_path = Path(file_path)
@@ -436,10 +768,28 @@ class RobustAccessReader:
             Dict con información de años por tabla
         """
         file_path = Path(file_path)
+        file_stat = file_path.stat()
+        
+        # Caché del resumen: se invalida si el archivo cambia
+        summary_key = (str(file_path.resolve()), file_stat.st_mtime, file_stat.st_size)
+        with self._cache_lock:
+            cached = self._summary_cache.get(summary_key)
+        if cached is not None:
+            self.logger.debug(f"Usando caché de resumen de años para {file_path.name}")
+            return cached
+        
+        # Resumen guardado en disco por una ejecución anterior: evita releer todas las tablas
+        cache_path = self._summary_cache_path(summary_key)
+        cached = self._load_cached_summary(cache_path)
+        if cached is not None:
+            self.logger.info(f"Usando resumen de años guardado para {file_path.name}")
+            with self._cache_lock:
+                self._summary_cache[summary_key] = cached
+            return cached
         
         summary = {
             'file_path': str(file_path),
-            'file_size_mb': file_path.stat().st_size / (1024 * 1024),
+            'file_size_mb': file_stat.st_size / (1024 * 1024),
             'tables': {}
         }
         
@@ -493,13 +843,53 @@ class RobustAccessReader:
         except Exception as e:
             self.logger.error(f"Error obteniendo resumen de años: {str(e)}")
             summary['error'] = str(e)
+            return summary
+        
+        with self._cache_lock:
+            self._summary_cache[summary_key] = summary
+        
+        # Solo se persisten resúmenes completos (un error puede ser transitorio)
+        if not any('error' in info for info in summary['tables'].values()):
+            self._save_cached_summary(cache_path, summary)
         
         return summary
     
+    def _summary_cache_path(self, summary_key: Tuple[str, float, int]) -> Path:
+        """Archivo del resumen en disco para una ruta, fecha de modificación y tamaño"""
+        digest = hashlib.sha1(repr(summary_key).encode('utf-8')).hexdigest()
+        return self.SUMMARY_CACHE_DIR / f"{digest}.json"
+    
+    def _load_cached_summary(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Carga un resumen guardado (None si no existe o no se puede leer)"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Resumen de años en caché ilegible ({cache_path.name}): {str(e)}")
+            return None
+    
+    def _save_cached_summary(self, cache_path: Path, summary: Dict[str, Any]):
+        """Guarda un resumen en disco; un fallo solo se registra"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                # Los años llegan como enteros de numpy
+                json.dump(summary, f, ensure_ascii=False, default=int)
+            os.replace(temp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"No se pudo guardar el resumen de años: {str(e)}")
+    
     def read_in_chunks(self, file_path: str, table_name: str, chunk_size: int = 10000):
         """
         Lee un archivo Access en chunks para optimizar el uso de memoria
         
+        Con mdb-tools la exportación se lee de la tubería por bloques, así que
+        nunca hay más de 'chunk_size' filas en memoria. Si la tabla ya está en
+        caché, o solo hay otros métodos, se trocea la tabla completa.
+        
         Args:
             file_path: Ruta al archivo Access
             table_name: Nombre de la tabla a leer
@@ -508,34 +898,43 @@ class RobustAccessReader:
         Yields:
             DataFrame: Chunks del archivo
         """
-        try:
-            from typing import Iterator
-            import gc
-            # Para archivos grandes, usar procesamiento por chunks
-            file_path = Path(file_path)
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
-            
-            self.logger.info(f"Procesando archivo de {file_size_mb:.1f}MB en chunks de {chunk_size} filas")
-            
-            # Leer tabla completa primero (necesario para Access)
-            df = self.read(file_path, table_name)
-            
-            # Procesar en chunks
-            total_rows = len(df)
-            for start_idx in range(0, total_rows, chunk_size):
-                end_idx = min(start_idx + chunk_size, total_rows)
-                chunk = df.iloc[start_idx:end_idx].copy()
-                
-                self.logger.debug(f"Procesando chunk {start_idx//chunk_size + 1}: filas {start_idx}-{end_idx}")
-                yield chunk
-                
-                # Liberar memoria explícitamente
-                del chunk
-                gc.collect()
-                
-        except Exception as e:
-            self.logger.error(f"Error procesando archivo en chunks: {str(e)}")
-            raise
+        file_path = Path(file_path)
+        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        self.logger.info(f"Procesando archivo de {file_size_mb:.1f}MB en chunks de {chunk_size} filas")
+        
+        cached = self._get_cached_table(file_path, table_name)
+        if cached is None and self._check_mdbtools():
+            process = subprocess.Popen(
+                ['mdb-export', str(file_path), table_name],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding='utf-8'
+            )
+            yielded = finished = False
+            try:
+                for chunk in pd.read_csv(process.stdout, chunksize=chunk_size):
+                    yielded = True
+                    yield chunk
+                finished = True
+            except pd.errors.EmptyDataError:
+                finished = True
+            except Exception as e:
+                if yielded:
+                    raise
+                self.logger.warning(f"Error con mdb-tools leyendo {table_name} en chunks: {str(e)}")
+            finally:
+                # Si el consumidor cortó antes del final, no esperar al resto de la exportación
+                if not finished:
+                    process.kill()
+                process.stdout.close()
+                process.wait()
+            if process.returncode == 0:
+                return
+            if yielded:
+                raise RuntimeError(f"mdb-export terminó con error exportando la tabla {table_name}")
+        
+        # Sin lectura por tubería: trocear la tabla completa
+        df = cached if cached is not None else self.read(file_path, table_name)
+        for start_idx in range(0, len(df), chunk_size):
+            yield df.iloc[start_idx:start_idx + chunk_size]
 
     def read_by_year_chunked(self, file_path: str, table_name: str, year: int, chunk_size: int = 10000):
         """
@@ -587,28 +986,40 @@ class RobustAccessReader:
         except Exception as e:
             self.logger.error(f"Error procesando año {year} por chunks: {str(e)}")
             raise
-    def read_by_year(self, file_path: str, table_name: str, year: int) -> pd.DataFrame:
+    def read_all_years(self, file_path: str, table_name: str) -> Dict[int, pd.DataFrame]:
         """
-        Lee datos de una tabla específica filtrados por año
+        Lee una tabla una sola vez y la separa por año
+        
+        El resultado se guarda en caché por archivo, tabla y fecha de
+        modificación (como mucho YEAR_CACHE_SIZE tablas). Los hilos que piden
+        la misma tabla a la vez esperan a la primera lectura en lugar de
+        exportarla cada uno.
         
         Args:
             file_path: Ruta del archivo Access
             table_name: Nombre de la tabla
-            year: Año a filtrar
             
         Returns:
-            DataFrame filtrado por año
+            Dict {año: DataFrame con las filas de ese año}
         """
-        try:
-            file_key = str(Path(file_path).resolve())
-            year_key = (file_key, str(table_name), int(year))
-            # Caché por año
+        file_path = Path(file_path)
+        file_key = str(file_path.resolve())
+        groups_key = (file_key, str(table_name), file_path.stat().st_mtime)
+        
+        with self._cache_lock:
+            groups = self._year_cache.get(groups_key)
+            if groups is not None:
+                self._year_cache.move_to_end(groups_key)
+                return groups
+            table_lock = self._year_locks.setdefault((file_key, str(table_name)), threading.Lock())
+        
+        with table_lock:
+            # Otro hilo pudo terminar la lectura mientras se esperaba
             with self._cache_lock:
-                cached = self._year_cache.get(year_key)
-            if cached is not None:
-                self.logger.debug(f"Usando caché para {table_name} año {year}")
-                return cached
-
+                groups = self._year_cache.get(groups_key)
+            if groups is not None:
+                return groups
+            
             # Leer tabla completa (usará caché de tabla si existe)
             df = self.read(file_path, table_name)
             
@@ -618,15 +1029,58 @@ class RobustAccessReader:
             if not year_column:
                 raise ValueError(f"No se encontró columna de año en la tabla {table_name}")
             
-            # Filtrar por año
-            filtered_df = df[df[year_column] == year].copy()
-            
-            if filtered_df.empty:
-                self.logger.warning(f"No se encontraron datos para el año {year} en la tabla {table_name}")
+            # Una sola pasada sobre la tabla para todos los años, con la misma
+            # conversión numérica que el resumen (sus años coinciden con los grupos)
+            years = pd.to_numeric(df[year_column], errors='coerce')
+            valid = years.notna()
+            groups = {
+                int(year): group
+                for year, group in df[valid].groupby(years[valid].astype(int), sort=False)
+            }
             
-            # Guardar en caché por año
             with self._cache_lock:
-                self._year_cache[year_key] = filtered_df
+                self._year_cache[groups_key] = groups
+                while len(self._year_cache) > self.YEAR_CACHE_SIZE:
+                    self._year_cache.popitem(last=False)
+            
+            return groups
+    
+    def evict_table(self, file_path: str, table_name: str):
+        """
+        Descarta de memoria una tabla (completa y separada por años)
+        
+        Para cuando el llamador ya no la necesita, p. ej. tras subir todos
+        sus años: la caché no retiene cada tabla grande por duplicado.
+        
+        Args:
+            file_path: Ruta del archivo Access
+            table_name: Nombre de la tabla
+        """
+        table_prefix = (str(Path(file_path).resolve()), str(table_name))
+        with self._cache_lock:
+            for cache in (self._cache, self._year_cache):
+                for key in [key for key in cache if key[:2] == table_prefix]:
+                    del cache[key]
+    
+    def read_by_year(self, file_path: str, table_name: str, year: int) -> pd.DataFrame:
+        """
+        Lee datos de una tabla específica filtrados por año
+        
+        Args:
+            file_path: Ruta del archivo Access
+            table_name: Nombre de la tabla
+            year: Año a filtrar
+            
+        Returns:
+            DataFrame filtrado por año
+        """
+        try:
+            filtered_df = self.read_all_years(file_path, table_name).get(int(year))
+            
+            if filtered_df is None:
+                self.logger.warning(f"No se encontraron datos para el año {year} en la tabla {table_name}")
+                # Mismas columnas que la tabla (ya en caché), sin filas
+                return self.read(file_path, table_name).iloc[0:0].copy()
             
             return filtered_df
             
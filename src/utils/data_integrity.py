@@ -2,6 +2,7 @@
 Verificador de integridad de datos
 """
 
+import csv
 import pandas as pd
 from typing import Dict, Any, List, Optional, Tuple
 from src.utils.logger import get_logger
@@ -73,16 +74,17 @@ class DataIntegrityChecker:
             Dict con estadísticas
         """
         try:
+            null_counts = df.isnull().sum()
             return {
                 'label': label,
                 'rows': len(df),
                 'columns': len(df.columns),
                 'column_names': list(df.columns),
                 'dtypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
-                'null_counts': df.isnull().sum().to_dict(),
+                'null_counts': null_counts.to_dict(),
                 'memory_usage_mb': round(df.memory_usage(deep=True).sum() / 1024 / 1024, 2),
                 'duplicate_rows': df.duplicated().sum(),
-                'empty_cells': df.isnull().sum().sum()
+                'empty_cells': null_counts.sum()
             }
         except Exception as e:
             self.logger.error(f"Error obteniendo estadísticas: {str(e)}")
@@ -121,8 +123,11 @@ class DataIntegrityChecker:
                     'details': f'Se encontraron {len(duplicate_columns)} columnas con nombres duplicados'
                 })
             
+            # Máscara de nulos calculada una vez para todas las verificaciones
+            null_mask = df.isnull()
+            
             # Verificar columnas completamente vacías
-            empty_columns = df.columns[df.isnull().all()].tolist()
+            empty_columns = df.columns[null_mask.all()].tolist()
             if empty_columns:
                 issues.append({
                     'type': 'empty_columns',
@@ -132,7 +137,7 @@ class DataIntegrityChecker:
                 })
             
             # Verificar filas completamente vacías
-            empty_rows = df.isnull().all(axis=1).sum()
+            empty_rows = null_mask.all(axis=1).sum()
             if empty_rows > 0:
                 issues.append({
                     'type': 'empty_rows',
@@ -152,7 +157,7 @@ class DataIntegrityChecker:
                 })
             
             # Verificar porcentaje alto de valores nulos
-            null_percentages = (df.isnull().sum() / len(df) * 100)
+            null_percentages = null_mask.mean() * 100
             high_null_columns = null_percentages[null_percentages > 50].index.tolist()
             if high_null_columns:
                 issues.append({
@@ -191,7 +196,7 @@ class DataIntegrityChecker:
                     # Verificar si hay mezcla de números y texto
                     non_null_values = df[col].dropna()
                     if not non_null_values.empty:
-                        numeric_count = sum(pd.to_numeric(non_null_values, errors='coerce').notna())
+                        numeric_count = pd.to_numeric(non_null_values, errors='coerce').notna().sum()
                         total_count = len(non_null_values)
                         
                         # Si hay mezcla significativa (ni todo numérico ni todo texto)
@@ -267,6 +272,106 @@ class DataIntegrityChecker:
         
         return issues
     
+    def verify_export_integrity(
+        self,
+        df: pd.DataFrame,
+        file_path: str,
+        file_format: str,
+        deep_verify: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Verifica que un archivo exportado conserve las filas y columnas del DataFrame
+        
+        Por defecto solo se leen las dimensiones del archivo: el CSV se recorre
+        con el lector csv (sin inferir tipos ni construir un DataFrame), del
+        Excel se toma la dimensión de la hoja en modo solo lectura y del
+        Parquet los metadatos del pie del archivo. Con
+        deep_verify se recarga el archivo completo y se comparan los DataFrames.
+        
+        Args:
+            df: DataFrame que se exportó
+            file_path: Ruta del archivo exportado
+            file_format: 'csv', 'excel' o 'parquet'
+            deep_verify: Recargar el archivo completo para compararlo
+            
+        Returns:
+            Dict con filas/columnas originales y exportadas, diferencias y si pasó la verificación
+        """
+        report = {
+            'file_path': file_path,
+            'original_rows': len(df),
+            'original_columns': len(df.columns),
+            'exported_rows': None,
+            'exported_columns': None,
+            'differences': [],
+            'integrity_passed': False
+        }
+        
+        try:
+            if deep_verify:
+                if file_format == 'csv':
+                    exported_df = pd.read_csv(file_path)
+                elif file_format == 'parquet':
+                    exported_df = pd.read_parquet(file_path)
+                else:
+                    exported_df = pd.read_excel(file_path)
+                report['exported_rows'] = len(exported_df)
+                report['exported_columns'] = len(exported_df.columns)
+                report['differences'] = [
+                    issue['message'] for issue in self._compare_dataframes(df, exported_df)
+                ]
+            else:
+                report['exported_rows'], report['exported_columns'] = self._get_file_dimensions(
+                    file_path, file_format
+                )
+                if report['exported_rows'] != report['original_rows']:
+                    report['differences'].append(
+                        f"Diferencia en número de filas: {report['original_rows']} vs {report['exported_rows']}"
+                    )
+                if report['exported_columns'] != report['original_columns']:
+                    report['differences'].append(
+                        f"Diferencia en número de columnas: {report['original_columns']} vs {report['exported_columns']}"
+                    )
+        except Exception as e:
+            self.logger.error(f"Error verificando exportación {file_path}: {str(e)}")
+            report['differences'].append(f"No se pudo verificar el archivo: {str(e)}")
+            return report
+        
+        report['integrity_passed'] = not report['differences']
+        return report
+    
+    def _get_file_dimensions(self, file_path: str, file_format: str) -> Tuple[int, int]:
+        """
+        Filas de datos y columnas de un archivo exportado, sin construir un DataFrame
+        
+        Args:
+            file_path: Ruta del archivo
+            file_format: 'csv', 'excel' o 'parquet'
+            
+        Returns:
+            Tupla (filas sin la cabecera, columnas)
+        """
+        if file_format == 'parquet':
+            # Los metadatos del pie del archivo ya guardan filas y columnas
+            import pyarrow.parquet as pq
+            metadata = pq.read_metadata(file_path)
+            return metadata.num_rows, metadata.num_columns
+        
+        if file_format == 'csv':
+            # csv.reader respeta los saltos de línea dentro de campos entre comillas
+            with open(file_path, newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                return sum(1 for _ in reader), len(header)
+        
+        from openpyxl import load_workbook
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            sheet = workbook.worksheets[0]
+            return max((sheet.max_row or 1) - 1, 0), sheet.max_column or 0
+        finally:
+            workbook.close()
+    
     def generate_report_summary(self, report: Dict[str, Any]) -> str:
         """
         Genera un resumen legible del reporte de integridad
@@ -8,5 +8,6 @@ from .supabase_writer import SupabaseWriter
 from .csv_writer import CSVWriter
 from .excel_writer import ExcelWriter
 from .json_writer import JSONWriter
+from .parquet_writer import ParquetWriter
 
-__all__ = ['SQLWriter', 'SQLiteWriter', 'SupabaseWriter', 'CSVWriter', 'ExcelWriter', 'JSONWriter'] 
\ No newline at end of file
+__all__ = ['SQLWriter', 'SQLiteWriter', 'SupabaseWriter', 'CSVWriter', 'ExcelWriter', 'JSONWriter', 'ParquetWriter'] 
\ No newline at end of file
@@ -2,16 +2,55 @@
 Escritor de archivos MySQL
 """
 
+import io
+import os
+import re
+import tempfile
+import time
+from contextlib import contextmanager
 import pandas as pd
 import mysql.connector
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import sqlalchemy
 from sqlalchemy import create_engine, text
 from src.utils.logger import get_logger
 
+# Delimitadores que cambian el estado al separar sentencias SQL
+_SQL_CODE_STOP = re.compile(r"[;'\"`#]|--(?=\s)")
+# Cuerpo de una cadena hasta su comilla de cierre, en un solo match (bucle "unrolled",
+# sin retroceso): los escapes con '\\' se consumen dentro del propio patrón
+_SQL_QUOTE_BODY = {
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*", re.DOTALL),
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL),
+    '`': re.compile(r"[^`]*")
+}
+
 class MySQLWriter:
     """Clase para escribir datos a una base de datos MySQL"""
     
+    # Tabla auxiliar con conteos exactos de filas por tabla
+    TABLE_STATS_TABLE = '_table_stats'
+    
+    # Errores que indican LOAD DATA LOCAL deshabilitado (servidor o cliente)
+    _LOCAL_INFILE_DISABLED_ERRNOS = {1148, 2068, 3948}
+    
+    # Hosts que apuntan a la propia máquina (sin compresión del protocolo por defecto)
+    LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '::1'})
+    
+    # Nombre provisional en las plantillas CREATE TABLE memoizadas
+    _SCHEMA_NAME_PLACEHOLDER = '__schema_table__'
+    
+    # Filas por INSERT multi-valor cuando LOAD DATA no está disponible
+    # (configurable con 'batch_size'; se limita por el máximo de parámetros)
+    FALLBACK_INSERT_CHUNKSIZE = 5000
+    
+    # Filas preparadas y pasadas a to_sql de una vez en write()
+    WRITE_BLOCK_ROWS = 100000
+    
+    # Máximo de parámetros por sentencia preparada en el protocolo MySQL
+    MAX_STATEMENT_PARAMS = 65535
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Inicializa el escritor MySQL
@@ -22,6 +61,14 @@ class MySQLWriter:
         self.logger = get_logger(__name__)
         self.config = config
         self.engine = None
+        # Sentencias COUNT(*) compiladas, una por tabla validada
+        self._count_statements: Dict[str, Any] = {}
+        # CREATE TABLE por esquema (columnas y dtypes), con el nombre como marcador
+        self._create_table_templates: Dict[Tuple[Tuple[str, str], ...], str] = {}
+        # False cuando el servidor rechazó LOAD DATA LOCAL: se va directo a INSERT por lotes
+        self._local_infile_supported = True
+        # Última prueba de conexión exitosa: (instante monotónico, resultado)
+        self._last_connection_check: Optional[tuple] = None
         self._create_engine()
     
     def _create_engine(self):
@@ -39,15 +86,21 @@ class MySQLWriter:
             connect_args = {
                 'charset': self.config.get('charset', 'utf8mb4'),
                 'connect_timeout': self.config.get('connect_timeout', 30),
-                'autocommit': self.config.get('autocommit', True)
+                'autocommit': self.config.get('autocommit', True),
+                **self._driver_options()
             }
             
             if self.config.get('ssl_disabled', True):
                 connect_args['ssl_disabled'] = True
             
+            # Pool de conexiones: permite consultas concurrentes reutilizando conexiones
             self.engine = create_engine(
                 connection_url,
                 connect_args=connect_args,
+                pool_size=self.config.get('pool_size', 8),
+                max_overflow=self.config.get('max_overflow', 0),
+                pool_pre_ping=True,
+                pool_recycle=self.config.get('pool_recycle', 1800),
                 echo=False
             )
             
@@ -57,24 +110,35 @@ class MySQLWriter:
             self.logger.error(f"Error creando engine MySQL: {str(e)}")
             raise
     
-    def test_connection(self) -> Dict[str, Any]:
+    def test_connection(self, max_age: Optional[float] = None) -> Dict[str, Any]:
         """
         Prueba la conexión a MySQL
         
+        Args:
+            max_age: Segundos durante los que se reutiliza la última prueba exitosa
+                (None para probar siempre)
+        
         Returns:
             Dict con resultado de la prueba
         """
+        if max_age is not None and self._last_connection_check is not None:
+            checked_at, last_result = self._last_connection_check
+            if time.monotonic() - checked_at < max_age:
+                return last_result
+        
         try:
             with self.engine.connect() as connection:
                 result = connection.execute(text("SELECT 1 as test"))
                 row = result.fetchone()
                 
                 if row and row[0] == 1:
-                    return {
+                    test_result = {
                         'success': True,
                         'message': 'Conexión exitosa a MySQL',
                         'server_info': self._get_server_info(connection)
                     }
+                    self._last_connection_check = (time.monotonic(), test_result)
+                    return test_result
                 else:
                     return {
                         'success': False,
@@ -119,8 +183,9 @@ class MySQLWriter:
         Args:
             df: DataFrame a escribir
             table_name: Nombre de la tabla
-            if_exists: Qué hacer si la tabla existe ('fail', 'replace', 'append')
-            **kwargs: Argumentos adicionales
+            if_exists: Qué hacer si la tabla existe ('fail', 'replace', 'append',
+                'truncate'; 'swap' se trata como 'replace')
+            **kwargs: Argumentos adicionales (chunksize: filas por INSERT)
         
         Returns:
             Dict con información del resultado
@@ -135,32 +200,63 @@ class MySQLWriter:
             # Limpiar nombre de tabla
             clean_table_name = self._clean_table_name(table_name)
             
-            # Preparar DataFrame para MySQL
-            df_prepared = self._prepare_dataframe(df)
-            
-            # Escribir a MySQL usando pandas
-            rows_written = df_prepared.to_sql(
-                name=clean_table_name,
-                con=self.engine,
-                if_exists=if_exists,
-                index=False,
-                method='multi',
-                chunksize=kwargs.get('chunksize', 1000)
-            )
+            # Escribir a MySQL usando pandas: la tabla primero, en su propia transacción
+            # (el DDL confirma por sí mismo), y luego todos los INSERT en la transacción
+            # de engine.begin(), con un único COMMIT al salir en lugar de uno por lote.
+            # Cada bloque se prepara y se pasa a to_sql por separado: pandas convierte a
+            # objetos Python solo las filas del bloque, no el DataFrame completo
+            chunksize = self._insert_chunksize(len(df.columns), kwargs.get('chunksize'))
+            block_rows = max(chunksize, self.WRITE_BLOCK_ROWS)
+            first_block = self._prepare_dataframe(df.iloc[:block_rows])
+            with self.engine.begin() as connection:
+                for statement in self._create_table_statements(first_block, clean_table_name, if_exists):
+                    connection.exec_driver_sql(statement)
+            rows_written = 0
+            with self.engine.begin() as connection:
+                for start in range(0, len(df), block_rows):
+                    if start == 0:
+                        block = first_block
+                    else:
+                        block = self._prepare_dataframe(df.iloc[start:start + block_rows])
+                    inserted = block.to_sql(
+                        name=clean_table_name,
+                        con=connection,
+                        if_exists='append',
+                        index=False,
+                        method='multi',
+                        chunksize=chunksize
+                    )
+                    # Filas afectadas según el servidor (suma de rowcount de cada INSERT)
+                    rows_written += inserted if inserted is not None else len(block)
             
-            # Verificar escritura
-            verification = self._verify_write(clean_table_name, len(df))
+            if if_exists == 'append':
+                # La tabla puede tener filas previas: el total solo se conoce contando
+                verification = self._verify_write(clean_table_name, len(df))
+                table_rows = verification['actual_rows'] if verification.get('success') else None
+            else:
+                # Tabla nueva o vaciada: contiene exactamente lo insertado, sin COUNT(*)
+                verification = {
+                    'success': True,
+                    'expected_rows': len(df),
+                    'actual_rows': rows_written,
+                    'rows_match': rows_written == len(df)
+                }
+                table_rows = rows_written
+            
+            # El conteo exacto ya está calculado: guardarlo para los visores
+            if table_rows is not None:
+                self.update_table_stats({clean_table_name: table_rows})
             
             result = {
                 'success': True,
                 'table_name': clean_table_name,
-                'rows_written': len(df),
+                'rows_written': rows_written,
                 'columns_written': len(df.columns),
                 'if_exists_action': if_exists,
                 'verification': verification
             }
             
-            self.logger.info(f"✅ Escritura MySQL exitosa: {len(df)} filas en '{clean_table_name}'")
+            self.logger.info(f"✅ Escritura MySQL exitosa: {rows_written} filas en '{clean_table_name}'")
             return result
             
         except Exception as e:
@@ -172,6 +268,372 @@ class MySQLWriter:
                 'rows_attempted': len(df) if not df.empty else 0
             }
     
+    def load_dataframe(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        if_exists: str = 'replace',
+        chunk_rows: int = 100000,
+        connection=None
+    ) -> Dict[str, Any]:
+        """
+        Carga un DataFrame con LOAD DATA LOCAL INFILE (sin generar INSERTs)
+        
+        La tabla se crea con los tipos que inferiría to_sql y las filas se
+        vuelcan a un archivo temporal en el formato por defecto de LOAD DATA
+        (tabuladores, escapes con barra invertida y \\N para NULL). Si el
+        servidor no permite 'local_infile' se usa write() como respaldo.
+        
+        Args:
+            df: DataFrame a cargar
+            table_name: Nombre de la tabla
+            if_exists: Qué hacer si la tabla existe ('fail', 'replace', 'append',
+                'truncate' para vaciarla conservando su definición, o 'swap' para
+                cargar en una tabla de staging y sustituirla con un RENAME atómico)
+            chunk_rows: Filas preparadas y formateadas por bloque al escribir el archivo temporal
+            connection: Conexión de bulk_session() a reutilizar (se confirma al cerrar la sesión)
+        
+        Returns:
+            Dict con información del resultado (mismo formato que write())
+        """
+        if not self._local_infile_supported:
+            return self.write(df, table_name, if_exists=if_exists)
+        
+        try:
+            if df.empty:
+                raise ValueError("DataFrame está vacío")
+            
+            clean_table_name = self._clean_table_name(table_name)
+            
+            with tempfile.TemporaryDirectory() as temp_dir:
+                data_path = os.path.join(temp_dir, f"{clean_table_name}.tsv")
+                # Preparar y formatear bloque a bloque: nunca hay una segunda copia
+                # completa del DataFrame en memoria, solo la del bloque en curso
+                first_block = None
+                with open(data_path, 'w', encoding='utf-8', newline='') as f:
+                    for start in range(0, len(df), chunk_rows):
+                        block = self._prepare_dataframe(df.iloc[start:start + chunk_rows])
+                        if first_block is None:
+                            first_block = block
+                        f.write(self._format_load_data_rows(block))
+                # El esquema se deduce del primer bloque (la preparación no cambia los tipos entre bloques)
+                df_prepared = first_block
+                
+                own_connection = connection is None
+                if own_connection:
+                    connection = self._connect_local_infile()
+                # 'swap': la tabla visible no queda vacía ni a medio cargar en ningún momento
+                load_table_name = clean_table_name
+                create_mode = if_exists
+                if if_exists == 'swap':
+                    load_table_name = self._staging_table_name(clean_table_name, '__new')
+                    create_mode = 'replace'
+                try:
+                    cursor = connection.cursor()
+                    if own_connection:
+                        # Mismas comprobaciones desactivadas que en bulk_session (la conexión
+                        # se cierra al terminar, así que no hace falta restaurarlas)
+                        cursor.execute("SET unique_checks=0")
+                        cursor.execute("SET foreign_key_checks=0")
+                    # DDL en la misma conexión (otra conexión esperaría los bloqueos de la sesión)
+                    for statement in self._create_table_statements(df_prepared, load_table_name, create_mode):
+                        cursor.execute(statement)
+                    # Una tabla vaciada conserva los índices del usuario: en MyISAM se
+                    # reconstruyen una sola vez al final (en InnoDB es una advertencia sin efecto).
+                    # Las tablas recién creadas no tienen índices secundarios, y con 'append'
+                    # reconstruir todo el índice en cada bloque costaría más que mantenerlo
+                    existing_keys = create_mode == 'truncate'
+                    if existing_keys:
+                        cursor.execute(f"ALTER TABLE `{load_table_name}` DISABLE KEYS")
+                    columns = ', '.join(f"`{col}`" for col in df_prepared.columns)
+                    try:
+                        cursor.execute(
+                            f"LOAD DATA LOCAL INFILE %s INTO TABLE `{load_table_name}` "
+                            f"CHARACTER SET utf8mb4 ({columns})",
+                            (data_path,)
+                        )
+                        rows_loaded = cursor.rowcount
+                    finally:
+                        if existing_keys:
+                            cursor.execute(f"ALTER TABLE `{load_table_name}` ENABLE KEYS")
+                    if if_exists == 'swap':
+                        self._swap_in_table(cursor, clean_table_name, load_table_name)
+                    if own_connection:
+                        connection.commit()
+                    cursor.close()
+                except Exception:
+                    # Un 'swap' fallido no deja la tabla de staging (la visible sigue intacta)
+                    if if_exists == 'swap':
+                        self._drop_table_quietly(connection, load_table_name)
+                    raise
+                finally:
+                    if own_connection:
+                        connection.close()
+            
+            verification = {
+                'success': True,
+                'expected_rows': len(df),
+                'actual_rows': rows_loaded,
+                'rows_match': rows_loaded == len(df)
+            }
+            # Con 'append' la tabla tiene más filas que este bloque: el llamador conoce el
+            # total (p. ej. la carga por chunks lo guarda al terminar) y no se cuenta aquí
+            if if_exists != 'append':
+                self.update_table_stats({clean_table_name: rows_loaded})
+            
+            self.logger.info(f"✅ LOAD DATA exitoso: {rows_loaded} filas en '{clean_table_name}'")
+            return {
+                'success': True,
+                'table_name': clean_table_name,
+                'rows_written': rows_loaded,
+                'columns_written': len(df.columns),
+                'if_exists_action': if_exists,
+                'method': 'load_data',
+                'verification': verification
+            }
+            
+        except Exception as e:
+            # Solo 'local_infile' deshabilitado pasa a INSERT por lotes; cualquier otro
+            # error (conexión, datos, disco) se devuelve como fallo: reintentar con
+            # write() borraría la tabla visible que 'swap' debe conservar
+            if isinstance(e, mysql.connector.Error) and e.errno in self._LOCAL_INFILE_DISABLED_ERRNOS:
+                self._local_infile_supported = False
+                self.logger.warning(f"LOAD DATA no disponible ({str(e)}), usando INSERT por lotes")
+                # La tabla ya se creó en esta conexión: 'fail' pasa a 'append'
+                return self.write(df, table_name, if_exists='replace' if if_exists in ('replace', 'swap') else 'append')
+            
+            self.logger.error(f"Error cargando datos en MySQL: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e),
+                'table_name': table_name,
+                'rows_attempted': len(df)
+            }
+    
+    @contextmanager
+    def bulk_session(self):
+        """
+        Conexión para cargas masivas: sin autocommit y sin comprobaciones de
+        unicidad ni claves foráneas. Confirma al salir (o revierte si hay error)
+        y siempre restaura las variables de sesión.
+        
+        Nota: en MySQL cada CREATE/DROP TABLE confirma implícitamente, así que
+        con varias tablas los datos quedan confirmados tabla a tabla.
+        
+        Yields:
+            Conexión mysql.connector para pasar a load_dataframe()
+        """
+        connection = self._connect_local_infile()
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SET unique_checks=0")
+            cursor.execute("SET foreign_key_checks=0")
+            yield connection
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            try:
+                cursor.execute("SET unique_checks=1")
+                cursor.execute("SET foreign_key_checks=1")
+                cursor.close()
+            finally:
+                connection.close()
+    
+    def _create_table_statements(self, df: pd.DataFrame, table_name: str, if_exists: str) -> List[str]:
+        """
+        Sentencias para crear la tabla de destino con los tipos que usaría to_sql
+        
+        Args:
+            df: DataFrame ya preparado
+            table_name: Nombre limpio de la tabla
+            if_exists: 'fail', 'replace', 'append', 'truncate' o 'swap'
+                ('swap' sin tabla de staging equivale a 'replace')
+            
+        Returns:
+            Lista de sentencias SQL a ejecutar en orden
+        """
+        create_sql = self._create_table_sql(df, table_name)
+        if if_exists in ('replace', 'swap'):
+            return [f"DROP TABLE IF EXISTS `{table_name}`", create_sql]
+        if if_exists == 'append':
+            return [create_sql.replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS", 1)]
+        if if_exists == 'truncate':
+            # Conserva la definición (e índices) de una tabla existente
+            return [
+                create_sql.replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS", 1),
+                f"TRUNCATE TABLE `{table_name}`"
+            ]
+        return [create_sql]
+    
+    def _create_table_sql(self, df: pd.DataFrame, table_name: str) -> str:
+        """
+        CREATE TABLE para el esquema del DataFrame, memoizado por columnas y dtypes
+        
+        Los años de una misma tabla comparten esquema: get_schema (que construye
+        y compila una Table de SQLAlchemy) se ejecuta una vez por esquema y el
+        resto de tablas solo sustituyen el nombre.
+        
+        Args:
+            df: DataFrame ya preparado
+            table_name: Nombre limpio de la tabla
+            
+        Returns:
+            Sentencia CREATE TABLE
+        """
+        schema_key = tuple((str(col), str(dtype)) for col, dtype in df.dtypes.items())
+        template = self._create_table_templates.get(schema_key)
+        if template is None:
+            template = pd.io.sql.get_schema(df, self._SCHEMA_NAME_PLACEHOLDER, con=self.engine)
+            self._create_table_templates[schema_key] = template
+        # get_schema no cita el marcador: el nombre real se cita aquí (palabras reservadas)
+        quoted_name = self.engine.dialect.identifier_preparer.quote_identifier(table_name)
+        return template.replace(self._SCHEMA_NAME_PLACEHOLDER, quoted_name, 1)
+    
+    @staticmethod
+    def _staging_table_name(table_name: str, tag: str) -> str:
+        """Nombre auxiliar derivado de una tabla, dentro del límite de 64 caracteres"""
+        return f"{table_name[:64 - len(tag)]}{tag}"
+    
+    def _drop_table_quietly(self, connection, table_name: str):
+        """DROP TABLE IF EXISTS en la conexión dada; si falla solo se registra"""
+        try:
+            cursor = connection.cursor()
+            cursor.execute(f"DROP TABLE IF EXISTS `{table_name}`")
+            cursor.close()
+        except Exception as e:
+            self.logger.warning(f"No se pudo eliminar la tabla auxiliar '{table_name}': {str(e)}")
+    
+    def _swap_in_table(self, cursor, table_name: str, staging_name: str):
+        """
+        Sustituye una tabla por su versión de staging con un único RENAME atómico
+        
+        Args:
+            cursor: Cursor de la conexión que cargó la tabla de staging
+            table_name: Tabla visible
+            staging_name: Tabla recién cargada
+        """
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = %s",
+            (table_name,)
+        )
+        if cursor.fetchone()[0]:
+            old_name = self._staging_table_name(table_name, '__old')
+            cursor.execute(f"DROP TABLE IF EXISTS `{old_name}`")
+            cursor.execute(
+                f"RENAME TABLE `{table_name}` TO `{old_name}`, `{staging_name}` TO `{table_name}`"
+            )
+            cursor.execute(f"DROP TABLE `{old_name}`")
+        else:
+            cursor.execute(f"RENAME TABLE `{staging_name}` TO `{table_name}`")
+    
+    def _insert_chunksize(self, n_columns: int, requested: Optional[int] = None) -> int:
+        """
+        Filas por INSERT multi-valor
+        
+        Args:
+            n_columns: Columnas de la tabla (cada fila usa un parámetro por columna)
+            requested: Tamaño pedido por el llamador (None: 'batch_size' de la configuración)
+            
+        Returns:
+            Tamaño de lote que no supera el máximo de parámetros por sentencia
+        """
+        batch_size = requested or self.config.get('batch_size') or self.FALLBACK_INSERT_CHUNKSIZE
+        return max(1, min(batch_size, self.MAX_STATEMENT_PARAMS // max(1, n_columns)))
+    
+    def _connect_local_infile(self):
+        """Abre una conexión directa con LOAD DATA LOCAL habilitado en el cliente"""
+        return mysql.connector.connect(
+            host=self.config['host'],
+            port=self.config['port'],
+            user=self.config['user'],
+            password=self.config['password'],
+            database=self.config['database'],
+            charset=self.config.get('charset', 'utf8mb4'),
+            connection_timeout=self.config.get('connect_timeout', 30),
+            ssl_disabled=self.config.get('ssl_disabled', True),
+            allow_local_infile=True,
+            autocommit=False,
+            **self._driver_options()
+        )
+    
+    def _driver_options(self) -> Dict[str, Any]:
+        """
+        Opciones de rendimiento de mysql-connector comunes al engine y a las conexiones directas
+        
+        use_pure=False usa la extensión C del conector (protocolo fuera del
+        intérprete); compress activa zlib en el protocolo, útil con servidores
+        remotos, por lo que si no se indica se activa para cualquier host no local.
+        """
+        return {
+            'use_pure': self.config.get('use_pure', False),
+            'compress': self.config.get('compress', not self.is_local_host(self.config.get('host')))
+        }
+    
+    @staticmethod
+    def is_local_host(host: Optional[str]) -> bool:
+        """True si el servidor está en esta máquina (la compresión solo añadiría CPU)"""
+        return not host or str(host).strip().lower() in MySQLWriter.LOCAL_HOSTS
+    
+    def _format_load_data_rows(self, df: pd.DataFrame) -> str:
+        """
+        Formatea filas para LOAD DATA con sus opciones por defecto
+        
+        Args:
+            df: Bloque de filas a formatear
+            
+        Returns:
+            Texto con una línea por fila, campos separados por tabuladores
+        """
+        if df.empty:
+            return ''
+        
+        columns = []
+        for col in df.columns:
+            series = df[col]
+            nulls = series.isna()
+            if pd.api.types.is_bool_dtype(series):
+                series = series.astype('Int8')
+            elif pd.api.types.is_datetime64_any_dtype(series):
+                series = self._format_datetimes(series)
+            
+            values = series.astype(str)
+            if pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]):
+                values = (
+                    values.str.replace('\\', '\\\\', regex=False)
+                    .str.replace('\t', '\\t', regex=False)
+                    .str.replace('\n', '\\n', regex=False)
+                    .str.replace('\r', '\\r', regex=False)
+                )
+            columns.append(values.mask(nulls, '\\N'))
+        
+        lines = columns[0].str.cat(columns[1:], sep='\t') if len(columns) > 1 else columns[0]
+        return '\n'.join(lines) + '\n'
+    
+    @staticmethod
+    def _format_datetimes(series: pd.Series) -> pd.Series:
+        """
+        Formatea fechas para LOAD DATA una vez por valor distinto
+        
+        Las tablas por año repiten mucho las mismas fechas: se formatean solo
+        los valores únicos y el resultado se reparte por posición, en lugar de
+        llamar a strftime fila a fila.
+        
+        Args:
+            series: Columna datetime64
+            
+        Returns:
+            Serie de cadenas 'YYYY-MM-DD HH:MM:SS' (los NaT se enmascaran después)
+        """
+        codes, uniques = pd.factorize(series)
+        if len(uniques) == 0:
+            return pd.Series('', index=series.index, dtype=object)
+        formatted = uniques.strftime('%Y-%m-%d %H:%M:%S').to_numpy(dtype=object)
+        # Los NaT tienen código -1: toman cualquier valor, se sustituyen por \N al enmascarar
+        return pd.Series(formatted.take(codes), index=series.index, dtype=object)
+    
     def _clean_table_name(self, table_name: str) -> str:
         """
         Limpia el nombre de tabla para MySQL
@@ -239,27 +701,61 @@ class MySQLWriter:
         Returns:
             Dict con información de verificación
         """
+        profile = self.get_table_profile(table_name)
+        
+        if 'error' in profile:
+            self.logger.error(f"Error verificando escritura: {profile['error']}")
+            return {
+                'success': False,
+                'error': profile['error']
+            }
+        
+        actual_rows = profile['row_count']
+        
+        return {
+            'success': True,
+            'expected_rows': expected_rows,
+            'actual_rows': actual_rows,
+            'rows_match': actual_rows == expected_rows,
+            'columns_count': len(profile['columns']),
+            'columns_info': profile['columns']
+        }
+    
+    def get_table_profile(self, table_name: str, include_row_count: bool = True) -> Dict[str, Any]:
+        """
+        Obtiene la estructura y el conteo exacto de filas de una tabla
+        en una sola consulta (en lugar de DESCRIBE + COUNT por separado)
+        
+        Args:
+            table_name: Nombre de la tabla
+            include_row_count: Si calcular COUNT(*) (si es False, 'row_count' es None)
+            
+        Returns:
+            Dict con 'row_count' y 'columns'
+        """
+        count_sql = f"(SELECT COUNT(*) FROM `{table_name}`)" if include_row_count else "NULL"
+        
         try:
             with self.engine.connect() as connection:
-                # Contar filas
-                count_result = connection.execute(
-                    text(f"SELECT COUNT(*) FROM `{table_name}`")
+                result = connection.execute(
+                    text(
+                        "SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, "
+                        f"{count_sql} AS n_rows "
+                        "FROM information_schema.COLUMNS "
+                        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name "
+                        "ORDER BY ORDINAL_POSITION"
+                    ),
+                    {'table_name': table_name}
                 )
-                actual_rows = count_result.fetchone()[0]
+                rows = result.fetchall()
                 
-                # Obtener información de columnas
-                columns_result = connection.execute(
-                    text(f"DESCRIBE `{table_name}`")
-                )
-                columns_info = columns_result.fetchall()
+                if not rows:
+                    raise ValueError(f"La tabla '{table_name}' no existe")
                 
                 return {
-                    'success': True,
-                    'expected_rows': expected_rows,
-                    'actual_rows': actual_rows,
-                    'rows_match': actual_rows == expected_rows,
-                    'columns_count': len(columns_info),
-                    'columns_info': [
+                    'table_name': table_name,
+                    'row_count': int(rows[0][5]) if include_row_count else None,
+                    'columns': [
                         {
                             'name': col[0],
                             'type': col[1],
@@ -267,14 +763,14 @@ class MySQLWriter:
                             'key': col[3],
                             'default': col[4]
                         }
-                        for col in columns_info
+                        for col in rows
                     ]
                 }
                 
         except Exception as e:
-            self.logger.error(f"Error verificando escritura: {str(e)}")
+            self.logger.error(f"Error obteniendo perfil de tabla {table_name}: {str(e)}")
             return {
-                'success': False,
+                'table_name': table_name,
                 'error': str(e)
             }
     
@@ -295,10 +791,273 @@ class MySQLWriter:
             self.logger.error(f"Error listando tablas: {str(e)}")
             return []
     
+    def _count_statement(self, table_name: str):
+        """
+        Devuelve la sentencia COUNT(*) de una tabla, reutilizando la ya compilada
+        
+        MySQL no permite parametrizar identificadores, así que se compila una
+        sentencia por tabla y se guarda para las siguientes llamadas.
+        
+        Args:
+            table_name: Nombre de la tabla (debe existir en la base de datos)
+            
+        Returns:
+            Sentencia text() lista para ejecutar
+        """
+        statement = self._count_statements.get(table_name)
+        if statement is None:
+            statement = text(f"SELECT COUNT(*) FROM `{table_name}`")
+            self._count_statements[table_name] = statement
+        return statement
+    
+    def get_table_overview(self, exclude_like: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Obtiene nombre y número aproximado de filas de todas las tablas
+        en una sola consulta a information_schema
+        
+        Args:
+            exclude_like: Patrón LIKE de tablas a omitir (filtrado en el servidor)
+            
+        Returns:
+            Lista de dicts con 'name' y 'count'
+        """
+        try:
+            with self.engine.connect() as connection:
+                return self._fetch_table_overview(connection, exclude_like)
+                
+        except Exception as e:
+            self.logger.error(f"Error obteniendo resumen de tablas: {str(e)}")
+            return []
+    
+    def _fetch_table_overview(self, connection, exclude_like: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Consulta de get_table_overview sobre una conexión ya abierta"""
+        query = (
+            "SELECT TABLE_NAME, TABLE_ROWS "
+            "FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME <> :stats_table"
+        )
+        params = {'stats_table': self.TABLE_STATS_TABLE}
+        if exclude_like:
+            query += " AND TABLE_NAME NOT LIKE :exclude_like"
+            params['exclude_like'] = exclude_like
+        
+        result = connection.execute(text(query + " ORDER BY TABLE_NAME"), params)
+        
+        overview = []
+        for name, approx_rows in result.fetchall():
+            if approx_rows is None:
+                # TABLE_ROWS es NULL en vistas: contar solo en ese caso
+                approx_rows = connection.execute(self._count_statement(name)).scalar()
+            overview.append({'name': name, 'count': int(approx_rows or 0)})
+        
+        return overview
+    
+    def get_columns_by_table(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Obtiene las columnas de todas las tablas en una sola consulta
+        a information_schema (en lugar de un DESCRIBE por tabla)
+        
+        Returns:
+            Dict con nombre de tabla como clave y lista de columnas como valor
+        """
+        try:
+            with self.engine.connect() as connection:
+                return self._fetch_columns_by_table(connection)
+                
+        except Exception as e:
+            self.logger.error(f"Error obteniendo columnas de tablas: {str(e)}")
+            return {}
+    
+    def _fetch_columns_by_table(self, connection) -> Dict[str, List[Dict[str, Any]]]:
+        """Consulta de get_columns_by_table sobre una conexión ya abierta"""
+        result = connection.execute(text(
+            "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT "
+            "FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() "
+            "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+        ))
+        
+        columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+        for table_name, name, col_type, nullable, key, default in result.fetchall():
+            columns_by_table.setdefault(table_name, []).append({
+                'name': name,
+                'type': col_type,
+                'null': nullable == 'YES',
+                'key': key,
+                'default': default
+            })
+        
+        return columns_by_table
+    
+    def get_table_stats(self, max_age_seconds: Optional[int] = None) -> Dict[str, int]:
+        """
+        Lee los conteos exactos guardados en la tabla de estadísticas
+        
+        Args:
+            max_age_seconds: Ignorar entradas más antiguas que este número de segundos
+            
+        Returns:
+            Dict con nombre de tabla como clave y número de filas como valor
+        """
+        try:
+            with self.engine.connect() as connection:
+                return self._fetch_table_stats(connection, max_age_seconds)
+                
+        except Exception as e:
+            self.logger.error(f"Error leyendo estadísticas de tablas: {str(e)}")
+            return {}
+    
+    def _fetch_table_stats(self, connection, max_age_seconds: Optional[int] = None) -> Dict[str, int]:
+        """Consulta de get_table_stats sobre una conexión ya abierta"""
+        query = f"SELECT table_name, n_rows FROM `{self.TABLE_STATS_TABLE}`"
+        params = {}
+        if max_age_seconds is not None:
+            query += " WHERE updated_at >= NOW() - INTERVAL :max_age SECOND"
+            params['max_age'] = int(max_age_seconds)
+        
+        try:
+            result = connection.execute(text(query), params)
+            return {name: int(n_rows) for name, n_rows in result.fetchall()}
+        except Exception as e:
+            # La tabla de estadísticas aún no existe
+            self.logger.debug(f"Estadísticas de tablas no disponibles: {str(e)}")
+            return {}
+    
+    def get_overview_snapshot(
+        self,
+        max_age_seconds: Optional[int] = None,
+        exclude_like: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Carga conteos guardados, resumen y columnas de todas las tablas
+        con una sola conexión y dentro de una misma transacción de lectura,
+        para que todos los datos correspondan al mismo instante
+        
+        Args:
+            max_age_seconds: Antigüedad máxima de los conteos exactos guardados
+            exclude_like: Patrón LIKE de tablas a omitir del resumen
+            
+        Returns:
+            Dict con 'stats', 'tables' y 'columns' (vacíos si hay error)
+        """
+        try:
+            with self.engine.connect() as connection:
+                with connection.begin():
+                    return {
+                        'stats': self._fetch_table_stats(connection, max_age_seconds),
+                        'tables': self._fetch_table_overview(connection, exclude_like),
+                        'columns': self._fetch_columns_by_table(connection)
+                    }
+                    
+        except Exception as e:
+            self.logger.error(f"Error cargando resumen de la base de datos: {str(e)}")
+            return {'stats': {}, 'tables': [], 'columns': {}}
+    
+    def update_table_stats(self, counts: Dict[str, int]) -> bool:
+        """
+        Guarda conteos exactos de filas en la tabla de estadísticas
+        
+        Args:
+            counts: Dict con nombre de tabla como clave y número de filas como valor
+            
+        Returns:
+            True si se guardaron correctamente
+        """
+        if not counts:
+            return True
+        
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS `{self.TABLE_STATS_TABLE}` ("
+                    "table_name VARCHAR(64) NOT NULL PRIMARY KEY, "
+                    "n_rows BIGINT NOT NULL, "
+                    "updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP "
+                    "ON UPDATE CURRENT_TIMESTAMP)"
+                ))
+                connection.execute(
+                    text(
+                        f"INSERT INTO `{self.TABLE_STATS_TABLE}` (table_name, n_rows) "
+                        "VALUES (:table_name, :n_rows) "
+                        "ON DUPLICATE KEY UPDATE n_rows = VALUES(n_rows), updated_at = CURRENT_TIMESTAMP"
+                    ),
+                    [{'table_name': name, 'n_rows': int(n_rows)} for name, n_rows in counts.items()]
+                )
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"No se pudieron guardar estadísticas de tablas: {str(e)}")
+            return False
+    
+    def refresh_table_stats(self, table_names: List[str], max_workers: Optional[int] = None) -> Dict[str, int]:
+        """
+        Recalcula con COUNT(*) los conteos exactos y los guarda en la tabla de estadísticas
+        
+        Args:
+            table_names: Tablas a recalcular
+            max_workers: Consultas concurrentes (por defecto, el tamaño del pool)
+            
+        Returns:
+            Dict con los conteos calculados
+        """
+        def count_rows(table_name: str) -> Optional[int]:
+            try:
+                with self.engine.connect() as connection:
+                    return int(connection.execute(self._count_statement(table_name)).scalar() or 0)
+            except Exception as e:
+                self.logger.warning(f"Error contando filas de {table_name}: {str(e)}")
+                return None
+        
+        counts = {}
+        
+        # Solo se cuentan tablas que existen (los identificadores no se pueden parametrizar)
+        existing = set(self.list_tables())
+        for table_name in table_names:
+            if table_name not in existing:
+                self.logger.warning(f"Tabla desconocida, se omite el conteo: {table_name}")
+        table_names = [name for name in table_names if name in existing]
+        
+        if table_names:
+            workers = max_workers or min(len(table_names), self.engine.pool.size())
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for table_name, n_rows in zip(table_names, executor.map(count_rows, table_names)):
+                    if n_rows is not None:
+                        counts[table_name] = n_rows
+        
+        self.update_table_stats(counts)
+        return counts
+    
+    def read_table_page(self, table_name: str, limit: int, offset: int = 0) -> pd.DataFrame:
+        """
+        Lee una página de filas de una tabla con un cursor del lado del servidor,
+        de modo que el cliente solo guarda en memoria las filas pedidas
+        
+        Args:
+            table_name: Nombre de la tabla
+            limit: Número máximo de filas
+            offset: Filas a saltar desde el inicio
+            
+        Returns:
+            DataFrame con las filas de la página
+        """
+        with self.engine.connect() as connection:
+            result = connection.execution_options(
+                stream_results=True,
+                max_row_buffer=limit
+            ).execute(
+                text(f"SELECT * FROM `{table_name}` LIMIT :limit OFFSET :offset"),
+                {'limit': int(limit), 'offset': int(offset)}
+            )
+            rows = result.fetchmany(limit)
+            return pd.DataFrame(rows, columns=list(result.keys()))
+    
     def get_table_info(self, table_name: str) -> Dict[str, Any]:
         """
         Obtiene información detallada de una tabla
         
+        Estructura, conteo de filas e índices se leen en una sola consulta
+        (en lugar de DESCRIBE + COUNT(*) + SHOW INDEX por separado).
+        
         Args:
             table_name: Nombre de la tabla
             
@@ -307,46 +1066,53 @@ class MySQLWriter:
         """
         try:
             with self.engine.connect() as connection:
-                # Información de estructura
-                describe_result = connection.execute(
-                    text(f"DESCRIBE `{table_name}`")
+                result = connection.execute(
+                    text(
+                        "SELECT c.COLUMN_NAME, c.COLUMN_TYPE, c.IS_NULLABLE, c.COLUMN_KEY, "
+                        "c.COLUMN_DEFAULT, c.EXTRA, s.INDEX_NAME, s.NON_UNIQUE, s.SEQ_IN_INDEX, "
+                        f"(SELECT COUNT(*) FROM `{table_name}`) AS n_rows "
+                        "FROM information_schema.COLUMNS c "
+                        "LEFT JOIN information_schema.STATISTICS s "
+                        "ON s.TABLE_SCHEMA = c.TABLE_SCHEMA AND s.TABLE_NAME = c.TABLE_NAME "
+                        "AND s.COLUMN_NAME = c.COLUMN_NAME "
+                        "WHERE c.TABLE_SCHEMA = DATABASE() AND c.TABLE_NAME = :table_name "
+                        "ORDER BY c.ORDINAL_POSITION"
+                    ),
+                    {'table_name': table_name}
                 )
-                structure = describe_result.fetchall()
+                rows = result.fetchall()
                 
-                # Contar filas
-                count_result = connection.execute(
-                    text(f"SELECT COUNT(*) FROM `{table_name}`")
-                )
-                row_count = count_result.fetchone()[0]
+                if not rows:
+                    raise ValueError(f"La tabla '{table_name}' no existe")
                 
-                # Información de índices
-                indexes_result = connection.execute(
-                    text(f"SHOW INDEX FROM `{table_name}`")
-                )
-                indexes = indexes_result.fetchall()
-                
-                return {
-                    'table_name': table_name,
-                    'row_count': row_count,
-                    'columns': [
-                        {
+                # Una fila por columna e índice al que pertenece: separar ambas listas
+                columns = {}
+                indexes = []
+                for col in rows:
+                    if col[0] not in columns:
+                        columns[col[0]] = {
                             'name': col[0],
                             'type': col[1],
                             'null': col[2] == 'YES',
                             'key': col[3],
                             'default': col[4],
-                            'extra': col[5] if len(col) > 5 else None
-                        }
-                        for col in structure
-                    ],
-                    'indexes': [
-                        {
-                            'name': idx[2],
-                            'column': idx[4],
-                            'unique': idx[1] == 0
+                            'extra': col[5]
                         }
-                        for idx in indexes
-                    ]
+                    if col[6] is not None:
+                        indexes.append((col[6], col[8], {
+                            'name': col[6],
+                            'column': col[0],
+                            'unique': int(col[7]) == 0
+                        }))
+                
+                # Mismo orden que SHOW INDEX: PRIMARY primero, luego por índice y posición
+                indexes.sort(key=lambda idx: (idx[0] != 'PRIMARY', idx[0], idx[1]))
+                
+                return {
+                    'table_name': table_name,
+                    'row_count': int(rows[0][9]),
+                    'columns': list(columns.values()),
+                    'indexes': [idx[2] for idx in indexes]
                 }
                 
         except Exception as e:
@@ -363,28 +1129,47 @@ class MySQLWriter:
         Args:
             sql_content: Contenido SQL a ejecutar
             
+        Returns:
+            Dict con resultado de la ejecución
+        """
+        return self._execute_statements(self._iter_sql_statements(io.StringIO(sql_content)))
+    
+    def execute_sql_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Ejecuta un archivo SQL leyéndolo por líneas, sin cargarlo completo en memoria
+        
+        Args:
+            file_path: Ruta del archivo .sql
+            
         Returns:
             Dict con resultado de la ejecución
         """
         try:
-            with self.engine.connect() as connection:
-                # Dividir el SQL en statements individuales
-                statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip()]
-                
-                executed_statements = 0
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return self._execute_statements(self._iter_sql_statements(f))
+        except OSError as e:
+            self.logger.error(f"Error abriendo archivo SQL {file_path}: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e),
+                'message': f'Error ejecutando SQL: {str(e)}'
+            }
+    
+    def _execute_statements(self, statements: Iterable[str]) -> Dict[str, Any]:
+        """Ejecuta sentencias en una sola transacción (sin interpretar ':' como parámetros)"""
+        try:
+            executed_statements = 0
+            with self.engine.begin() as connection:
                 for statement in statements:
-                    if statement:
-                        connection.execute(text(statement))
-                        executed_statements += 1
-                
-                connection.commit()
-                
-                return {
-                    'success': True,
-                    'statements_executed': executed_statements,
-                    'message': f'Se ejecutaron {executed_statements} statements exitosamente'
-                }
-                
+                    connection.exec_driver_sql(statement)
+                    executed_statements += 1
+            
+            return {
+                'success': True,
+                'statements_executed': executed_statements,
+                'message': f'Se ejecutaron {executed_statements} statements exitosamente'
+            }
+            
         except Exception as e:
             self.logger.error(f"Error ejecutando SQL: {str(e)}")
             return {
@@ -392,6 +1177,66 @@ class MySQLWriter:
                 'error': str(e),
                 'message': f'Error ejecutando SQL: {str(e)}'
             }
+    
+    @staticmethod
+    def _iter_sql_statements(lines: Iterable[str]) -> Iterator[str]:
+        """
+        Separa sentencias SQL por ';' respetando cadenas, identificadores y comentarios
+        
+        Args:
+            lines: Iterable de líneas (por ejemplo un archivo abierto)
+            
+        Yields:
+            Cada sentencia sin el ';' final
+        """
+        buffer: List[str] = []
+        quote = None
+        skip_first = False
+        
+        for line in lines:
+            start = 0
+            i = 1 if skip_first else 0
+            skip_first = False
+            
+            while i < len(line):
+                if quote:
+                    i = _SQL_QUOTE_BODY[quote].match(line, i).end()
+                    if i >= len(line):
+                        break
+                    if line[i] == '\\':
+                        # '\\' al final del bloque: escapa el primer carácter del siguiente
+                        skip_first = True
+                        break
+                    # Cierre de comillas ('' duplicadas: se cierra y se vuelve a abrir)
+                    quote = None
+                    i += 1
+                else:
+                    match = _SQL_CODE_STOP.search(line, i)
+                    if not match:
+                        break
+                    token = match.group()
+                    if token == ';':
+                        buffer.append(line[start:match.start()])
+                        statement = ''.join(buffer).strip()
+                        if statement:
+                            yield statement
+                        buffer = []
+                        start = i = match.end()
+                    elif token in ('#', '--'):
+                        # Comentario hasta el final de la línea
+                        buffer.append(line[start:match.start()])
+                        buffer.append('\n')
+                        start = i = len(line)
+                    else:
+                        quote = token
+                        i = match.end()
+            
+            if start < len(line):
+                buffer.append(line[start:])
+        
+        statement = ''.join(buffer).strip()
+        if statement:
+            yield statement
 
     def close(self):
         """Cierra la conexión"""
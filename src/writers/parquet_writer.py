@@ -0,0 +1,99 @@
+"""
+Writer para archivos Parquet
+===========================
+
+Convierte DataFrames a archivos Parquet (columnar y comprimido) con pyarrow.
+"""
+
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Any
+from src.utils.logger import get_logger
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+class ParquetWriter:
+    """Writer para archivos Parquet"""
+    
+    def __init__(self):
+        self.logger = get_logger(__name__)
+        self.default_kwargs = {
+            'engine': 'pyarrow',
+            'compression': 'zstd',
+            'index': False
+        }
+    
+    def write(self, df: pd.DataFrame, output_path: str, table_name: str = None, **kwargs) -> Dict[str, Any]:
+        """
+        Escribe un DataFrame a un archivo Parquet
+        
+        Args:
+            df: DataFrame a escribir
+            output_path: Ruta del archivo de salida
+            **kwargs: Opciones adicionales (compression, etc.)
+        
+        Returns:
+            Dict con información del resultado
+        """
+        try:
+            if not PARQUET_AVAILABLE:
+                raise RuntimeError("pyarrow no está instalado (necesario para Parquet)")
+            
+            # Combinar kwargs por defecto con los proporcionados
+            write_kwargs = {**self.default_kwargs, **kwargs}
+            
+            # Asegurar que la extensión sea .parquet
+            output_path = Path(output_path)
+            if output_path.suffix.lower() != '.parquet':
+                output_path = output_path.with_suffix('.parquet')
+            
+            self.logger.info(f"Escribiendo archivo Parquet: {output_path}")
+            
+            # Crear directorio si no existe
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Escribir archivo Parquet
+            df.to_parquet(output_path, **write_kwargs)
+            
+            # Obtener estadísticas del archivo
+            file_size = output_path.stat().st_size
+            file_size_mb = file_size / 1024 / 1024
+            
+            result = {
+                'success': True,
+                'output_path': str(output_path),
+                'file_size_bytes': file_size,
+                'file_size_mb': file_size_mb,
+                'rows_written': len(df),
+                'columns_written': len(df.columns),
+                'format': 'parquet',
+                'compression': write_kwargs.get('compression', 'zstd')
+            }
+            
+            self.logger.info(f"Archivo Parquet escrito exitosamente: {output_path} ({file_size_mb:.2f} MB)")
+            return result
+        
+        except Exception as e:
+            self.logger.error(f"Error escribiendo archivo Parquet: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e),
+                'format': 'parquet'
+            }
+    
+    def get_supported_options(self) -> Dict[str, Any]:
+        """Retorna las opciones soportadas por este writer"""
+        return {
+            'format': 'parquet',
+            'description': 'Archivo Parquet (columnar, comprimido)',
+            'extensions': ['.parquet'],
+            'options': {
+                'compression': ['zstd', 'snappy', 'gzip', 'none'],
+                'index': [True, False]
+            }
+        }
@@ -3,12 +3,19 @@ Escritor de archivos SQL
 """
 
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable
 from src.utils.logger import get_logger
 
 class SQLWriter:
     """Clase para escribir archivos SQL"""
     
+    # Filas por INSERT multi-fila cuando no se indica batch_size
+    DEFAULT_BATCH_SIZE = 500
+    
+    # Tipos inferidos (pd.api.types.infer_dtype) de columnas object con formateador fijo
+    _OBJECT_NUMERIC_KINDS = {'integer', 'floating', 'mixed-integer-float'}
+    _OBJECT_TEXT_KINDS = {'string', 'empty'}
+    
     def __init__(self):
         self.logger = get_logger(__name__)
     
@@ -32,8 +39,8 @@ class SQLWriter:
             Dict con información del resultado
         """
         try:
-            # Si se especifica batch_size, usar escritura en lotes para mejor rendimiento
-            batch_size = kwargs.get('batch_size')
+            # INSERT multi-fila por defecto; batch_size=None o 0 genera un INSERT por fila
+            batch_size = kwargs.get('batch_size', self.DEFAULT_BATCH_SIZE)
             if isinstance(batch_size, int) and batch_size > 0:
                 return self.write_batch_insert(df, output_path, table_name, batch_size=batch_size)
 
@@ -91,10 +98,9 @@ class SQLWriter:
         for col_name, dtype in df.dtypes.items():
             # Mapear tipos de pandas a SQL
             sql_type = self._map_pandas_to_sql_type(dtype)
-            # Usar backticks para MySQL, comillas dobles para otros
-            columns.append(f'    `{col_name}` {sql_type}')
+            columns.append(f'    {self._quote_identifier(col_name)} {sql_type}')
         
-        create_sql = f"CREATE TABLE IF NOT EXISTS `{table_name}` (\n"
+        create_sql = f"CREATE TABLE IF NOT EXISTS {self._quote_identifier(table_name)} (\n"
         create_sql += ",\n".join(columns)
         create_sql += "\n);"
         
@@ -112,28 +118,114 @@ class SQLWriter:
             Lista de statements INSERT
         """
         insert_statements = []
-        columns = [f'`{col}`' for col in df.columns]
+        columns = [self._quote_identifier(col) for col in df.columns]
         columns_str = ', '.join(columns)
+        quoted_table = self._quote_identifier(table_name)
         
-        for _, row in df.iterrows():
-            # Escapar valores
-            values = []
-            for val in row.values:
-                if pd.isna(val):
-                    values.append('NULL')
-                elif isinstance(val, (int, float)):
-                    values.append(str(val))
-                else:
-                    # Escapar comillas simples
-                    escaped_val = str(val).replace("'", "''")
-                    values.append(f"'{escaped_val}'")
-            
-            values_str = ', '.join(values)
-            insert_sql = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({values_str});"
+        for values_str in self._format_rows(df):
+            insert_sql = f"INSERT INTO {quoted_table} ({columns_str}) VALUES ({values_str});"
             insert_statements.append(insert_sql)
         
         return insert_statements
     
+    def _format_rows(self, df: pd.DataFrame) -> List[str]:
+        """
+        Formatea los valores como literales SQL columna por columna
+        
+        Las columnas numéricas y de texto se convierten con operaciones
+        vectorizadas de pandas; el resto se recorre con map() y su formateador.
+        Las filas se unen con str.cat en lugar de un join por fila.
+        
+        Args:
+            df: DataFrame
+            
+        Returns:
+            Lista con los literales SQL de cada fila separados por comas
+        """
+        if df.empty or len(df.columns) == 0:
+            return []
+        
+        formatted_columns = []
+        for i, fmt in enumerate(self._build_value_formatters(df)):
+            column = df.iloc[:, i]
+            if fmt is self._format_numeric:
+                formatted = column.astype(str).mask(column.isna(), 'NULL')
+            elif fmt is self._format_text and (
+                pd.api.types.is_object_dtype(column.dtype) or pd.api.types.is_string_dtype(column.dtype)
+            ):
+                # Cadenas: escape y comillas en C (las fechas siguen con str() por valor,
+                # astype(str) omite la hora cuando todas son medianoche)
+                formatted = "'" + column.astype(str).str.replace("'", "''", regex=False) + "'"
+                formatted = formatted.mask(column.isna(), 'NULL')
+            else:
+                formatted = pd.Series(list(map(fmt, column)), index=column.index, dtype=object)
+            formatted_columns.append(formatted)
+        
+        if len(formatted_columns) == 1:
+            return formatted_columns[0].tolist()
+        return formatted_columns[0].str.cat(formatted_columns[1:], sep=', ').tolist()
+    
+    def _build_value_formatters(self, df: pd.DataFrame) -> List[Callable[[Any], str]]:
+        """
+        Precalcula el formateador de valores SQL de cada columna
+        
+        Las columnas object (las cadenas leídas de Access) se inspeccionan una
+        vez: si todos sus valores son del mismo tipo se usa el formateador
+        especializado y solo las columnas realmente mixtas deciden por valor.
+        
+        Args:
+            df: DataFrame
+            
+        Returns:
+            Lista de funciones (una por columna) que convierten un valor a literal SQL
+        """
+        formatters = []
+        
+        for i, dtype in enumerate(df.dtypes):
+            if pd.api.types.is_numeric_dtype(dtype):
+                formatters.append(self._format_numeric)
+            elif pd.api.types.is_object_dtype(dtype):
+                kind = pd.api.types.infer_dtype(df.iloc[:, i], skipna=True)
+                if kind in self._OBJECT_TEXT_KINDS:
+                    formatters.append(self._format_text)
+                elif kind in self._OBJECT_NUMERIC_KINDS:
+                    formatters.append(self._format_numeric)
+                else:
+                    # Tipos mezclados: decidir por valor
+                    formatters.append(self._format_value)
+            else:
+                formatters.append(self._format_text)
+        
+        return formatters
+    
+    @staticmethod
+    def _quote_identifier(name: Any) -> str:
+        """Cita un nombre de tabla/columna con backticks (MySQL), duplicando los internos"""
+        return '`' + str(name).replace('`', '``') + '`'
+    
+    @staticmethod
+    def _format_numeric(val: Any) -> str:
+        """Formatea un valor numérico como literal SQL"""
+        return 'NULL' if pd.isna(val) else str(val)
+    
+    @staticmethod
+    def _format_text(val: Any) -> str:
+        """Formatea un valor como cadena SQL escapando comillas simples"""
+        if pd.isna(val):
+            return 'NULL'
+        escaped_val = str(val).replace("'", "''")
+        return f"'{escaped_val}'"
+    
+    @staticmethod
+    def _format_value(val: Any) -> str:
+        """Formatea un valor de tipo desconocido como literal SQL"""
+        if pd.isna(val):
+            return 'NULL'
+        if isinstance(val, (int, float)):
+            return str(val)
+        escaped_val = str(val).replace("'", "''")
+        return f"'{escaped_val}'"
+    
     def _map_pandas_to_sql_type(self, pandas_dtype) -> str:
         """
         Mapea tipos de pandas a tipos SQL
@@ -218,25 +310,13 @@ class SQLWriter:
         if df.empty:
             return ""
         
-        columns = [f'"{col}"' for col in df.columns]
+        # Mismas comillas que el CREATE TABLE: en MySQL "col" sería un literal de texto
+        columns = [self._quote_identifier(col) for col in df.columns]
         columns_str = ', '.join(columns)
         
-        values_list = []
-        for _, row in df.iterrows():
-            values = []
-            for val in row.values:
-                if pd.isna(val):
-                    values.append('NULL')
-                elif isinstance(val, (int, float)):
-                    values.append(str(val))
-                else:
-                    escaped_val = str(val).replace("'", "''")
-                    values.append(f"'{escaped_val}'")
-            
-            values_str = f"({', '.join(values)})"
-            values_list.append(values_str)
+        values_list = [f"({values_str})" for values_str in self._format_rows(df)]
         
         all_values = ',\n    '.join(values_list)
-        insert_sql = f"INSERT INTO {table_name} ({columns_str}) VALUES\n    {all_values};"
+        insert_sql = f"INSERT INTO {self._quote_identifier(table_name)} ({columns_str}) VALUES\n    {all_values};"
         
         return insert_sql 
\ No newline at end of file
@@ -49,11 +49,12 @@ class SQLiteWriter:
                 # Escribir DataFrame a SQLite
                 df.to_sql(table_name, conn, **write_kwargs)
                 
-                # Obtener información de la tabla
+                # Obtener información de la tabla (incluye el conteo para verificar la escritura)
                 table_info = self._get_table_info(conn, table_name)
-                
-                # Verificar que los datos se escribieron correctamente
-                row_count = pd.read_sql(f"SELECT COUNT(*) as count FROM {table_name}", conn).iloc[0]['count']
+                row_count = table_info.get('row_count')
+                if row_count is None:
+                    quoted_name = self._quote_identifier(table_name)
+                    row_count = conn.execute(f"SELECT COUNT(*) FROM {quoted_name}").fetchone()[0]
             
             result = {
                 'success': True,
@@ -72,6 +73,19 @@ class SQLiteWriter:
             self.logger.error(f"Error escribiendo SQLite: {str(e)}")
             raise
     
+    @staticmethod
+    def _quote_identifier(name: str) -> str:
+        """
+        Entrecomilla un identificador SQLite (evita inyección vía nombre de tabla)
+        
+        Args:
+            name: Nombre de la tabla o columna
+            
+        Returns:
+            Identificador entre comillas dobles
+        """
+        return '"' + str(name).replace('"', '""') + '"'
+    
     def _get_table_info(self, conn: sqlite3.connect, table_name: str) -> Dict[str, Any]:
         """
         Obtiene información de la tabla creada
@@ -86,11 +100,12 @@ class SQLiteWriter:
         try:
             # Obtener schema de la tabla
             cursor = conn.cursor()
-            cursor.execute(f"PRAGMA table_info({table_name})")
+            quoted_name = self._quote_identifier(table_name)
+            cursor.execute(f"PRAGMA table_info({quoted_name})")
             columns_info = cursor.fetchall()
             
             # Obtener estadísticas
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            cursor.execute(f"SELECT COUNT(*) FROM {quoted_name}")
             row_count = cursor.fetchone()[0]
             
             return {
@@ -0,0 +1,31 @@
+"""
+Pruebas del escritor de archivos SQL
+"""
+
+import pandas as pd
+
+from src.writers.sql_writer import SQLWriter
+
+
+def test_batch_insert_quotes_identifiers_with_backticks():
+    df = pd.DataFrame({'id': [1, 2], 'order': ['a', "b'c"], 'co`l': [None, 'x']})
+
+    sql = SQLWriter()._generate_batch_insert(df, 'mi tabla')
+
+    assert sql == (
+        "INSERT INTO `mi tabla` (`id`, `order`, `co``l`) VALUES\n"
+        "    (1, 'a', NULL),\n"
+        "    (2, 'b''c', 'x');"
+    )
+
+
+def test_default_write_matches_create_table_quoting(tmp_path):
+    df = pd.DataFrame({'select': [1], 'nombre': ['Ana']})
+    output_file = tmp_path / 'salida.sql'
+
+    SQLWriter().write(df, str(output_file), 'group')
+    content = output_file.read_text(encoding='utf-8')
+
+    assert "CREATE TABLE IF NOT EXISTS `group` (" in content
+    assert "INSERT INTO `group` (`select`, `nombre`) VALUES\n    (1, 'Ana');" in content
+    assert '"select"' not in content
@@ -10,133 +10,212 @@ a diferentes formatos de base de datos.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from pathlib import Path
-import sys
 import os
 from datetime import datetime
-import json
-try:
-    from src.writers.mysql_writer import MySQLWriter
-    from src.ui.mysql_config import MySQLConfigUI
-    from src.utils.data_integrity import DataIntegrityChecker
-    MYSQL_AVAILABLE = True
-except ImportError as e:
-    print(f"MySQL features not available: {e}")
-    MYSQL_AVAILABLE = False
-    MySQLWriter = None
-    MySQLConfigUI = None
-    DataIntegrityChecker = None
+import re
+import io
+import csv
+import shutil
+import sqlite3
+import importlib.util
+import queue
+import threading
 import time
-import subprocess
-
-# Agregar el directorio src al path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+from collections import Counter, OrderedDict, deque
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 
-from src.core.converter import FileConverter
-from src.readers.robust_access_reader import RobustAccessReader
+from src.core.converter import FileConverter, OUTPUT_EXTENSIONS
+from src.readers.robust_access_reader import ARROW_AVAILABLE
 from src.utils.logger import setup_logger
 from src.utils.config import Config
 
-# Inicializar componentes nuevos solo si están disponibles
-mysql_ui = MySQLConfigUI() if MYSQL_AVAILABLE and MySQLConfigUI else None
-integrity_checker = DataIntegrityChecker() if MYSQL_AVAILABLE and DataIntegrityChecker else None
+def _module_available(name):
+    """Comprueba si un módulo se puede importar sin llegar a importarlo"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+# Las funciones MySQL se importan al primer uso: el conector y SQLAlchemy
+# son pesados y la mayoría de las páginas no los necesitan
+MYSQL_AVAILABLE = all(_module_available(name) for name in ('mysql.connector', 'sqlalchemy'))
+if not MYSQL_AVAILABLE:
+    print("MySQL features not available: mysql-connector-python o sqlalchemy no están instalados")
+
+# Factor de conversión de bytes a MB
+MB_PER_BYTE = 1 / 1048576
+
+# Tipos MIME para descargar archivos de salida
+DOWNLOAD_MIME_TYPES = {
+    ".db": "application/vnd.sqlite3",
+    ".sqlite": "application/vnd.sqlite3",
+    ".csv": "text/csv",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".json": "application/json",
+    ".parquet": "application/vnd.apache.parquet",
+    ".sql": "application/sql"
+}
+
+# Formatos de salida de archivo ofrecidos en la interfaz (Parquet requiere pyarrow)
+OUTPUT_FORMAT_OPTIONS = ["sql", "sqlite", "csv", "excel", "json"] + (["parquet"] if ARROW_AVAILABLE else [])
+
+# Tamaño máximo de un archivo de salida servido por download_button
+MAX_DOWNLOAD_MB = 500
+
+# Filas leídas de cada tabla Access para vistas previas y resumen de tipos
+ACCESS_PREVIEW_ROWS = 50
+
+# Formatos (además de las tablas Access) que el visor lee por páginas
+PAGED_EXTENSIONS = ('.csv', '.xlsx', '.xls')
+
+# Páginas del visor que cada sesión conserva para sí misma, además de la caché compartida
+SESSION_PAGE_CACHE_SIZE = 6
 
-def convert_to_mysql_by_year(file_path, db_config, naming_config):
+# Máximo aproximado de refrescos de una barra de progreso (cada uno viaja por el websocket)
+MAX_PROGRESS_UPDATES = 100
+
+# Conversión por años a MySQL: líneas del registro visible y refresco mínimo por tiempo
+YEAR_LOG_LINES = 50
+YEAR_REFRESH_SECONDS = 2.0
+
+# Tablas leídas de Access por adelantado mientras se suben las anteriores
+YEAR_READ_AHEAD_TABLES = 2
+
+# Tablas cargadas en paralelo por defecto: trabajo limitado por E/S (lectura de
+# Access y red), así que más hilos que núcleos, con un máximo de 8
+YEAR_DEFAULT_WORKERS = min(8, (os.cpu_count() or 2) * 2)
+
+# Segundos durante los que una conversión reutiliza la última prueba de conexión MySQL
+# exitosa (el pool ya valida cada conexión con pool_pre_ping)
+MYSQL_CHECK_MAX_AGE = 12 * 3600
+
+# Caracteres no permitidos en nombres de salida y en nombres de tabla MySQL
+_NAME_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_MYSQL_NAME_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+_MYSQL_NAME_TRANSLATION = str.maketrans({'-': '_', ' ': '_'})
+
+# Columnas del reporte descargable de la conversión multi-tabla
+CONVERSION_REPORT_FIELDS = ['Tabla', 'Estado', 'Filas', 'Columnas', 'Archivo', 'Error']
+
+# Componentes nuevos: una sola instancia por proceso, solo si están disponibles
+@st.cache_resource
+def get_mysql_ui():
+    """Interfaz de configuración MySQL compartida (None si MySQL no está disponible)"""
+    if not MYSQL_AVAILABLE:
+        return None
+    from src.ui.mysql_config import MySQLConfigUI
+    return MySQLConfigUI()
+
+@st.cache_resource
+def get_integrity_checker():
+    """Verificador de integridad compartido (None si no está disponible)"""
+    if not MYSQL_AVAILABLE:
+        return None
+    from src.utils.data_integrity import DataIntegrityChecker
+    return DataIntegrityChecker()
+
+@st.cache_resource(max_entries=4)
+def get_mysql_writer(config_items):
     """
-    Convierte archivos Access por años y los sube directamente a MySQL
+    Writer MySQL compartido por configuración: conserva el pool de conexiones entre reruns
+    
+    Args:
+        config_items: Tupla ordenada con los pares de la configuración de conexión
     """
-    try:
-        # Inicializar writer de MySQL
-        mysql_writer = MySQLWriter(db_config)
-        
-        # Verificar conexión
-        test_result = mysql_writer.test_connection()
-        if not test_result['success']:
-            return {
-                'success': False,
-                'message': f'❌ Error: No se pudo conectar a MySQL - {test_result["message"]}',
-                'details': None
-            }
-        
-        # Inicializar conversor
-        converter = FileConverter()
+    from src.writers.mysql_writer import MySQLWriter
+    return MySQLWriter(dict(config_items))
+
+def mysql_writer_for(db_config):
+    """Writer MySQL cacheado para un dict de configuración"""
+    return get_mysql_writer(tuple(sorted(db_config.items())))
+
+@st.cache_resource
+def get_access_reader():
+    """Reader de Access compartido por todo el proceso y por el conversor (conserva sus caches)"""
+    return get_converter().readers['.mdb']
+
+@st.cache_resource(show_spinner=False)
+def get_access_support():
+    """
+    Resultado de la verificación de soporte para Access, una vez por proceso
+    
+    El reader ya memoriza la comprobación de por vida; como recurso se evita
+    además copiar el dict en cada llamada (solo se lee, no se modifica).
+    """
+    return get_access_reader().check_access_support()
+
+@st.cache_resource
+def get_dependency_status(modules):
+    """
+    Disponibilidad de cada dependencia, comprobada una sola vez por proceso
+    
+    Args:
+        modules: Tupla con los nombres de los módulos a importar
         
-        # Realizar conversión por años usando el método existente
-        result = converter.convert_access_by_year(
-            input_path=file_path,
-            output_format='sql',  # Generar SQL temporalmente
-            output_dir='/tmp',     # Directorio temporal
-            naming_config=naming_config
-        )
+    Returns:
+        Diccionario módulo -> True si se puede importar
+    """
+    status = {}
+    for module in modules:
+        try:
+            __import__(module)
+            status[module] = True
+        except ImportError:
+            status[module] = False
+    return status
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def list_access_tables(file_path, mtime):
+    """
+    Tablas de un archivo Access, cacheadas por ruta y fecha de modificación
+    
+    Args:
+        file_path: Ruta del archivo Access
+        mtime: Fecha de modificación (solo forma parte de la clave de caché)
+    """
+    return get_access_reader().get_table_names(file_path)
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def get_access_year_summary(file_path, mtime):
+    """
+    Resumen de años por tabla de un archivo Access, cacheado por ruta y fecha
+    
+    Args:
+        file_path: Ruta del archivo Access
+        mtime: Fecha de modificación (solo forma parte de la clave de caché)
+    """
+    return get_access_reader().get_year_summary(file_path)
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def get_access_table_sample(file_path, mtime, table_name, nrows=ACCESS_PREVIEW_ROWS):
+    """
+    Muestra y metadatos de una tabla Access, cacheados por ruta, fecha y tabla
+    
+    Args:
+        file_path: Ruta del archivo Access
+        mtime: Fecha de modificación (solo forma parte de la clave de caché)
+        table_name: Nombre de la tabla
+        nrows: Filas a conservar en la muestra
         
-        if result['success']:
-            # Procesar cada archivo generado y subirlo a MySQL
-            uploaded_tables = []
-            failed_tables = []
-            
-            for file_info in result['files_created']:
-                file_path_sql = file_info['path']
-                table_name = Path(file_path_sql).stem
-                
-                try:
-                    # Leer el archivo SQL y ejecutarlo en MySQL
-                    with open(file_path_sql, 'r', encoding='utf-8') as f:
-                        sql_content = f.read()
-                    
-                    # Ejecutar en MySQL
-                    exec_result = mysql_writer.execute_sql(sql_content)
-                    
-                    if exec_result['success']:
-                        uploaded_tables.append({
-                            'name': table_name,
-                            'statements': exec_result['statements_executed']
-                        })
-                    else:
-                        failed_tables.append({
-                            'name': table_name,
-                            'error': exec_result.get('error', 'Error desconocido')
-                        })
-                    
-                    # Limpiar archivo temporal
-                    if os.path.exists(file_path_sql):
-                        os.remove(file_path_sql)
-                        
-                except Exception as table_error:
-                    failed_tables.append({
-                        'name': table_name,
-                        'error': str(table_error)
-                    })
-            
-            if uploaded_tables:
-                return {
-                    'success': True,
-                    'message': f'✅ {len(uploaded_tables)} tablas subidas exitosamente a MySQL',
-                    'details': {
-                        'database': db_config['database'],
-                        'host': db_config['host'],
-                        'tables_uploaded': uploaded_tables,
-                        'tables_failed': failed_tables,
-                        'total_success': len(uploaded_tables),
-                        'total_failed': len(failed_tables)
-                    }
-                }
-            else:
-                return {
-                    'success': False,
-                    'message': f'❌ Error: No se pudo subir ninguna tabla. {len(failed_tables)} errores.',
-                    'details': {'failed_tables': failed_tables}
-                }
-        else:
-            return result
-            
-    except Exception as e:
-        return {
-            'success': False,
-            'message': f'❌ Error durante conversión MySQL: {str(e)}',
-            'details': {'error': str(e)}
-        }
+    Returns:
+        Dict con 'sample', 'rows', 'columns' y 'dtype_counts' (tipos de la muestra)
+    """
+    # Solo se cargan 'nrows' filas; el total se cuenta aparte sin materializar la tabla
+    # Con pyarrow la muestra usa cadenas Arrow en lugar de columnas 'object'
+    metadata = get_access_reader().get_table_metadata(
+        file_path, table_name, nrows, dtype_backend="pyarrow" if ARROW_AVAILABLE else None
+    )
+    dtype_counts = pd.Series(list(metadata['dtypes'].values()), dtype=object).value_counts()
+    return {
+        'sample': metadata['sample'],
+        'rows': metadata['row_count'],
+        'columns': metadata['columns'],
+        'dtype_counts': {dtype: int(count) for dtype, count in dtype_counts.items()}
+    }
 
 # Configurar página con sidebar siempre visible
 st.set_page_config(
@@ -146,8 +225,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# CSS minimalista y moderno
-st.markdown("""
+# CSS minimalista y moderno (constante del módulo: se construye una sola vez)
+APP_CSS = """
 <style>
     /* Diseño minimalista general */
     .main {
@@ -251,7 +330,6 @@ st.markdown("""
         border: 1px solid #f5c6cb;
         margin: 0.5rem 0;
     }
-    }
     
     .info-message {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -283,17 +361,79 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(APP_CSS, unsafe_allow_html=True)
+
+@st.cache_resource
+def get_open_sqlite_connections():
+    """Conexión SQLite vigente por archivo, compartida entre reruns (y su lock)"""
+    return {}, threading.Lock()
+
+@st.cache_resource(max_entries=4)
+def get_sqlite_connection(db_path, mtime):
+    """
+    Conexión SQLite de solo lectura reutilizada entre reruns
+    
+    Al abrir la conexión de una versión nueva del archivo se cierra la de la
+    versión anterior (su entrada de caché ya no se vuelve a pedir).
+    
+    Args:
+        db_path: Ruta de la base de datos
+        mtime: Fecha de modificación (una base reescrita abre conexión nueva)
+    """
+    resolved = Path(db_path).resolve()
+    # as_uri() escapa '?', '#' y '%' de la ruta, que en una URI cambiarían el archivo abierto
+    conn = sqlite3.connect(resolved.as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+    conn.executescript(
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-20000;"
+        "PRAGMA busy_timeout=5000;"
+    )
+    open_connections, lock = get_open_sqlite_connections()
+    with lock:
+        previous = open_connections.get(resolved)
+        open_connections[resolved] = conn
+    if previous is not None:
+        previous.close()
+    return conn
 
-# Configurar logging
-setup_logger(log_level="INFO")
+def quote_sqlite_identifier(name):
+    """Cita un nombre de tabla/columna para SQLite (escapa las comillas dobles)"""
+    return '"' + str(name).replace('"', '""') + '"'
 
-# Inicializar session state
-if 'converter' not in st.session_state:
-    st.session_state.converter = FileConverter()
+@st.cache_data(ttl=300, show_spinner=False)
+def get_sqlite_row_count(db_path, mtime, table_name):
+    """
+    Número de filas de una tabla SQLite (COUNT(*), sin leer la tabla)
+    
+    Args:
+        db_path: Ruta de la base de datos
+        mtime: Fecha de modificación (solo forma parte de la clave de caché)
+        table_name: Nombre de la tabla
+    """
+    conn = get_sqlite_connection(db_path, mtime)
+    return conn.execute(f"SELECT COUNT(*) FROM {quote_sqlite_identifier(table_name)}").fetchone()[0]
+
+@st.cache_resource
+def init_logging():
+    """Configura el logging una sola vez por proceso (no en cada rerun)"""
+    setup_logger(log_level="INFO")
+    return True
+
+@st.cache_resource
+def get_converter():
+    """Conversor compartido por todas las sesiones"""
+    return FileConverter()
+
+@st.cache_resource
+def get_config():
+    """Configuración de la aplicación (carga .env una sola vez)"""
+    return Config()
 
-if 'config' not in st.session_state:
-    st.session_state.config = Config()
+# Configurar logging y configuración
+init_logging()
+get_config()
 
 def main():
     """Función principal de la aplicación"""
@@ -348,80 +488,15 @@ def main():
             st.markdown("---")
             
             # Estado del sistema
-            access_reader = RobustAccessReader()
-            support_info = access_reader.check_access_support()
+            support_info = get_access_support()
             
             if support_info['supported']:
                 st.success("✅ Access disponible")
             else:
                 st.error("❌ Access no disponible")
             
-            # Archivos
-            input_files = get_input_files()
-            output_files = get_output_files()
-            
-            st.markdown(f"**Archivos:** {len(input_files)} entrada, {len(output_files)} salida")
-            
-            st.markdown("---")
-            
-            # Gestión de archivos
-            st.markdown("**🗂️ Gestión de Archivos**")
-            
-            # Eliminar archivos de entrada
-            if input_files:
-                with st.expander("🗑️ Eliminar archivos de entrada"):
-                    for file_info in input_files:
-                        col1, col2 = st.columns([3, 1])
-                        with col1:
-                            st.write(f"📄 {file_info['name']} ({file_info['size']:.1f} MB)")
-                        with col2:
-                            if st.button(f"❌", key=f"del_input_{file_info['name']}"):
-                                try:
-                                    file_path = f"data/input/{file_info['name']}"
-                                    os.remove(file_path)
-                                    st.success(f"✅ {file_info['name']} eliminado")
-                                    st.rerun()
-                                except Exception as e:
-                                    st.error(f"❌ Error eliminando {file_info['name']}: {str(e)}")
-            
-            # Eliminar archivos de salida
-            if output_files:
-                with st.expander("🗑️ Eliminar archivos de salida"):
-                    for file_info in output_files:
-                        col1, col2 = st.columns([3, 1])
-                        with col1:
-                            st.write(f"📄 {file_info['name']} ({file_info['size']:.1f} MB)")
-                        with col2:
-                            if st.button(f"❌", key=f"del_output_{file_info['name']}"):
-                                try:
-                                    file_path = f"data/output/{file_info['name']}"
-                                    os.remove(file_path)
-                                    st.success(f"✅ {file_info['name']} eliminado")
-                                    st.rerun()
-                                except Exception as e:
-                                    st.error(f"❌ Error eliminando {file_info['name']}: {str(e)}")
-            
-            # Eliminar todos los archivos
-            if input_files or output_files:
-                st.markdown("---")
-                if st.button("🗑️ Eliminar todos los archivos", type="secondary", use_container_width=True):
-                    try:
-                        # Eliminar archivos de entrada
-                        for file_info in input_files:
-                            file_path = f"data/input/{file_info['name']}"
-                            if os.path.exists(file_path):
-                                os.remove(file_path)
-                        
-                        # Eliminar archivos de salida
-                        for file_info in output_files:
-                            file_path = f"data/output/{file_info['name']}"
-                            if os.path.exists(file_path):
-                                os.remove(file_path)
-                        
-                        st.success("✅ Todos los archivos eliminados")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"❌ Error eliminando archivos: {str(e)}")
+            # Archivos y gestión de archivos (fragmento independiente)
+            show_file_management()
             
             st.markdown("---")
             
@@ -433,6 +508,7 @@ def main():
             
             if st.button("🧹 Limpiar caché", use_container_width=True):
                 st.session_state.clear()
+                clear_file_cache()
                 st.rerun()
     
     # Navegación de páginas usando session_state
@@ -442,7 +518,7 @@ def main():
     page = st.session_state.page
     
     if page == "🏠 Dashboard":
-        show_dashboard()
+        show_dashboard(get_directory_listing("data/input"), get_directory_listing("data/output"))
     elif page == "📁 Convertir":
         show_converter()
     elif page == "📋 Visualizar":
@@ -457,13 +533,100 @@ def main():
     elif page == "⚙️ Configuración":
         show_configuration()
 
-def show_dashboard():
-    """Dashboard minimalista"""
+@st.fragment
+def show_file_management():
+    """Listado y borrado de archivos del sidebar (fragmento: se re-ejecuta solo)"""
+    # Archivos
+    input_files = get_input_files()
+    output_files = get_output_files()
+    
+    st.markdown(f"**Archivos:** {len(input_files)} entrada, {len(output_files)} salida")
+    
+    st.markdown("---")
+    
+    # Gestión de archivos
+    st.markdown("**🗂️ Gestión de Archivos**")
+    
+    # Eliminar archivos seleccionados (una sola tabla editable en lugar de un botón por archivo).
+    # Un expander cerrado ejecuta igualmente su contenido: el toggle evita construir la tabla
+    if input_files or output_files:
+        if st.toggle("🗑️ Eliminar archivos", key="show_file_management"):
+            all_files = input_files + output_files
+            files_df = pd.DataFrame({
+                'Eliminar': np.zeros(len(all_files), dtype=bool),
+                'Carpeta': ['input'] * len(input_files) + ['output'] * len(output_files),
+                'name': [f['name'] for f in all_files],
+                'size': np.array([f['size'] for f in all_files], dtype=np.float64)
+            })
+            edited_df = st.data_editor(
+                files_df,
+                column_config={
+                    'Eliminar': st.column_config.CheckboxColumn(),
+                    'name': st.column_config.TextColumn("Archivo"),
+                    'size': st.column_config.NumberColumn("MB", format="%.1f")
+                },
+                disabled=['Carpeta', 'name', 'size'],
+                hide_index=True,
+                key="files_to_delete"
+            )
+            
+            selected = edited_df[edited_df['Eliminar']]
+            if st.button("❌ Eliminar seleccionados", disabled=selected.empty, use_container_width=True):
+                errors = []
+                for folder, name in zip(selected['Carpeta'], selected['name']):
+                    try:
+                        os.remove(f"data/{folder}/{name}")
+                    except Exception as e:
+                        errors.append(f"❌ Error eliminando {name}: {str(e)}")
+                
+                clear_file_cache()
+                # Las marcas del editor se refieren a filas de la lista anterior
+                del st.session_state["files_to_delete"]
+                
+                if errors:
+                    for error in errors:
+                        st.error(error)
+                else:
+                    st.rerun(scope="fragment")
+    
+    # Eliminar todos los archivos
+    if input_files or output_files:
+        st.markdown("---")
+        if st.button("🗑️ Eliminar todos los archivos", type="secondary", use_container_width=True):
+            try:
+                # Eliminar archivos de entrada
+                for file_info in input_files:
+                    try:
+                        os.unlink(f"data/input/{file_info['name']}")
+                    except FileNotFoundError:
+                        pass
+                
+                # Eliminar archivos de salida
+                for file_info in output_files:
+                    try:
+                        os.unlink(f"data/output/{file_info['name']}")
+                    except FileNotFoundError:
+                        pass
+                
+                clear_file_cache()
+                st.success("✅ Todos los archivos eliminados")
+                st.rerun()
+            except Exception as e:
+                st.error(f"❌ Error eliminando archivos: {str(e)}")
+
+def show_dashboard(input_listing, output_listing):
+    """
+    Dashboard minimalista
+    
+    Args:
+        input_listing: DirectoryListing de data/input
+        output_listing: DirectoryListing de data/output
+    """
     st.markdown("## Dashboard")
     
     # Métricas simples
-    input_files = get_input_files()
-    output_files = get_output_files()
+    input_files = input_listing.files
+    output_files = output_listing.files
     
     col1, col2, col3 = st.columns(3)
     
@@ -474,8 +637,7 @@ def show_dashboard():
         st.metric("Archivos salida", len(output_files))
     
     with col3:
-        total_size = sum(f['size'] for f in input_files)
-        st.metric("Tamaño total", f"{total_size:.1f} MB")
+        st.metric("Tamaño total", f"{input_listing.total_size:.1f} MB")
     
     # Archivos recientes
     st.markdown("**Archivos recientes:**")
@@ -489,6 +651,376 @@ def show_dashboard():
         st.info("No hay archivos de entrada")
         st.write("Coloca archivos en `data/input/` para comenzar")
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_source_page(file_path, mtime, table_name, offset, limit):
+    """
+    Página de filas de una tabla Access, un CSV o un Excel, cacheada por archivo, tabla y rango
+    
+    Args:
+        file_path: Ruta del archivo
+        mtime: Fecha de modificación (solo forma parte de la clave de caché)
+        table_name: Nombre de la tabla Access (None para CSV y Excel)
+        offset: Primera fila de la página
+        limit: Filas por página
+    """
+    return read_source_page(file_path, table_name, offset, limit)
+
+def read_source_page(file_path, table_name, offset, limit):
+    """Lee una página de la fuente sin caché (también usado por la precarga en segundo plano)"""
+    if table_name:
+        return get_access_reader().read_page(file_path, table_name, offset, limit)
+    return get_converter().readers[Path(file_path).suffix.lower()].read_page(file_path, offset, limit)
+
+@st.cache_resource
+def get_prefetch_pool():
+    """Un único hilo compartido para precargar la página siguiente del visor"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch")
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_csv_top_values(file_path, mtime, column, limit=10):
+    """
+    Valores más frecuentes de una columna de un CSV, agregados sobre todo el archivo
+    
+    Args:
+        file_path: Ruta del archivo CSV
+        mtime: Fecha de modificación (solo forma parte de la clave de caché)
+        column: Nombre de la columna
+        limit: Número de valores a devolver
+    """
+    return get_converter().readers['.csv'].top_values(file_path, column, limit)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_dataframe(file_path, mtime, table_name, max_rows, use_arrow=False):
+    """
+    Carga un archivo completo para el visor, cacheado por archivo y límite
+    
+    Args:
+        file_path: Ruta del archivo
+        mtime: Fecha de modificación (solo forma parte de la clave de caché)
+        table_name: Tabla Access a leer (None para la tabla por defecto)
+        max_rows: Máximo de filas a conservar
+        use_arrow: Usar tipos respaldados por Arrow (requiere pyarrow)
+        
+    Returns:
+        Tupla (DataFrame recortado a max_rows, número de filas original)
+    """
+    file_extension = Path(file_path).suffix.lower()
+    if file_extension in ['.accdb', '.mdb']:
+        if use_arrow and table_name:
+            df = get_access_reader().read_arrow(file_path, table_name)
+        else:
+            df = get_access_reader().read(file_path, table_name)
+    else:
+        # Para otros archivos, usar el converter
+        df = get_converter().readers[file_extension].read(file_path)
+    
+    if use_arrow and not any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes):
+        df = df.convert_dtypes(dtype_backend="pyarrow")
+    
+    return df.head(max_rows), len(df)
+
+def progress_stride(total):
+    """Cada cuántos elementos refrescar el progreso para no superar MAX_PROGRESS_UPDATES"""
+    return max(1, total // MAX_PROGRESS_UPDATES)
+
+def render_file_download(file_path, label):
+    """
+    Botón de descarga de un archivo de salida
+    
+    El archivo se abre en binario (el modo texto corrompe salidas SQLite y
+    Excel). Streamlit guarda la descarga completa en memoria, así que los
+    archivos mayores de MAX_DOWNLOAD_MB se indican por ruta en lugar de servirse.
+    
+    Args:
+        file_path: Ruta del archivo
+        label: Texto del botón
+    """
+    try:
+        size_mb = os.path.getsize(file_path) * MB_PER_BYTE
+    except FileNotFoundError:
+        return
+    
+    if size_mb > MAX_DOWNLOAD_MB:
+        st.warning(
+            f"⚠️ {Path(file_path).name} ocupa {size_mb:,.0f} MB: demasiado para descargarlo desde el navegador. "
+            f"Cópialo desde `{file_path}`."
+        )
+        return
+    
+    with open(file_path, 'rb') as f:
+        st.download_button(
+            label=label,
+            data=f,
+            file_name=Path(file_path).name,
+            mime=DOWNLOAD_MIME_TYPES.get(Path(file_path).suffix.lower(), "application/octet-stream")
+        )
+
+def dataframe_to_arrow(df):
+    """
+    Convierte un DataFrame a tabla Arrow para st.dataframe
+    
+    Args:
+        df: DataFrame a convertir
+        
+    Returns:
+        pyarrow.Table, o el propio DataFrame si pyarrow no está disponible o rechaza algún tipo
+    """
+    if not ARROW_AVAILABLE:
+        return df
+    import pyarrow as pa
+    
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return df
+
+def dataframe_to_csv_bytes(df):
+    """
+    Serializa un DataFrame a CSV UTF-8 para descargas
+    
+    Con pyarrow se escribe directamente a un buffer binario con su escritor
+    CSV en C; sin pyarrow, o si rechaza algún tipo (columnas object mezcladas),
+    se usa to_csv de pandas.
+    
+    Args:
+        df: DataFrame a serializar
+        
+    Returns:
+        Bytes del CSV (con cabecera, sin índice)
+    """
+    if ARROW_AVAILABLE:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        
+        try:
+            buffer = io.BytesIO()
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+            return buffer.getvalue()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+    return df.to_csv(index=False).encode('utf-8')
+
+def build_display_table(columns, dtypes):
+    """
+    Tabla para st.dataframe a partir de columnas paralelas
+    
+    Con pyarrow se entrega una tabla Arrow (el formato que Streamlit envía al
+    navegador), sin construir un DataFrame intermedio.
+    
+    Args:
+        columns: Dict nombre de columna -> lista de valores
+        dtypes: Tipo numpy de las columnas numéricas (el resto se deja como está)
+    """
+    arrays = {
+        name: np.asarray(values, dtype=dtypes[name]) if name in dtypes else values
+        for name, values in columns.items()
+    }
+    if ARROW_AVAILABLE:
+        import pyarrow as pa
+        return pa.table(arrays)
+    return pd.DataFrame(arrays)
+
+def write_dataframe_csv(df, output_file, append=False):
+    """
+    Escribe un DataFrame a un archivo CSV UTF-8
+    
+    Mismo criterio que dataframe_to_csv_bytes: el escritor CSV de pyarrow
+    vuelca directamente al archivo y, si no está disponible o rechaza algún
+    tipo, se usa to_csv de pandas.
+    
+    Args:
+        df: DataFrame a escribir
+        output_file: Ruta del archivo CSV
+        append: Añadir las filas al final del archivo, sin cabecera
+    """
+    if ARROW_AVAILABLE:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            with open(output_file, 'ab' if append else 'wb') as f:
+                pa_csv.write_csv(table, f, write_options=pa_csv.WriteOptions(include_header=not append))
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+    df.to_csv(output_file, mode='a' if append else 'w', header=not append, index=False, encoding='utf-8')
+
+def shrink_dataframe(df):
+    """
+    Reduce la memoria de un DataFrame reduciendo tipos numéricos (sin
+    cambiar ningún valor) y convirtiendo columnas de texto con pocos
+    valores distintos a 'category'
+    
+    Args:
+        df: DataFrame a optimizar
+        
+    Returns:
+        DataFrame con tipos más compactos
+    """
+    # Copia superficial: las columnas reasignadas no tocan el original y el resto no se duplica
+    df = df.copy(deep=False)
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_integer_dtype(series):
+            downcast = 'unsigned' if len(series) and series.min() >= 0 else 'integer'
+            df[col] = pd.to_numeric(series, downcast=downcast)
+        elif pd.api.types.is_float_dtype(series):
+            # float32 guarda unas 7 cifras significativas: solo se reduce si ningún valor cambia
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+            # Las columnas con decimales reales se descartan con una muestra, sin convertir toda la columna
+            head = values[:1000]
+            if not np.array_equal(head, head.astype('float32'), equal_nan=True):
+                continue
+            narrowed = values.astype('float32')
+            if np.array_equal(values, narrowed, equal_nan=True):
+                df[col] = narrowed
+        elif series.dtype == object and len(series):
+            # Descartar con una muestra las columnas casi únicas antes de contar toda la columna
+            head = series.head(1000)
+            if head.nunique() / len(head) >= 0.5 and len(series) > len(head):
+                continue
+            if series.nunique() / len(series) < 0.5:
+                df[col] = series.astype('category')
+    return df
+
+def approx_memory_mb(df, sample_rows=100):
+    """
+    Estima la memoria de un DataFrame sin recorrer todas sus cadenas
+    
+    Las columnas de tipo fijo se miden directamente; las de texto se miden
+    en profundidad sobre las primeras filas y se escalan al total.
+    
+    Args:
+        df: DataFrame a medir
+        sample_rows: Filas usadas para estimar las columnas de texto
+        
+    Returns:
+        Tamaño aproximado en MB
+    """
+    total = df.memory_usage(index=True, deep=False).sum()
+    object_columns = df.select_dtypes(include=['object']).columns
+    if len(object_columns) and len(df):
+        sample = df[object_columns].head(sample_rows)
+        deep = sample.memory_usage(index=False, deep=True).sum()
+        shallow = sample.memory_usage(index=False, deep=False).sum()
+        total += (deep - shallow) / len(sample) * len(df)
+    return total / 1024 / 1024
+
+def describe_columns(df, unique_sample_rows=10000):
+    """
+    Resumen por columna (tipo, valores únicos y nulos) calculado de forma vectorizada
+    
+    Los nulos se cuentan sobre todas las filas; los valores únicos, que
+    requieren hashear cada valor, se estiman con una muestra (una fila de
+    cada N) cuando el DataFrame supera 'unique_sample_rows'.
+    
+    Args:
+        df: DataFrame a describir
+        unique_sample_rows: Filas máximas para contar valores únicos
+        
+    Returns:
+        DataFrame con una fila por columna
+    """
+    nulls = df.isnull().sum()
+    if len(df) > unique_sample_rows:
+        sample = df.iloc[::len(df) // unique_sample_rows].head(unique_sample_rows)
+        unique_label = 'Valores únicos (aprox.)'
+    else:
+        sample = df
+        unique_label = 'Valores únicos'
+    return pd.DataFrame({
+        'Columna': df.columns,
+        'Tipo': df.dtypes.astype(str).values,
+        unique_label: sample.nunique().values,
+        'Valores nulos': nulls.values,
+        'Porcentaje nulos': (nulls.values / max(len(df), 1) * 100).round(1)
+    })
+
+def convert_access_table(converter, file_path, output_dir, output_format, table_name, batch_size, table_index):
+    """
+    Convierte una tabla Access a su propio archivo de salida (sin llamadas a Streamlit)
+    
+    Args:
+        converter: FileConverter compartido
+        file_path: Ruta del archivo Access
+        output_dir: Directorio de salida
+        output_format: Formato de salida
+        table_name: Tabla a convertir
+        batch_size: Tamaño del lote
+        table_index: Posición de la tabla (desde 1) para ordenar los resultados
+        
+    Returns:
+        Dict de resultado de convert_file con 'table_name', 'output_file' y 'table_index'
+    """
+    try:
+        # Generar ruta de salida para esta tabla
+        safe_table_name = re.sub(r'[^\w]+', '_', table_name)
+        output_file = f"{output_dir}/{safe_table_name}{OUTPUT_EXTENSIONS.get(output_format, '.sql')}"
+        
+        result = converter.convert_file(
+            input_path=file_path,
+            output_path=output_file,
+            output_format=output_format,
+            table_name=table_name,
+            batch_size=batch_size
+        )
+        
+        # Agregar información de la tabla al resultado
+        result['table_name'] = table_name
+        result['output_file'] = output_file
+        result['table_index'] = table_index
+        return result
+        
+    except Exception as e:
+        return {
+            'table_name': table_name,
+            'success': False,
+            'error': str(e),
+            'table_index': table_index
+        }
+
+def collect_access_table_samples(file_path, file_mtime):
+    """
+    Muestras de todas las tablas de un archivo Access, obtenidas una vez por rerun
+    
+    Args:
+        file_path: Ruta del archivo Access
+        file_mtime: Fecha de modificación (clave de caché)
+        
+    Returns:
+        Dict {tabla: muestra de get_access_table_sample o {'error': mensaje}}
+    """
+    table_samples = {}
+    for table_name in list_access_tables(file_path, file_mtime):
+        try:
+            table_samples[table_name] = get_access_table_sample(file_path, file_mtime, table_name)
+        except Exception as e:
+            table_samples[table_name] = {'error': str(e)}
+    return table_samples
+
+def render_access_table_info(table_sample):
+    """Muestra filas, columnas, tipos y primeras filas de una tabla Access"""
+    if 'error' in table_sample:
+        st.error(f"❌ Error analizando tabla: {table_sample['error']}")
+        return
+    
+    # Un solo bloque markdown en lugar de un st.write por línea
+    summary = "\n\n".join([
+        f"**Filas:** {table_sample['rows']:,}",
+        f"**Columnas:** {len(table_sample['columns'])}",
+        f"**Nombres:** {', '.join(map(str, table_sample['columns']))}",
+        "**Tipos de datos:**"
+    ])
+    dtype_list = "\n".join(
+        f"- {dtype}: {count}" for dtype, count in table_sample['dtype_counts'].items()
+    )
+    st.markdown(f"{summary}\n{dtype_list}")
+    
+    # Mostrar primeras filas
+    st.write("**Primeras 3 filas:**")
+    st.dataframe(table_sample['sample'].head(3), use_container_width=True)
+
 def show_converter():
     """Interfaz de conversión minimalista"""
     st.markdown("## Convertir Archivos")
@@ -509,8 +1041,15 @@ def show_converter():
             input_dir.mkdir(exist_ok=True)
             
             file_path = input_dir / uploaded_file.name
+            # El uploader conserva los archivos entre reruns: no reescribir si ya está guardado
+            if file_path.exists() and file_path.stat().st_size == uploaded_file.size:
+                continue
+            
+            # Copiar por bloques de 1 MB en lugar de materializar todo el buffer
+            uploaded_file.seek(0)
             with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
+                shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
+            clear_file_cache()
             
             st.success(f"✅ Archivo subido: {uploaded_file.name}")
     
@@ -524,12 +1063,26 @@ def show_converter():
     # Selección de archivo
     st.markdown("**Seleccionar archivo:**")
     
-    file_options = [f"{f['name']} ({f['size']:.1f} MB)" for f in input_files]
-    selected_file = st.selectbox("Archivo:", file_options)
+    selected_index = st.selectbox(
+        "Archivo:",
+        range(len(input_files)),
+        format_func=lambda i: f"{input_files[i]['name']} ({input_files[i]['size']:.1f} MB)"
+    )
     
-    if selected_file:
-        file_name = selected_file.split(" (")[0]
+    if selected_index is not None:
+        file_name = input_files[selected_index]['name']
         file_path = f"data/input/{file_name}"
+        file_mtime = os.path.getmtime(file_path)
+        
+        # Tablas Access: una sola pasada compartida por la información y la configuración
+        table_samples = {}
+        access_error = None
+        if file_name.lower().endswith(('.accdb', '.mdb')):
+            try:
+                with st.spinner("🔍 Analizando archivo Access..."):
+                    table_samples = collect_access_table_samples(file_path, file_mtime)
+            except Exception as e:
+                access_error = str(e)
         
         # Configuración de exportación
         st.markdown("**Configuración de Exportación:**")
@@ -539,7 +1092,7 @@ def show_converter():
         with col1:
             export_formats = st.multiselect(
                 "Formatos de exportación",
-                options=["CSV", "Excel", "JSON", "MySQL"],
+                options=["CSV", "Excel", "JSON", "MySQL"] + (["Parquet"] if ARROW_AVAILABLE else []),
                 default=["CSV"],
                 help="Selecciona uno o más formatos de salida"
             )
@@ -553,6 +1106,7 @@ def show_converter():
         
         # Configuración de nombres si se selecciona algún formato
         naming_config = {}
+        mysql_ui = get_mysql_ui()
         if export_formats:
             with st.expander("🏷️ Personalización de Nombres", expanded=False):
                 if mysql_ui:
@@ -586,30 +1140,19 @@ def show_converter():
             try:
                 # Para archivos Access, mostrar información de tablas disponibles
                 if file_name.lower().endswith(('.accdb', '.mdb')):
-                    from src.readers.robust_access_reader import RobustAccessReader
-                    access_reader = RobustAccessReader()
-                    available_tables = access_reader.get_table_names(file_path)
+                    if access_error:
+                        raise RuntimeError(access_error)
                     
                     st.write(f"Archivo Access detectado")
-                    st.write(f"Tablas disponibles: {len(available_tables)}")
-                    
-                    for i, table in enumerate(available_tables, 1):
-                        with st.expander(f"Tabla {i}: {table}"):
-                            try:
-                                # Leer muestra de la tabla para mostrar información
-                                df_sample = access_reader.read(file_path, table)
-                                st.write(f"Filas: {len(df_sample):,}")
-                                st.write(f"Columnas: {len(df_sample.columns)}")
-                                st.write(f"Columnas: {list(df_sample.columns)}")
-                                
-                                # Mostrar primeras filas
-                                st.write("Primeras 3 filas:")
-                                st.dataframe(df_sample.head(3), use_container_width=True)
-                            except Exception as e:
-                                st.error(f"Error leyendo tabla {table}: {str(e)}")
+                    st.write(f"Tablas disponibles: {len(table_samples)}")
+                    # El detalle de cada tabla se muestra una sola vez, en la sección de configuración
+                    st.write(", ".join(
+                        f"{table} ({sample['rows']:,} filas)" if 'rows' in sample else table
+                        for table, sample in table_samples.items()
+                    ))
                 else:
                     # Para otros archivos, usar el método normal
-                    file_info = st.session_state.converter.get_file_info(file_path)
+                    file_info = get_converter().get_file_info(file_path)
                     
                     col1, col2 = st.columns(2)
                     with col1:
@@ -635,20 +1178,17 @@ def show_converter():
         with col1:
             output_format = st.selectbox(
                 "Formato de salida:",
-                ["sql", "sqlite", "csv", "excel", "json"]
+                OUTPUT_FORMAT_OPTIONS
             )
         
         with col2:
             # Para archivos Access, mostrar información de todas las tablas
             if file_name.lower().endswith(('.accdb', '.mdb')):
                 try:
-                    from src.readers.robust_access_reader import RobustAccessReader
-                    access_reader = RobustAccessReader()
-                    
-                    # Mostrar indicador de carga
-                    with st.spinner("🔍 Analizando archivo Access..."):
-                        available_tables = access_reader.get_table_names(file_path)
+                    if access_error:
+                        raise RuntimeError(access_error)
                     
+                    available_tables = list(table_samples)
                     if available_tables:
                         st.success(f"✅ Archivo Access cargado")
                         st.info(f"📋 {len(available_tables)} tablas detectadas")
@@ -663,22 +1203,7 @@ def show_converter():
                                     st.write(f"**Posición:** {i+1} de {len(available_tables)}")
                                 
                                 with col_info2:
-                                    # Leer muestra de datos para mostrar información
-                                    try:
-                                        with st.spinner(f"Analizando {table_name}..."):
-                                            df_sample = access_reader.read(file_path, table_name)
-                                        
-                                        st.write(f"**Filas:** {len(df_sample):,}")
-                                        st.write(f"**Columnas:** {len(df_sample.columns)}")
-                                        
-                                        # Mostrar tipos de datos
-                                        data_types = df_sample.dtypes.value_counts()
-                                        st.write("**Tipos de datos:**")
-                                        for dtype, count in data_types.items():
-                                            st.write(f"  • {dtype}: {count}")
-                                            
-                                    except Exception as e:
-                                        st.error(f"❌ Error analizando tabla: {str(e)}")
+                                    render_access_table_info(table_samples[table_name])
                         
                         st.success(f"🎯 Se convertirán automáticamente todas las {len(available_tables)} tablas")
                     else:
@@ -733,8 +1258,7 @@ def show_converter():
             
             if is_access_file:
                 # Verificar soporte para Access
-                access_reader = RobustAccessReader()
-                support_info = access_reader.check_access_support()
+                support_info = get_access_support()
                 
                 if not support_info['supported']:
                     st.error("Soporte para Access no disponible")
@@ -742,7 +1266,7 @@ def show_converter():
                     return
                 
                 # Obtener todas las tablas
-                available_tables = access_reader.get_table_names(file_path)
+                available_tables = list_access_tables(file_path, file_mtime)
                 if not available_tables:
                     st.error("No se detectaron tablas en el archivo Access")
                     return
@@ -757,69 +1281,63 @@ def show_converter():
                 
                 status_text.text(f"🔄 Iniciando conversión de {total_tables} tablas...")
                 
-                for i, table_name in enumerate(available_tables):
-                    try:
-                        # Actualizar progreso
-                        progress = (i / total_tables)
-                        progress_bar.progress(progress)
-                        status_text.text(f"📊 Procesando tabla {i+1}/{total_tables}: {table_name}")
-                        
-                        # Generar ruta de salida para esta tabla
-                        safe_table_name = table_name.replace(' ', '_')
-                        if output_format == "sqlite":
-                            output_file = f"{output_dir}/{safe_table_name}.db"
-                        elif output_format == "csv":
-                            output_file = f"{output_dir}/{safe_table_name}.csv"
-                        elif output_format == "excel":
-                            output_file = f"{output_dir}/{safe_table_name}.xlsx"
-                        elif output_format == "json":
-                            output_file = f"{output_dir}/{safe_table_name}.json"
-                        else:
-                            output_file = f"{output_dir}/{safe_table_name}.sql"
-                        
-                        # Realizar conversión de esta tabla
-                        result = st.session_state.converter.convert_file(
-                            input_path=file_path,
-                            output_path=output_file,
-                            output_format=output_format,
-                            table_name=table_name,
-                            batch_size=batch_size
-                        )
-                        
-                        # Agregar información de la tabla al resultado
-                        result['table_name'] = table_name
-                        result['output_file'] = output_file
-                        result['table_index'] = i + 1
-                        all_results.append(result)
-                        
-                    except Exception as e:
-                        error_result = {
-                            'table_name': table_name,
-                            'success': False,
-                            'error': str(e),
-                            'table_index': i + 1
-                        }
-                        all_results.append(error_result)
+                converter = get_converter()
+                
+                def convert_table(i, table_name):
+                    """Convierte una tabla (se ejecuta en un hilo, sin llamadas a Streamlit)"""
+                    return convert_access_table(
+                        converter, file_path, output_dir, output_format, table_name, batch_size, i + 1
+                    )
+                
+                stride = progress_stride(total_tables)
+                
+                def report_progress(completed, result):
+                    all_results.append(result)
+                    if completed % stride == 0 or completed == total_tables:
+                        progress_bar.progress(completed / total_tables)
+                        status_text.text(f"📊 Tablas procesadas {completed}/{total_tables}: {result['table_name']}")
+                
+                if total_tables == 1:
+                    # Una sola tabla: sin coste de crear el pool
+                    report_progress(1, convert_table(0, available_tables[0]))
+                else:
+                    # Las tablas se convierten en paralelo (lectura y escritura son I/O);
+                    # el progreso se actualiza desde el hilo principal a medida que terminan
+                    workers = min(4, os.cpu_count() or 2, total_tables)
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(convert_table, i, table_name)
+                            for i, table_name in enumerate(available_tables)
+                        ]
+                        for completed, future in enumerate(as_completed(futures), 1):
+                            report_progress(completed, future.result())
+                
+                all_results.sort(key=lambda r: r['table_index'])
                 
                 # Completar progreso
                 progress_bar.progress(1.0)
                 status_text.text("✅ Conversión de todas las tablas completada!")
+                clear_file_cache()
                 
                 # Mostrar resultados
                 with results_container:
-                    st.success(f"✅ Conversión completada: {len([r for r in all_results if r.get('success', False)])}/{total_tables} tablas exitosas")
+                    # Resumen de resultados en una sola pasada
+                    successful_count = failed_count = total_rows = 0
+                    for r in all_results:
+                        if r.get('success', False):
+                            successful_count += 1
+                            total_rows += r.get('rows_inserted', 0)
+                        else:
+                            failed_count += 1
                     
-                    # Resumen de resultados
-                    col1, col2, col3 = st.columns(3)
-                    successful_tables = [r for r in all_results if r.get('success', False)]
-                    failed_tables = [r for r in all_results if not r.get('success', False)]
+                    st.success(f"✅ Conversión completada: {successful_count}/{total_tables} tablas exitosas")
                     
+                    col1, col2, col3 = st.columns(3)
                     with col1:
-                        st.metric("Tablas exitosas", len(successful_tables))
+                        st.metric("Tablas exitosas", successful_count)
                     with col2:
-                        st.metric("Tablas fallidas", len(failed_tables))
+                        st.metric("Tablas fallidas", failed_count)
                     with col3:
-                        total_rows = sum(r.get('rows_inserted', 0) for r in successful_tables)
                         st.metric("Total filas", f"{total_rows:,}")
                     
                     # Detalles por tabla
@@ -849,19 +1367,22 @@ def show_converter():
                     
                     # Descargar reporte
                     if all_results:
-                        report_data = []
-                        for result in all_results:
-                            report_data.append({
+                        # Escritura directa con csv (no hace falta un DataFrame para esto)
+                        report_buffer = io.StringIO()
+                        report_writer = csv.DictWriter(report_buffer, fieldnames=CONVERSION_REPORT_FIELDS, lineterminator="\n")
+                        report_writer.writeheader()
+                        report_writer.writerows(
+                            {
                                 'Tabla': result['table_name'],
                                 'Estado': '✅ Exitoso' if result.get('success', False) else '❌ Fallido',
                                 'Filas': result.get('rows_inserted', 0),
                                 'Columnas': result.get('columns', 0),
-                                'Archivo': Path(result.get('output_file', '')).name if result.get('output_file') else '',
+                                'Archivo': Path(result['output_file']).name if result.get('output_file') else '',
                                 'Error': result.get('error', '')
-                            })
-                        
-                        report_df = pd.DataFrame(report_data)
-                        report_csv = report_df.to_csv(index=False)
+                            }
+                            for result in all_results
+                        )
+                        report_csv = report_buffer.getvalue()
                         st.download_button(
                             label="📥 Descargar reporte de conversión",
                             data=report_csv,
@@ -876,31 +1397,33 @@ def show_converter():
                 
                 try:
                     # Generar ruta de salida
-                    if output_format == "sqlite":
-                        output_file = f"{output_dir}/{table_name}.db"
-                    elif output_format == "csv":
-                        output_file = f"{output_dir}/{table_name}.csv"
-                    elif output_format == "excel":
-                        output_file = f"{output_dir}/{table_name}.xlsx"
-                    elif output_format == "json":
-                        output_file = f"{output_dir}/{table_name}.json"
-                    else:
-                        output_file = f"{output_dir}/{table_name}.sql"
+                    output_file = f"{output_dir}/{table_name}{OUTPUT_EXTENSIONS.get(output_format, '.sql')}"
                     
                     status_text.text("Iniciando conversión...")
                     progress_bar.progress(0.25)
                     
-                    # Realizar conversión
-                    result = st.session_state.converter.convert_file(
-                        input_path=file_path,
-                        output_path=output_file,
-                        output_format=output_format,
-                        table_name=table_name,
-                        batch_size=batch_size
-                    )
+                    # Realizar conversión en un hilo aparte y mostrar el tiempo transcurrido
+                    # mientras tanto (el hilo no llama a Streamlit)
+                    start_time = time.time()
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        future = executor.submit(
+                            get_converter().convert_file,
+                            input_path=file_path,
+                            output_path=output_file,
+                            output_format=output_format,
+                            table_name=table_name,
+                            batch_size=batch_size,
+                            preview_rows=100
+                        )
+                        while not wait([future], timeout=0.5).done:
+                            status_text.text(f"Convirtiendo... {time.time() - start_time:.0f} s")
+                        result = future.result()
+                    # Primeras filas de los datos ya leídos (fuera de st.json)
+                    converted_preview = result.pop('preview', None)
                     
                     progress_bar.progress(1.0)
                     status_text.text("Conversión completada!")
+                    clear_file_cache()
                     
                     # Resultados
                     st.success("Conversión exitosa!")
@@ -922,20 +1445,34 @@ def show_converter():
                     with st.expander("Vista previa de datos convertidos"):
                         try:
                             # Leer los datos convertidos
+                            # El total se cuenta en origen; solo se leen las filas de la vista previa
                             if output_format == "sqlite":
-                                import sqlite3
-                                conn = sqlite3.connect(output_file)
-                                df_preview = pd.read_sql(f"SELECT * FROM {table_name} LIMIT 100", conn)
-                                conn.close()
+                                output_mtime = os.path.getmtime(output_file)
+                                conn = get_sqlite_connection(output_file, output_mtime)
+                                # Cursor directo: pd.read_sql añade una capa de adaptación por fila
+                                # SQL estable por tabla (reutiliza la sentencia preparada) y límite como parámetro
+                                cursor = conn.execute(
+                                    f"SELECT * FROM {quote_sqlite_identifier(table_name)} LIMIT ? OFFSET ?", (100, 0)
+                                )
+                                df_preview = pd.DataFrame.from_records(
+                                    cursor.fetchall(), columns=[column[0] for column in cursor.description]
+                                )
+                                preview_total_rows = get_sqlite_row_count(output_file, output_mtime, table_name)
                             else:
-                                # Para archivos de texto (SQL, CSV, JSON), mostrar los primeros datos del archivo original
-                                if file_name.lower().endswith(('.accdb', '.mdb')):
-                                    # Para archivos Access, usar el reader específico
-                                    df_preview = access_reader.read(file_path, table_name)
+                                # Para archivos de texto (SQL, CSV, JSON), mostrar los datos que leyó la conversión
+                                file_suffix = Path(file_path).suffix.lower()
+                                if converted_preview is not None:
+                                    df_preview = converted_preview
+                                    preview_total_rows = result.get('validation', {}).get('rows', len(df_preview))
+                                elif file_suffix == '.csv':
+                                    csv_reader = get_converter().readers['.csv']
+                                    df_preview = csv_reader.read_page(file_path, 0, 100)
+                                    preview_total_rows = csv_reader.count_rows(file_path)
                                 else:
                                     # Para otros archivos
-                                    df_preview = st.session_state.converter.readers[Path(file_path).suffix].read(file_path)
-                                df_preview = df_preview.head(100)
+                                    df_preview = get_converter().readers[file_suffix].read(file_path)
+                                    preview_total_rows = len(df_preview)
+                                    df_preview = df_preview.head(100)
                             
                             st.write(f"**Vista previa de {len(df_preview)} filas:**")
                             st.dataframe(df_preview, use_container_width=True)
@@ -943,36 +1480,22 @@ def show_converter():
                             # Estadísticas de la tabla
                             col1, col2, col3 = st.columns(3)
                             with col1:
-                                st.metric("Filas totales", f"{len(df_preview):,}")
+                                st.metric("Filas totales", f"{preview_total_rows:,}")
                             with col2:
                                 st.metric("Columnas", len(df_preview.columns))
                             with col3:
-                                st.metric("Tamaño en memoria", f"{df_preview.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB")
+                                st.metric("Tamaño en memoria", f"{approx_memory_mb(df_preview):.2f} MB")
                             
                             # Información de columnas
                             st.write("**Información de columnas:**")
-                            column_info = pd.DataFrame({
-                                'Columna': df_preview.columns,
-                                'Tipo': df_preview.dtypes.astype(str),
-                                'Valores únicos': [df_preview[col].nunique() for col in df_preview.columns],
-                                'Valores nulos': df_preview.isnull().sum()
-                            })
-                            st.dataframe(column_info, use_container_width=True)
+                            column_info = describe_columns(df_preview).drop(columns=['Porcentaje nulos'])
+                            st.dataframe(column_info, use_container_width=True, hide_index=True)
                             
                         except Exception as e:
                             st.error(f"Error mostrando vista previa: {str(e)}")
                     
                     # Descargar archivo
-                    if os.path.exists(output_file):
-                        with open(output_file, 'r') as f:
-                            file_content = f.read()
-                        
-                        st.download_button(
-                            label=f"📥 Descargar {Path(output_file).name}",
-                            data=file_content,
-                            file_name=Path(output_file).name,
-                            mime="text/plain"
-                        )
+                    render_file_download(output_file, f"📥 Descargar {Path(output_file).name}")
                 
                 except Exception as e:
                     progress_bar.progress(0)
@@ -989,6 +1512,297 @@ def show_converter():
                         4. **Usa mdb-tools**: Ejecuta el script de conversión automática
                         """)
 
+def render_data_stats(df, total_rows, paged_source):
+    """
+    Estadísticas, información de columnas y gráficos del visor de datos
+    
+    Args:
+        df: DataFrame completo, o la página actual si la fuente es paginada
+        total_rows: Filas totales de la fuente
+        paged_source: Fuente paginada activa (None si el DataFrame está en memoria)
+    """
+    # Import diferido: plotly es pesado y solo lo usan las páginas con gráficos
+    import plotly.graph_objects as go
+    
+    st.markdown("### 📊 Estadísticas")
+    if paged_source:
+        st.caption("Calculadas sobre la página actual")
+    # La tabla completa solo se describe una vez por carga
+    if paged_source:
+        column_info = describe_columns(df)
+    else:
+        if st.session_state.get('column_info') is None:
+            st.session_state.column_info = describe_columns(df)
+        column_info = st.session_state.column_info
+    
+    exact_memory = st.checkbox(
+        "Cálculo exacto",
+        value=False,
+        help="Mide la memoria recorriendo todas las cadenas (lento en tablas grandes)"
+    )
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Filas totales", f"{total_rows:,}")
+    with col2:
+        st.metric("Columnas", len(df.columns))
+    with col3:
+        if exact_memory and paged_source:
+            memory_mb = df.memory_usage(deep=True).sum() * MB_PER_BYTE
+        elif exact_memory:
+            # Como column_info: la pasada completa se hace una vez por carga
+            if st.session_state.get('memory_mb_exact') is None:
+                st.session_state.memory_mb_exact = df.memory_usage(deep=True).sum() * MB_PER_BYTE
+            memory_mb = st.session_state.memory_mb_exact
+        else:
+            memory_mb = approx_memory_mb(df)
+        st.metric("Tamaño en memoria", f"{memory_mb:.2f} MB")
+    with col4:
+        st.metric("Valores nulos", f"{column_info['Valores nulos'].sum():,}")
+    
+    # Información de columnas
+    st.markdown("#### 📋 Información de Columnas")
+    st.dataframe(
+        column_info,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Porcentaje nulos': st.column_config.NumberColumn(format="%.1f%%")
+        }
+    )
+    
+    # Gráficos de distribución (usando muestra para archivos grandes)
+    st.markdown("#### 📈 Distribución de Datos")
+    
+    # Usar muestra para gráficos si el archivo es muy grande
+    # (la muestra de la tabla completa se toma una sola vez por carga)
+    if paged_source:
+        df_sample = df
+    else:
+        random_sample = st.checkbox(
+            "Muestra aleatoria",
+            value=False,
+            help="Por defecto se toma una fila de cada N (más rápido en tablas grandes)"
+        )
+        if st.session_state.get('df_sample') is None or st.session_state.get('df_sample_random') != random_sample:
+            sample_size = 10000
+            if len(df) <= sample_size:
+                df_sample = df
+            elif random_sample:
+                df_sample = df.sample(n=sample_size, random_state=42)
+            else:
+                df_sample = df.iloc[::len(df) // sample_size].head(sample_size)
+            st.session_state.df_sample = df_sample
+            st.session_state.df_sample_random = random_sample
+        df_sample = st.session_state.df_sample
+    
+    # Seleccionar columna para gráfico
+    # Por dtype (no select_dtypes) para reconocer también tipos Arrow
+    numeric_columns = [
+        col for col, dtype in df.dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    ]
+    categorical_columns = [
+        col for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(dtype)
+    ]
+    
+    if numeric_columns:
+        selected_numeric = st.selectbox("Columna numérica para histograma:", numeric_columns)
+        if selected_numeric:
+            # Los intervalos se calculan aquí: al navegador solo llegan 50 barras
+            values = pd.to_numeric(df_sample[selected_numeric], errors='coerce').dropna().to_numpy(dtype=float)
+            if len(values):
+                counts, edges = np.histogram(values, bins=50)
+                fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+                fig.update_layout(title=f"Distribución de {selected_numeric} (muestra de {len(df_sample):,} filas)", bargap=0)
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info(f"La columna {selected_numeric} no tiene valores numéricos")
+    
+    if categorical_columns:
+        selected_cat = st.selectbox("Columna categórica para gráfico de barras:", categorical_columns)
+        if selected_cat:
+            if paged_source and Path(paged_source['path']).suffix.lower() == '.csv':
+                # CSV paginado: agregación sobre el archivo, sin cargarlo
+                value_counts = get_csv_top_values(paged_source['path'], paged_source['mtime'], selected_cat)
+                title = f"Top 10 valores en {selected_cat} (archivo completo)"
+            else:
+                value_counts = df_sample[selected_cat].value_counts(sort=False).nlargest(10)
+                title = f"Top 10 valores en {selected_cat} (muestra de {len(df_sample):,} filas)"
+            fig = go.Figure(go.Bar(x=value_counts.index.astype(str), y=value_counts.values))
+            fig.update_layout(title=title)
+            st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def render_data_page(file_name, page_size, show_stats):
+    """
+    Navegación y tabla de la página actual de una fuente paginada del visor
+    
+    Es un fragmento: cambiar de página solo vuelve a ejecutar este bloque,
+    no toda la página (barra lateral, selección de archivo...).
+    
+    Args:
+        file_name: Nombre del archivo visualizado
+        page_size: Filas por página
+        show_stats: Mostrar estadísticas de la página actual
+    """
+    paged_source = st.session_state.paged_source
+    total_rows = st.session_state.total_rows
+    total_pages = max(1, (total_rows + page_size - 1) // page_size)
+    st.session_state.current_page = min(st.session_state.current_page, total_pages - 1)
+    
+    # Los callbacks se ejecutan antes del rerun del fragmento, así que la
+    # página y el selector quedan sincronizados sin st.rerun() adicional
+    def go_to_page(page):
+        st.session_state.current_page = page
+        st.session_state.page_selector = page + 1
+    
+    def on_page_selected():
+        st.session_state.current_page = st.session_state.page_selector - 1
+    
+    if st.session_state.get('page_selector') != st.session_state.current_page + 1:
+        st.session_state.page_selector = st.session_state.current_page + 1
+    
+    col1, col2, col3 = st.columns([2, 1, 2])
+    
+    with col1:
+        st.write(f"**Página {st.session_state.current_page + 1} de {total_pages}**")
+        st.write(f"**Mostrando filas {st.session_state.current_page * page_size + 1} - {min((st.session_state.current_page + 1) * page_size, total_rows)} de {total_rows:,}**")
+    
+    with col2:
+        st.button(
+            "⬅️ Anterior",
+            disabled=st.session_state.current_page == 0,
+            on_click=go_to_page,
+            args=(max(0, st.session_state.current_page - 1),)
+        )
+    
+    with col3:
+        st.button(
+            "➡️ Siguiente",
+            disabled=st.session_state.current_page >= total_pages - 1,
+            on_click=go_to_page,
+            args=(min(total_pages - 1, st.session_state.current_page + 1),)
+        )
+    
+    # Navegación rápida
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col1:
+        st.button(
+            "⏮️ Primera",
+            disabled=st.session_state.current_page == 0,
+            on_click=go_to_page,
+            args=(0,)
+        )
+    
+    with col2:
+        # Selector de página: un entero en lugar de una opción por página
+        st.number_input(
+            "Ir a página:",
+            min_value=1,
+            max_value=total_pages,
+            step=1,
+            key="page_selector",
+            on_change=on_page_selected
+        )
+    
+    with col3:
+        st.button(
+            "⏭️ Última",
+            disabled=st.session_state.current_page >= total_pages - 1,
+            on_click=go_to_page,
+            args=(total_pages - 1,)
+        )
+    
+    # Mostrar datos de la página actual
+    start_idx = st.session_state.current_page * page_size
+    end_idx = min(start_idx + page_size, total_rows)
+    page_key = (paged_source['path'], paged_source['mtime'], paged_source['table'], start_idx, end_idx - start_idx)
+    prefetched = st.session_state.get('prefetched_page')
+    # Las últimas páginas de esta sesión: otros usuarios no pueden desalojarlas
+    # de la caché compartida de get_source_page (max_entries es global)
+    page_cache = st.session_state.setdefault('page_cache', OrderedDict())
+    df_page = page_cache.get(page_key)
+    if df_page is not None:
+        page_cache.move_to_end(page_key)
+    elif prefetched is not None and prefetched[0] == page_key:
+        # La página se pidió en segundo plano al mostrar la anterior: se espera a esa lectura
+        try:
+            df_page = prefetched[1].result()
+        except Exception:
+            # Si la precarga falló, se lee de nuevo de forma normal
+            df_page = None
+    if df_page is None:
+        df_page = get_source_page(*page_key)
+    page_cache[page_key] = df_page
+    while len(page_cache) > SESSION_PAGE_CACHE_SIZE:
+        page_cache.popitem(last=False)
+    
+    # Precargar la página siguiente mientras el usuario lee esta
+    next_start = end_idx
+    if next_start < total_rows:
+        next_key = (paged_source['path'], paged_source['mtime'], paged_source['table'],
+                    next_start, min(page_size, total_rows - next_start))
+        if prefetched is None or prefetched[0] != next_key:
+            st.session_state.prefetched_page = (
+                next_key,
+                get_prefetch_pool().submit(read_source_page, next_key[0], next_key[2], next_key[3], next_key[4])
+            )
+    
+    st.dataframe(df_page, use_container_width=True)
+    
+    # Barra de progreso de paginación
+    progress = (st.session_state.current_page + 1) / total_pages
+    st.progress(progress, text=f"Página {st.session_state.current_page + 1} de {total_pages}")
+    
+    # Descargar solo la página actual
+    csv_page = dataframe_to_csv_bytes(df_page)
+    st.download_button(
+        label="📥 Descargar página actual",
+        data=csv_page,
+        file_name=f"{Path(file_name).stem}_pagina_{st.session_state.current_page + 1}.csv",
+        mime="text/csv; charset=utf-8"
+    )
+    
+    # Sin tabla completa en memoria: las estadísticas son de la página
+    if show_stats:
+        render_data_stats(df_page, total_rows, paged_source)
+
+@st.fragment
+def render_loaded_data(file_name, show_stats):
+    """
+    Tabla, estadísticas y descarga de un DataFrame cargado en memoria
+    
+    Es un fragmento: los controles de las estadísticas (columna del
+    histograma, muestra...) solo vuelven a ejecutar este bloque.
+    
+    Args:
+        file_name: Nombre del archivo visualizado
+        show_stats: Mostrar estadísticas
+    """
+    # En memoria: st.dataframe virtualiza las filas, no hace falta paginar
+    df = st.session_state.df_data
+    # La tabla Arrow se construye una vez por carga: los reruns no reconvierten el DataFrame
+    if st.session_state.get('arrow_table') is None:
+        st.session_state.arrow_table = dataframe_to_arrow(df)
+    st.dataframe(st.session_state.arrow_table, height=500, use_container_width=True)
+    st.caption(f"{st.session_state.total_rows:,} filas")
+    
+    if show_stats:
+        render_data_stats(df, st.session_state.total_rows, None)
+    
+    # Se serializa una vez por carga, no en cada rerun
+    if st.session_state.get('csv_bytes') is None:
+        st.session_state.csv_bytes = dataframe_to_csv_bytes(df)
+    st.download_button(
+        label="📥 Descargar CSV completo",
+        data=st.session_state.csv_bytes,
+        file_name=f"{Path(file_name).stem}_datos.csv",
+        mime="text/csv; charset=utf-8"
+    )
+
 def show_data_viewer():
     """Página para visualizar datos de archivos con paginación"""
     st.markdown("## 📊 Visualizar Datos con Paginación")
@@ -1002,20 +1816,21 @@ def show_data_viewer():
     # Selección de archivo
     st.markdown("### 📂 Seleccionar Archivo para Visualizar")
     
-    file_options = [f"{f['name']} ({f['size']:.2f} MB)" for f in input_files]
-    selected_file = st.selectbox("Archivo a visualizar:", file_options)
+    selected_index = st.selectbox(
+        "Archivo a visualizar:",
+        range(len(input_files)),
+        format_func=lambda i: f"{input_files[i]['name']} ({input_files[i]['size']:.2f} MB)"
+    )
     
-    if selected_file:
-        file_name = selected_file.split(" (")[0]
+    if selected_index is not None:
+        file_name = input_files[selected_index]['name']
         file_path = f"data/input/{file_name}"
         
         # Para archivos Access, mostrar selector de tablas
         selected_table = None
         if file_name.lower().endswith(('.accdb', '.mdb')):
             try:
-                from src.readers.robust_access_reader import RobustAccessReader
-                access_reader = RobustAccessReader()
-                available_tables = access_reader.get_table_names(file_path)
+                available_tables = list_access_tables(file_path, os.path.getmtime(file_path))
                 
                 if available_tables:
                     st.markdown("### 📋 Tablas Disponibles")
@@ -1045,7 +1860,7 @@ def show_data_viewer():
                 max_value=1000,
                 value=100,
                 step=10,
-                help="Número de filas a mostrar por página"
+                help="Número de filas por página (tablas Access y CSV, que se leen por páginas)"
             )
         
         with col2:
@@ -1060,6 +1875,18 @@ def show_data_viewer():
         
         with col3:
             show_stats = st.checkbox("Mostrar estadísticas", value=True)
+            use_arrow = st.checkbox(
+                "Backend Arrow",
+                value=False,
+                disabled=not ARROW_AVAILABLE,
+                help="Guarda los datos con tipos Arrow (menos memoria en columnas de texto)" if ARROW_AVAILABLE else "Requiere instalar pyarrow"
+            )
+            optimize_memory = st.checkbox(
+                "Optimizar memoria",
+                value=True,
+                disabled=use_arrow,
+                help="Reduce tipos numéricos y convierte texto repetido a categorías"
+            )
         
         # Inicializar session state para paginación
         if 'current_page' not in st.session_state:
@@ -1070,6 +1897,8 @@ def show_data_viewer():
             st.session_state.df_loaded = False
         if 'df_data' not in st.session_state:
             st.session_state.df_data = None
+        if 'paged_source' not in st.session_state:
+            st.session_state.paged_source = None
         
         # Botón para cargar datos
         if st.button("📊 Cargar Datos", type="primary"):
@@ -1078,173 +1907,78 @@ def show_data_viewer():
                     # Leer archivo
                     file_extension = Path(file_name).suffix.lower()
                     
-                    if file_extension in ['.accdb', '.mdb']:
-                        # Para archivos Access, usar el reader robusto
-                        from src.readers.robust_access_reader import RobustAccessReader
-                        reader = RobustAccessReader()
-                        if selected_table:
-                            df = reader.read(file_path, selected_table)
+                    if (file_extension in ['.accdb', '.mdb'] and selected_table) or file_extension in PAGED_EXTENSIONS:
+                        # Tablas Access, CSV y Excel: solo se cuenta; cada página se lee al mostrarla
+                        if file_extension in PAGED_EXTENSIONS:
+                            total_rows = get_converter().readers[file_extension].count_rows(file_path)
                         else:
-                            df = reader.read(file_path)
+                            total_rows = get_access_reader().count_rows(file_path, selected_table)
+                        if total_rows > max_total_rows:
+                            st.warning(f"⚠️ Tabla muy grande ({total_rows:,} filas). Mostrando solo las primeras {max_total_rows:,} filas.")
+                            total_rows = max_total_rows
+                        
+                        st.session_state.paged_source = {
+                            'path': file_path,
+                            'mtime': os.path.getmtime(file_path),
+                            'table': selected_table
+                        }
+                        st.session_state.df_data = None
+                        st.session_state.column_info = None
+                        st.session_state.memory_mb_exact = None
+                        st.session_state.arrow_table = None
+                        st.session_state.df_sample = None
+                        st.session_state.csv_bytes = None
+                        st.session_state.total_rows = total_rows
+                        st.session_state.current_page = 0
+                        st.session_state.df_loaded = True
+                        
+                        st.success(f"✅ Tabla lista: {total_rows:,} filas (se leen por páginas)")
                     else:
-                        # Para otros archivos, usar el converter
-                        df = st.session_state.converter.readers[file_extension].read(file_path)
-                    
-                    # Limitar filas totales para archivos muy grandes
-                    if len(df) > max_total_rows:
-                        st.warning(f"⚠️ Archivo muy grande ({len(df):,} filas). Mostrando solo las primeras {max_total_rows:,} filas.")
-                        df = df.head(max_total_rows)
-                    
-                    # Guardar en session state
-                    st.session_state.df_data = df
-                    st.session_state.total_rows = len(df)
-                    st.session_state.current_page = 0
-                    st.session_state.df_loaded = True
-                    
-                    st.success(f"✅ Datos cargados: {len(df):,} filas, {len(df.columns)} columnas")
+                        df, original_rows = load_dataframe(
+                            file_path, os.path.getmtime(file_path), selected_table, max_total_rows, use_arrow
+                        )
+                        
+                        # Avisar si el archivo se recortó
+                        if original_rows > max_total_rows:
+                            st.warning(f"⚠️ Archivo muy grande ({original_rows:,} filas). Mostrando solo las primeras {max_total_rows:,} filas.")
+                        
+                        # Los tipos Arrow ya son compactos
+                        if optimize_memory and not use_arrow:
+                            df = shrink_dataframe(df)
+                        
+                        # Guardar en session state
+                        st.session_state.paged_source = None
+                        st.session_state.df_data = df
+                        st.session_state.column_info = None
+                        st.session_state.memory_mb_exact = None
+                        st.session_state.arrow_table = None
+                        st.session_state.df_sample = None
+                        st.session_state.csv_bytes = None
+                        st.session_state.total_rows = len(df)
+                        st.session_state.current_page = 0
+                        st.session_state.df_loaded = True
+                        
+                        st.success(f"✅ Datos cargados: {len(df):,} filas, {len(df.columns)} columnas")
                     
                 except Exception as e:
                     st.error(f"❌ Error cargando datos: {str(e)}")
         
         # Mostrar datos con paginación
-        if st.session_state.df_loaded and st.session_state.df_data is not None:
-            df = st.session_state.df_data
-            total_rows = st.session_state.total_rows
-            total_pages = (total_rows + page_size - 1) // page_size
-            
-            # Información de paginación
+        paged_source = st.session_state.paged_source
+        if st.session_state.df_loaded and (st.session_state.df_data is not None or paged_source):
             st.markdown("### 📋 Vista de Datos")
             
-            col1, col2, col3 = st.columns([2, 1, 2])
-            
-            with col1:
-                st.write(f"**Página {st.session_state.current_page + 1} de {total_pages}**")
-                st.write(f"**Mostrando filas {st.session_state.current_page * page_size + 1} - {min((st.session_state.current_page + 1) * page_size, total_rows)} de {total_rows:,}**")
-            
-            with col2:
-                if st.button("⬅️ Anterior", disabled=st.session_state.current_page == 0):
-                    st.session_state.current_page = max(0, st.session_state.current_page - 1)
-                    st.rerun()
-            
-            with col3:
-                if st.button("➡️ Siguiente", disabled=st.session_state.current_page >= total_pages - 1):
-                    st.session_state.current_page = min(total_pages - 1, st.session_state.current_page + 1)
-                    st.rerun()
-            
-            # Navegación rápida
-            col1, col2, col3 = st.columns([1, 2, 1])
-            
-            with col1:
-                if st.button("⏮️ Primera", disabled=st.session_state.current_page == 0):
-                    st.session_state.current_page = 0
-                    st.rerun()
-            
-            with col2:
-                # Selector de página
-                page_options = list(range(1, total_pages + 1))
-                selected_page = st.selectbox(
-                    "Ir a página:",
-                    page_options,
-                    index=st.session_state.current_page,
-                    key="page_selector"
-                )
-                if selected_page != st.session_state.current_page + 1:
-                    st.session_state.current_page = selected_page - 1
-                    st.rerun()
-            
-            with col3:
-                if st.button("⏭️ Última", disabled=st.session_state.current_page >= total_pages - 1):
-                    st.session_state.current_page = total_pages - 1
-                    st.rerun()
-            
-            # Mostrar datos de la página actual
-            start_idx = st.session_state.current_page * page_size
-            end_idx = min(start_idx + page_size, total_rows)
-            df_page = df.iloc[start_idx:end_idx]
-            
-            st.dataframe(df_page, use_container_width=True)
-            
-            # Barra de progreso de paginación
-            progress = (st.session_state.current_page + 1) / total_pages
-            st.progress(progress, text=f"Página {st.session_state.current_page + 1} de {total_pages}")
-            
-            # Estadísticas
-            if show_stats:
-                st.markdown("### 📊 Estadísticas")
-                
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Filas totales", f"{total_rows:,}")
-                with col2:
-                    st.metric("Columnas", len(df.columns))
-                with col3:
-                    st.metric("Tamaño en memoria", f"{df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB")
-                with col4:
-                    st.metric("Valores nulos", f"{df.isnull().sum().sum():,}")
-                
-                # Información de columnas
-                st.markdown("#### 📋 Información de Columnas")
-                column_info = pd.DataFrame({
-                    'Columna': df.columns,
-                    'Tipo': df.dtypes.astype(str),
-                    'Valores únicos': [df[col].nunique() for col in df.columns],
-                    'Valores nulos': df.isnull().sum(),
-                    'Porcentaje nulos': [f"{(df[col].isnull().sum() / len(df) * 100):.1f}%" for col in df.columns]
-                })
-                st.dataframe(column_info, use_container_width=True)
-                
-                # Gráficos de distribución (usando muestra para archivos grandes)
-                st.markdown("#### 📈 Distribución de Datos")
-                
-                # Usar muestra para gráficos si el archivo es muy grande
-                sample_size = min(10000, len(df))
-                df_sample = df.sample(n=sample_size, random_state=42) if len(df) > sample_size else df
-                
-                # Seleccionar columna para gráfico
-                numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
-                categorical_columns = df.select_dtypes(include=['object']).columns.tolist()
-                
-                if numeric_columns:
-                    selected_numeric = st.selectbox("Columna numérica para histograma:", numeric_columns)
-                    if selected_numeric:
-                        fig = px.histogram(df_sample, x=selected_numeric, title=f"Distribución de {selected_numeric} (muestra de {len(df_sample):,} filas)")
-                        st.plotly_chart(fig, use_container_width=True)
-                
-                if categorical_columns:
-                    selected_cat = st.selectbox("Columna categórica para gráfico de barras:", categorical_columns)
-                    if selected_cat:
-                        value_counts = df_sample[selected_cat].value_counts().head(10)
-                        fig = px.bar(x=value_counts.index, y=value_counts.values, 
-                                   title=f"Top 10 valores en {selected_cat} (muestra de {len(df_sample):,} filas)")
-                        st.plotly_chart(fig, use_container_width=True)
-            
-            # Descargar datos como CSV
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                csv_data = df.to_csv(index=False)
-                st.download_button(
-                    label="📥 Descargar CSV completo",
-                    data=csv_data,
-                    file_name=f"{Path(file_name).stem}_datos.csv",
-                    mime="text/csv"
-                )
-            
-            with col2:
-                # Descargar solo la página actual
-                csv_page = df_page.to_csv(index=False)
-                st.download_button(
-                    label="📥 Descargar página actual",
-                    data=csv_page,
-                    file_name=f"{Path(file_name).stem}_pagina_{st.session_state.current_page + 1}.csv",
-                    mime="text/csv"
-                )
+            if paged_source:
+                render_data_page(file_name, page_size, show_stats)
+            else:
+                render_loaded_data(file_name, show_stats)
 
 def show_results():
     """Página de resultados"""
     st.markdown("## 📊 Resultados")
     
-    output_files = get_output_files()
+    output_listing = get_directory_listing("data/output")
+    output_files = output_listing.files
     
     if not output_files:
         st.info("📁 No hay archivos de salida disponibles")
@@ -1254,7 +1988,7 @@ def show_results():
     col1, col2, col3 = st.columns(3)
     
     total_files = len(output_files)
-    total_size = sum(f['size'] for f in output_files)
+    total_size = output_listing.total_size
     
     with col1:
         st.metric("Archivos generados", total_files)
@@ -1277,15 +2011,7 @@ def show_results():
             
             with col2:
                 if st.button(f"📥 Descargar", key=f"download_{file_info['name']}"):
-                    file_path = f"data/output/{file_info['name']}"
-                    if os.path.exists(file_path):
-                        with open(file_path, 'r') as f:
-                            st.download_button(
-                                label="Descargar archivo",
-                                data=f.read(),
-                                file_name=file_info['name'],
-                                mime="text/plain"
-                            )
+                    render_file_download(f"data/output/{file_info['name']}", "Descargar archivo")
 
 def show_configuration():
     """Página de configuración"""
@@ -1303,25 +2029,20 @@ def show_configuration():
         "streamlit": "Interfaz web"
     }
     
+    dependency_status = get_dependency_status(tuple(dependencies))
     for dep, description in dependencies.items():
-        try:
-            __import__(dep)
+        if dependency_status[dep]:
             st.success(f"✅ {dep} - {description}")
-        except ImportError:
+        else:
             st.error(f"❌ {dep} - {description}")
     
     # Verificar herramientas del sistema
     st.markdown("#### 🛠️ Herramientas del Sistema")
     
     # Verificar mdb-tools
-    try:
-        result = subprocess.run(['mdb-tables', '--version'], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            st.success("✅ mdb-tools - Conversión de Access")
-        else:
-            st.warning("⚠️ mdb-tools - No disponible")
-    except:
+    if 'mdb-tools' in get_access_support()['supported_methods']:
+        st.success("✅ mdb-tools - Conversión de Access")
+    else:
         st.warning("⚠️ mdb-tools - No instalado")
     
     # Configuración de archivos
@@ -1344,6 +2065,30 @@ def show_configuration():
             default=[".csv", ".xlsx", ".xls", ".json", ".accdb", ".mdb"]
         )
 
+@lru_cache(maxsize=256)
+def year_preview_base(year_prefix, year_suffix, lowercase, example_name="ejemplo_tabla", preview_year=2008):
+    """
+    Nombre de ejemplo (sin timestamp ni extensión) para la vista previa de la conversión por años
+    
+    Args:
+        year_prefix: Prefijo personalizado (admite {year})
+        year_suffix: Sufijo personalizado (admite {year})
+        lowercase: Convertir el nombre de la tabla a minúsculas
+        example_name: Nombre de tabla de ejemplo
+        preview_year: Año de ejemplo
+    """
+    preview_base = example_name.lower() if lowercase else example_name
+    
+    if year_prefix:
+        preview_base = f"{year_prefix.replace('{year}', str(preview_year))}{preview_base}"
+    else:
+        preview_base = f"{preview_base}-{preview_year}"
+    
+    if year_suffix:
+        preview_base = f"{preview_base}{year_suffix.replace('{year}', str(preview_year))}"
+    
+    return preview_base
+
 def show_year_conversion():
     """Página de conversión por años"""
     st.markdown("## 📅 Conversión por Años")
@@ -1361,18 +2106,21 @@ def show_year_conversion():
     # Selección de archivo
     st.markdown("### 📁 Seleccionar Archivo Access")
     
-    file_options = [f"{f['name']} ({f['size']:.1f} MB)" for f in access_files]
-    selected_file = st.selectbox("Archivo Access:", file_options)
+    selected_index = st.selectbox(
+        "Archivo Access:",
+        range(len(access_files)),
+        format_func=lambda i: f"{access_files[i]['name']} ({access_files[i]['size']:.1f} MB)"
+    )
     
-    if selected_file:
-        file_name = selected_file.split(" (")[0]
+    if selected_index is not None:
+        file_name = access_files[selected_index]['name']
         file_path = f"data/input/{file_name}"
         
         # Mostrar información del archivo
         with st.expander("📊 Información del Archivo"):
             try:
-                access_reader = RobustAccessReader()
-                year_summary = access_reader.get_year_summary(file_path)
+                # Resumen cacheado por fecha de modificación (no se recalcula en cada rerun)
+                year_summary = get_access_year_summary(file_path, os.path.getmtime(file_path))
                 
                 if 'error' in year_summary:
                     st.error(f"Error analizando archivo: {year_summary['error']}")
@@ -1417,7 +2165,7 @@ def show_year_conversion():
         with col1:
             output_format = st.selectbox(
                 "Formato de salida:",
-                ["sql", "sqlite", "csv", "excel", "json"],
+                OUTPUT_FORMAT_OPTIONS,
                 help="Formato de los archivos generados por año"
             )
         
@@ -1475,28 +2223,12 @@ def show_year_conversion():
             
             # Vista previa del nombre generado
             if year_prefix or year_suffix:
-                example_name = "ejemplo_tabla"
-                preview_year = 2008
-                
-                # Simular el nombre generado
-                preview_base = example_name.lower() if year_lowercase else example_name
-                
-                if year_prefix:
-                    prefix = year_prefix.replace('{year}', str(preview_year))
-                    preview_base = f"{prefix}{preview_base}"
-                else:
-                    preview_base = f"{preview_base}-{preview_year}"
-                    
-                if year_suffix:
-                    suffix = year_suffix.replace('{year}', str(preview_year))
-                    preview_base = f"{preview_base}{suffix}"
-                    
+                preview_base = year_preview_base(year_prefix, year_suffix, year_lowercase)
+                # La hora solo se consulta si el timestamp está activado
                 if use_year_timestamp:
-                    from datetime import datetime
-                    timestamp = datetime.now().strftime("_%Y%m%d_%H%M%S")
-                    preview_base = f"{preview_base}{timestamp}"
+                    preview_base += datetime.now().strftime("_%Y%m%d_%H%M%S")
                 
-                st.info(f"📋 Vista previa: `{preview_base}.{output_format}`")
+                st.info(f"📋 Vista previa: `{preview_base}{OUTPUT_EXTENSIONS.get(output_format, '.sql')}`")
         
         # Configuración de Base de Datos en Línea
         with st.expander("🌐 Conexión a Base de Datos en Línea", expanded=False):
@@ -1523,6 +2255,27 @@ def show_year_conversion():
                 with col6:
                     mysql_user = st.text_input("Usuario:", value="", placeholder="tu_usuario")
                     mysql_password = st.text_input("Contraseña:", type="password", value="")
+                    max_parallel_tables = st.number_input(
+                        "Tablas en paralelo:",
+                        value=YEAR_DEFAULT_WORKERS,
+                        min_value=1,
+                        max_value=8,
+                        help="Cargas simultáneas (cada una usa su propia conexión)"
+                    )
+                    mysql_batch_size = st.number_input(
+                        "Filas por INSERT:",
+                        value=5000,
+                        min_value=100,
+                        max_value=50000,
+                        step=500,
+                        help="Solo si el servidor no permite LOAD DATA LOCAL (se limita a 65535 parámetros por sentencia)"
+                    )
+                    mysql_compress = st.checkbox(
+                        "Comprimir protocolo",
+                        # Activada por defecto para servidores remotos (misma regla que MySQLWriter)
+                        value=mysql_host.strip().lower() not in ('', 'localhost', '127.0.0.1', '::1'),
+                        help="Reduce los bytes enviados a servidores remotos a costa de CPU"
+                    )
                 
                 if mysql_host and mysql_database and mysql_user and mysql_password:
                     db_config = {
@@ -1531,13 +2284,15 @@ def show_year_conversion():
                         'port': mysql_port,
                         'database': mysql_database,
                         'user': mysql_user,
-                        'password': mysql_password
+                        'password': mysql_password,
+                        'max_parallel_tables': max_parallel_tables,
+                        'batch_size': mysql_batch_size,
+                        'compress': mysql_compress
                     }
                     
                     if st.button("🔍 Probar Conexión MySQL"):
                         try:
-                            from src.writers.mysql_writer import MySQLWriter
-                            mysql_writer = MySQLWriter(db_config)
+                            mysql_writer = mysql_writer_for(db_config)
                             test_result = mysql_writer.test_connection()
                             
                             if test_result['success']:
@@ -1627,8 +2382,8 @@ def show_year_conversion():
         if st.button(f"🔄 Iniciar Conversión por Años {conversion_type}", type="primary", use_container_width=True):
             try:
                 with st.spinner(f"🔄 Convirtiendo archivo por años {conversion_type}..."):
-                    # Crear conversor
-                    converter = FileConverter()
+                    # Reusar el conversor de la sesión (comparte caché de lectura con el análisis)
+                    converter = get_converter()
                     
                     # Realizar conversión
                     if db_config and db_config['type'] == 'mysql':
@@ -1641,6 +2396,7 @@ def show_year_conversion():
                             input_path=file_path,
                             output_format=output_format,
                             output_dir=output_dir,
+                            parallel=True,
                             naming_config=naming_config
                         )
                 
@@ -1652,28 +2408,18 @@ def show_year_conversion():
                 
                 # Resumen de resultados - Adaptado para MySQL y archivos
                 if db_config and db_config['type'] == 'mysql':
-                    # Resultados para MySQL
-                    details = result.get('details', {})
+                    # Resultados para MySQL (el detalle por tabla y año va en la tabla de conversiones)
+                    failed_uploads = sum(
+                        1 for conv in result.get('conversions_by_year', {}).values() if conv['status'] == 'error'
+                    )
                     col1, col2, col3 = st.columns(3)
                     with col1:
-                        st.metric("Tablas subidas", details.get('total_success', 0))
+                        st.metric("Tablas subidas", result.get('total_tables_inserted', 0))
                     with col2:
-                        st.metric("Tablas fallidas", details.get('total_failed', 0))
+                        st.metric("Tablas fallidas", failed_uploads)
                     with col3:
-                        st.metric("Base de datos", details.get('database', 'N/A'))
-                    
-                    # Mostrar tablas subidas exitosamente
-                    if details.get('tables_uploaded'):
-                        st.markdown("### ✅ Tablas Subidas Exitosamente")
-                        for table_info in details['tables_uploaded']:
-                            st.success(f"📋 **{table_info['name']}** - {table_info['statements']} statements ejecutados")
+                        st.metric("Base de datos", result.get('database_name', 'N/A'))
                     
-                    # Mostrar errores si los hay
-                    if details.get('tables_failed'):
-                        st.markdown("### ❌ Tablas con Errores")
-                        for table_error in details['tables_failed']:
-                            st.error(f"📋 **{table_error['name']}**: {table_error['error']}")
-                            
                 else:
                     # Resultados para archivos tradicionales
                     col1, col2, col3 = st.columns(3)
@@ -1688,32 +2434,54 @@ def show_year_conversion():
                 if 'conversions_by_year' in result:
                     st.markdown("### 📊 Detalles de Conversiones")
                     
-                    successful_conversions = [conv for conv in result['conversions_by_year'].values() 
-                                           if conv['status'] == 'success']
-                    error_conversions = [conv for conv in result['conversions_by_year'].values() 
-                                       if conv['status'] == 'error']
+                    # Una sola pasada: columnas paralelas para la tabla y lista de errores
+                    result_columns = {'Tabla': [], 'Año': [], 'Filas': [], 'Archivo': [], 'Tamaño (MB)': []}
+                    error_conversions = []
+                    for conv in result['conversions_by_year'].values():
+                        if conv['status'] == 'success':
+                            result_columns['Tabla'].append(conv['table'])
+                            result_columns['Año'].append(conv['year'])
+                            # Las conversiones a MySQL informan filas insertadas y tabla destino
+                            result_columns['Filas'].append(conv.get('rows_converted', conv.get('rows_inserted', 0)))
+                            result_columns['Archivo'].append(conv.get('output_file', conv.get('mysql_table', '')))
+                            result_columns['Tamaño (MB)'].append(conv.get('file_size_mb', 0))
+                        elif conv['status'] == 'error':
+                            error_conversions.append(conv)
                     
-                    if successful_conversions:
-                        st.success(f"✅ **Conversiones exitosas:** {len(successful_conversions)}")
-                        
-                        # Tabla de resultados
-                        results_data = []
-                        for conv in successful_conversions:
-                            results_data.append({
-                                'Tabla': conv['table'],
-                                'Año': conv['year'],
-                                'Filas': f"{conv['rows_converted']:,}",
-                                'Archivo': conv['output_file'],
-                                'Tamaño (MB)': f"{conv.get('file_size_mb', 0):.1f}"
-                            })
+                    if result_columns['Tabla']:
+                        st.success(f"✅ **Conversiones exitosas:** {len(result_columns['Tabla'])}")
                         
-                        df_results = pd.DataFrame(results_data)
-                    st.dataframe(df_results, use_container_width=True)
-                
-                if error_conversions:
-                    st.error(f"❌ **Errores:** {len(error_conversions)}")
-                    for conv in error_conversions:
-                        st.error(f"Tabla {conv['table']}, Año {conv['year']}: {conv['error']}")
+                        # Tabla de resultados: columnas con tipo explícito en lugar de inferirlo
+                        # de una lista de dicts; el formato lo aplica column_config
+                        st.dataframe(
+                            build_display_table(
+                                result_columns,
+                                {'Año': np.int64, 'Filas': np.int64, 'Tamaño (MB)': np.float64}
+                            ),
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={
+                                'Año': st.column_config.NumberColumn(format="%d"),
+                                'Tamaño (MB)': st.column_config.NumberColumn(format="%.1f")
+                            }
+                        )
+                    
+                    if error_conversions:
+                        st.error(f"❌ **Errores:** {len(error_conversions)}")
+                        # Una sola tabla en lugar de un mensaje por conversión fallida
+                        st.dataframe(
+                            build_display_table(
+                                {
+                                    'Tabla': [conv['table'] for conv in error_conversions],
+                                    'Año': [conv['year'] for conv in error_conversions],
+                                    'Error': [conv.get('error', 'Error desconocido') for conv in error_conversions]
+                                },
+                                {'Año': np.int64}
+                            ),
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={'Año': st.column_config.NumberColumn(format="%d")}
+                        )
                 
                 # Enlace al directorio de salida
                 st.markdown(f"**📁 Archivos guardados en:** `{result['output_directory']}`")
@@ -1727,8 +2495,10 @@ def show_statistics():
     st.markdown("## 📈 Estadísticas")
     
     # Estadísticas generales
-    input_files = get_input_files()
-    output_files = get_output_files()
+    input_listing = get_directory_listing("data/input")
+    output_listing = get_directory_listing("data/output")
+    input_files = input_listing.files
+    output_files = output_listing.files
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -1737,66 +2507,107 @@ def show_statistics():
     with col2:
         st.metric("Archivos de salida", len(output_files))
     with col3:
-        total_input_size = sum(f['size'] for f in input_files)
-        st.metric("Tamaño entrada", f"{total_input_size:.2f} MB")
+        st.metric("Tamaño entrada", f"{input_listing.total_size:.2f} MB")
     with col4:
-        total_output_size = sum(f['size'] for f in output_files)
-        st.metric("Tamaño salida", f"{total_output_size:.2f} MB")
+        st.metric("Tamaño salida", f"{output_listing.total_size:.2f} MB")
     
     # Gráficos
     if input_files:
         st.markdown("### 📊 Distribución por Formato")
         
         # Contar formatos
-        format_counts = {}
-        for file_info in input_files:
-            ext = Path(file_info['name']).suffix.lower()
-            format_counts[ext] = format_counts.get(ext, 0) + 1
+        format_counts = Counter(os.path.splitext(file_info['name'])[1].lower() for file_info in input_files)
         
         if format_counts:
-            fig = px.pie(
-                values=list(format_counts.values()),
-                names=list(format_counts.keys()),
-                title="Distribución de archivos por formato"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_format_pie(tuple(sorted(format_counts.items()))), use_container_width=True)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_format_pie(format_items):
+    """
+    Gráfico de distribución de archivos por formato, reutilizado mientras no cambie la distribución
+    
+    Args:
+        format_items: Tupla ordenada de pares (extensión, número de archivos)
+    """
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Pie(
+        values=[count for _, count in format_items],
+        labels=[ext for ext, _ in format_items]
+    ))
+    fig.update_layout(title="Distribución de archivos por formato")
+    return fig
 
 # Funciones auxiliares
-def get_input_files():
-    """Obtiene lista de archivos de entrada"""
-    input_dir = Path("data/input")
-    if not input_dir.exists():
+class DirectoryListing(NamedTuple):
+    """Archivos de un directorio con su tamaño total precalculado"""
+    files: List[Dict[str, Any]]
+    total_size: float
+
+def list_directory_files(directory):
+    """
+    Lista los archivos de un directorio en una sola pasada con os.scandir
+    
+    Args:
+        directory: Ruta del directorio
+        
+    Returns:
+        Lista de dicts con 'name', 'size' (MB) y 'modified', más recientes primero
+    """
+    # is_file() usa el tipo que devuelve readdir: solo hay un stat() por archivo
+    try:
+        with os.scandir(directory) as it:
+            entries = [(entry.name, entry.stat()) for entry in it if entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         return []
     
-    files = []
-    for file_path in input_dir.iterdir():
-        if file_path.is_file():
-            stat = file_path.stat()
-            files.append({
-                'name': file_path.name,
-                'size': stat.st_size / (1024 * 1024),
-                'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M')
-            })
+    # Ordenar por la fecha numérica (la cadena formateada pierde los segundos)
+    entries.sort(key=lambda item: item[1].st_mtime, reverse=True)
+    
+    return [
+        {
+            'name': name,
+            'size': stat.st_size * MB_PER_BYTE,
+            'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M')
+        }
+        for name, stat in entries
+    ]
+
+@st.cache_data(ttl=5, show_spinner=False)
+def scan_directory(directory, mtime_ns):
+    """
+    Listado cacheado de un directorio con su tamaño total
     
-    return sorted(files, key=lambda x: x['modified'], reverse=True)
+    Args:
+        directory: Ruta del directorio
+        mtime_ns: Fecha de modificación del directorio (solo forma parte de la
+            clave de caché: crear o borrar archivos la invalida)
+        
+    Returns:
+        Tupla (archivos, tamaño total en MB)
+    """
+    files = list_directory_files(directory)
+    return files, sum(file_info['size'] for file_info in files)
+
+def get_directory_listing(directory):
+    """Obtiene el listado de un directorio con un solo stat del directorio en caché caliente"""
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return DirectoryListing([], 0.0)
+    return DirectoryListing(*scan_directory(directory, mtime_ns))
+
+def get_input_files():
+    """Obtiene lista de archivos de entrada"""
+    return get_directory_listing("data/input").files
 
 def get_output_files():
     """Obtiene lista de archivos de salida"""
-    output_dir = Path("data/output")
-    if not output_dir.exists():
-        return []
-    
-    files = []
-    for file_path in output_dir.iterdir():
-        if file_path.is_file():
-            stat = file_path.stat()
-            files.append({
-                'name': file_path.name,
-                'size': stat.st_size / (1024 * 1024),
-                'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M')
-            })
-    
-    return sorted(files, key=lambda x: x['modified'], reverse=True)
+    return get_directory_listing("data/output").files
+
+def clear_file_cache():
+    """Invalida los listados cacheados tras crear o eliminar archivos"""
+    scan_directory.clear()
 
 def get_success_rate():
     """Calcula la tasa de éxito de conversiones"""
@@ -1809,30 +2620,26 @@ def get_success_rate():
     # Estimación simple basada en archivos de salida vs entrada
     return min(100, (len(output_files) / len(input_files)) * 100)
 
-if __name__ == "__main__":
-    main() 
 def convert_with_new_features(file_path, file_name, export_formats, naming_config, mysql_config, use_chunks):
     """Función mejorada de conversión con soporte para MySQL, chunks e integridad"""
     try:
         # Inicializar componentes
-        access_reader = RobustAccessReader()
+        access_reader = get_access_reader()
         
         # Verificar si DataIntegrityChecker está disponible
-        if MYSQL_AVAILABLE and DataIntegrityChecker:
-            integrity_checker = DataIntegrityChecker()
-        else:
-            integrity_checker = None
+        integrity_checker = get_integrity_checker()
+        if integrity_checker is None:
             st.info("🔧 Verificación de integridad no disponible")
         
         # Verificar soporte para Access
-        support_info = access_reader.check_access_support()
+        support_info = get_access_support()
         if not support_info['supported']:
             st.error("❌ Soporte para Access no disponible")
             st.write(f"Error: {support_info['error_message']}")
             return
         
         # Obtener tablas disponibles
-        available_tables = access_reader.get_table_names(file_path)
+        available_tables = list_access_tables(file_path, os.path.getmtime(file_path))
         if not available_tables:
             st.error("❌ No se detectaron tablas en el archivo Access")
             return
@@ -1840,8 +2647,8 @@ def convert_with_new_features(file_path, file_name, export_formats, naming_confi
         # Configurar MySQL si es necesario
         mysql_writer = None
         if "MySQL" in export_formats and mysql_config:
-            mysql_writer = MySQLWriter(mysql_config)
-            if not mysql_writer.test_connection():
+            mysql_writer = mysql_writer_for(mysql_config)
+            if not mysql_writer.test_connection(max_age=MYSQL_CHECK_MAX_AGE)['success']:
                 st.error("❌ No se pudo conectar a MySQL")
                 return
         
@@ -1851,96 +2658,194 @@ def convert_with_new_features(file_path, file_name, export_formats, naming_confi
         results_container = st.container()
         
         total_tables = len(available_tables)
-        all_results = []
-        integrity_reports = []
         
         status_text.text(f"🔄 Iniciando conversión mejorada de {total_tables} tablas...")
         
-        for i, table_name in enumerate(available_tables):
-            try:
-                # Actualizar progreso
-                progress = (i / total_tables)
-                progress_bar.progress(progress)
-                status_text.text(f"📊 Procesando tabla {i+1}/{total_tables}: {table_name}")
+        # Un solo timestamp por conversión: todas las tablas comparten el mismo sufijo
+        run_timestamp = datetime.now().strftime("_%Y%m%d_%H%M%S")
+        
+        # Nombres de salida de todas las tablas, calculados en bloque antes del pool
+        safe_names = dict(zip(
+            available_tables,
+            apply_naming_batch(available_tables, naming_config, run_timestamp)
+        ))
+        
+        # Por chunks solo se puede añadir a CSV y MySQL; Excel, JSON y Parquet necesitan la tabla completa
+        stream_chunks = use_chunks and set(export_formats) <= {"CSV", "MySQL"}
+        
+        def stream_table(table_name):
+            """
+            Exporta una tabla bloque a bloque (CSV y MySQL), sin tenerla completa en memoria
+            
+            Returns:
+                Resultado de la tabla, o None si está vacía
+            """
+            safe_table_name = safe_names[table_name]
+            csv_file = f"data/output/{safe_table_name}.csv" if "CSV" in export_formats else None
+            mysql_table_name = safe_table_name.lower() if "MySQL" in export_formats and mysql_writer else None
+            loaded_table_name = None
+            total_rows = total_columns = 0
+            
+            with ExitStack() as stack:
+                bulk_connection = stack.enter_context(mysql_writer.bulk_session()) if mysql_table_name else None
+                chunks = access_reader.read_in_chunks(file_path, table_name, chunk_size=10000)
+                for i, chunk in enumerate(chunks):
+                    if csv_file:
+                        write_dataframe_csv(chunk, csv_file, append=i > 0)
+                    if mysql_table_name:
+                        write_result = mysql_writer.load_dataframe(
+                            chunk, mysql_table_name,
+                            if_exists='append' if i else 'replace',
+                            connection=bulk_connection
+                        )
+                        if not write_result.get('success'):
+                            raise RuntimeError(f"MySQL: {write_result.get('error', 'Error desconocido')}")
+                        loaded_table_name = write_result['table_name']
+                    total_rows += len(chunk)
+                    total_columns = len(chunk.columns)
+            
+            if total_rows == 0:
+                return None
+            
+            table_results = []
+            if csv_file:
+                table_results.append({"format": "CSV", "file": csv_file, "status": "✅"})
+            if loaded_table_name:
+                # Cada bloque guardó su propio conteo: dejar el total de la tabla
+                mysql_writer.update_table_stats({loaded_table_name: total_rows})
+                table_results.append({"format": "MySQL", "table": mysql_table_name, "status": "✅"})
+            
+            return {
+                "table": table_name,
+                "rows": total_rows,
+                "columns": total_columns,
+                "results": table_results
+            }
+        
+        def process_table(table_name):
+            """
+            Lee y exporta una tabla en un hilo del pool (sin llamar a Streamlit)
+            
+            Returns:
+                Tupla (resultado de la tabla o None si está vacía, reportes de integridad)
+            """
+            if stream_chunks:
+                return stream_table(table_name), []
+            
+            # Leer datos con el reader compartido: su caché por archivo y fecha de
+            # modificación evita volver a abrir el Access en cada rerun
+            df = access_reader.read(file_path, table_name)
+            
+            if df is None or df.empty:
+                return None, []
+            
+            # Nombre de salida ya calculado para todas las tablas
+            safe_table_name = safe_names[table_name]
+            
+            # Exportar según formatos seleccionados
+            table_results = []
+            table_reports = []
+            
+            for format_type in export_formats:
+                try:
+                    if format_type == "CSV":
+                        output_file = f"data/output/{safe_table_name}.csv"
+                        write_dataframe_csv(df, output_file)
+                        table_results.append({"format": "CSV", "file": output_file, "status": "✅"})
+                    
+                    elif format_type == "Excel":
+                        output_file = f"data/output/{safe_table_name}.xlsx"
+                        df.to_excel(output_file, index=False, engine='openpyxl')
+                        table_results.append({"format": "Excel", "file": output_file, "status": "✅"})
+                    
+                    elif format_type == "JSON":
+                        output_file = f"data/output/{safe_table_name}.json"
+                        df.to_json(output_file, orient='records', indent=2, force_ascii=False)
+                        table_results.append({"format": "JSON", "file": output_file, "status": "✅"})
+                    
+                    elif format_type == "Parquet":
+                        output_file = f"data/output/{safe_table_name}.parquet"
+                        df.to_parquet(output_file, engine='pyarrow', compression='zstd', index=False)
+                        table_results.append({"format": "Parquet", "file": output_file, "status": "✅"})
+                    
+                    elif format_type == "MySQL" and mysql_writer:
+                        mysql_table_name = safe_table_name.lower()
+                        # Carga directa del DataFrame (LOAD DATA, con to_sql como respaldo);
+                        # sin conexión explícita cada hilo abre y cierra la suya
+                        write_result = mysql_writer.load_dataframe(
+                            df, mysql_table_name, chunk_rows=10000 if use_chunks else 100000
+                        )
+                        if write_result.get('success'):
+                            table_results.append({"format": "MySQL", "table": mysql_table_name, "status": "✅"})
+                        else:
+                            table_results.append({"format": "MySQL", "table": mysql_table_name, "status": "❌"})
+                    
+                    # Verificar integridad para archivos exportados
+                    if integrity_checker is not None and format_type in ["CSV", "Excel", "Parquet"] and table_results:
+                        last_result = table_results[-1]
+                        if "file" in last_result:
+                            integrity_report = integrity_checker.verify_export_integrity(
+                                df, last_result["file"], format_type.lower()
+                            )
+                            table_reports.append({
+                                "table": table_name,
+                                "format": format_type,
+                                "report": integrity_report
+                            })
                 
-                # Leer datos (con chunks si es necesario)
-                if use_chunks:
-                    df = access_reader.read_in_chunks(file_path, table_name, chunk_size=10000)
-                else:
-                    df = access_reader.read_table(file_path, table_name)
+                except Exception as e:
+                    table_results.append({"format": format_type, "status": "❌", "error": str(e)})
+            
+            return {
+                "table": table_name,
+                "rows": len(df),
+                "columns": len(df.columns),
+                "results": table_results
+            }, table_reports
+        
+        # Tablas en paralelo (lectura y exportación son E/S); la interfaz solo se
+        # actualiza desde el hilo principal, a medida que terminan
+        results_by_index = {}
+        reports_by_index = {}
+        workers = min(4, os.cpu_count() or 2, total_tables)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(process_table, table_name): (i, table_name)
+                for i, table_name in enumerate(available_tables)
+            }
+            stride = progress_stride(total_tables)
+            for completed, future in enumerate(as_completed(futures), start=1):
+                i, table_name = futures[future]
+                if completed % stride == 0 or completed == total_tables:
+                    progress_bar.progress(completed / total_tables)
+                    status_text.text(f"📊 Tablas procesadas {completed}/{total_tables}: {table_name}")
                 
-                if df is None or df.empty:
-                    st.warning(f"⚠️ Tabla '{table_name}' está vacía o no se pudo leer")
+                try:
+                    table_result, table_reports = future.result()
+                except Exception as e:
+                    st.error(f"❌ Error procesando tabla '{table_name}': {str(e)}")
+                    results_by_index[i] = {
+                        "table": table_name,
+                        "error": str(e),
+                        "results": []
+                    }
                     continue
                 
-                # Calcular estadísticas originales para integridad
-                original_stats = integrity_checker.get_dataframe_stats(df)
-                
-                # Aplicar configuración de nombres
-                safe_table_name = apply_naming_config(table_name, naming_config)
-                
-                # Exportar según formatos seleccionados
-                table_results = []
-                
-                for format_type in export_formats:
-                    try:
-                        if format_type == "CSV":
-                            output_file = f"data/output/{safe_table_name}.csv"
-                            df.to_csv(output_file, index=False, encoding='utf-8')
-                            table_results.append({"format": "CSV", "file": output_file, "status": "✅"})
-                        
-                        elif format_type == "Excel":
-                            output_file = f"data/output/{safe_table_name}.xlsx"
-                            df.to_excel(output_file, index=False, engine='openpyxl')
-                            table_results.append({"format": "Excel", "file": output_file, "status": "✅"})
-                        
-                        elif format_type == "JSON":
-                            output_file = f"data/output/{safe_table_name}.json"
-                            df.to_json(output_file, orient='records', indent=2, force_ascii=False)
-                            table_results.append({"format": "JSON", "file": output_file, "status": "✅"})
-                        
-                        elif format_type == "MySQL" and mysql_writer:
-                            mysql_table_name = safe_table_name.lower()
-                            success = mysql_writer.write_dataframe(df, mysql_table_name)
-                            if success:
-                                table_results.append({"format": "MySQL", "table": mysql_table_name, "status": "✅"})
-                            else:
-                                table_results.append({"format": "MySQL", "table": mysql_table_name, "status": "❌"})
-                        
-                        # Verificar integridad para archivos exportados
-                        if format_type in ["CSV", "Excel"] and table_results:
-                            last_result = table_results[-1]
-                            if "file" in last_result:
-                                integrity_report = integrity_checker.verify_export_integrity(
-                                    df, last_result["file"], format_type.lower()
-                                )
-                                integrity_reports.append({
-                                    "table": table_name,
-                                    "format": format_type,
-                                    "report": integrity_report
-                                })
-                    
-                    except Exception as e:
-                        table_results.append({"format": format_type, "status": "❌", "error": str(e)})
-                
-                all_results.append({
-                    "table": table_name,
-                    "rows": len(df),
-                    "columns": len(df.columns),
-                    "results": table_results
-                })
+                if table_result is None:
+                    st.warning(f"⚠️ Tabla '{table_name}' está vacía o no se pudo leer")
+                    continue
                 
-            except Exception as e:
-                st.error(f"❌ Error procesando tabla '{table_name}': {str(e)}")
-                all_results.append({
-                    "table": table_name,
-                    "error": str(e),
-                    "results": []
-                })
+                results_by_index[i] = table_result
+                reports_by_index[i] = table_reports
+        
+        # Resultados en el orden original de las tablas
+        all_results = [results_by_index[i] for i in sorted(results_by_index)]
+        integrity_reports = [report for i in sorted(reports_by_index) for report in reports_by_index[i]]
         
         # Completar progreso
         progress_bar.progress(1.0)
         status_text.text("✅ Conversión completada")
+        clear_file_cache()
         
         # Mostrar resultados
         with results_container:
@@ -1987,43 +2892,88 @@ def convert_with_new_features(file_path, file_name, export_formats, naming_confi
         st.error(f"❌ Error general en la conversión: {str(e)}")
         st.exception(e)
 
-def apply_naming_config(original_name, naming_config):
-    """Aplica la configuración de nombres personalizada"""
-    if not naming_config:
-        return original_name.replace(' ', '_')
+def apply_naming_batch(original_names, naming_config, timestamp=None):
+    """
+    Aplica la configuración de nombres a una lista de tablas de una sola vez
+    
+    Prefijo, sufijo, timestamp, minúsculas, espacios y limpieza de caracteres
+    se aplican en bloque con los métodos .str de pandas.
     
-    import re
-    from datetime import datetime
+    Args:
+        original_names: Nombres originales de las tablas
+        naming_config: Configuración de nombres (prefijo, sufijo, opciones)
+        timestamp: Sufijo de fecha ya formateado, común a toda la conversión
     
-    # Aplicar prefijo
-    name = original_name
-    if naming_config.get('table_prefix'):
-        name = f"{naming_config['table_prefix']}{name}"
+    Returns:
+        Lista de nombres transformados, en el mismo orden
+    """
+    names = pd.Series(list(original_names), dtype=object)
+    if names.empty:
+        return []
     
-    # Aplicar sufijo
-    if naming_config.get('table_suffix'):
-        name = f"{name}{naming_config['table_suffix']}"
+    if not naming_config:
+        return names.str.replace(' ', '_', regex=False).tolist()
     
-    # Añadir timestamp si está configurado
-    if naming_config.get('use_timestamp'):
+    if not naming_config.get('use_timestamp'):
+        timestamp = None
+    elif timestamp is None:
         timestamp = datetime.now().strftime("_%Y%m%d_%H%M%S")
-        name = f"{name}{timestamp}"
     
-    # Aplicar transformaciones de texto
+    # Prefijo, sufijo y timestamp
+    names = (naming_config.get('table_prefix') or '') + names
+    names = names + (naming_config.get('table_suffix') or '') + (timestamp or '')
+    
+    # Transformaciones de texto
     if naming_config.get('lowercase_names', True):
-        name = name.lower()
+        names = names.str.lower()
     
     if naming_config.get('replace_spaces', True):
-        name = name.replace(' ', '_')
+        names = names.str.replace(' ', '_', regex=False)
     
-    # Limpiar caracteres adicionales
-    name = name.replace('-', '_')
+    names = names.str.replace('-', '_', regex=False)
     
     if naming_config.get('remove_special_chars', True):
-        # Mantener solo letras, números, guiones y guiones bajos
-        name = re.sub(r'[^a-zA-Z0-9_-]', '', name)
+        names = names.str.replace(_NAME_SANITIZE_RE, '', regex=True)
+    
+    return names.tolist()
+
+@lru_cache(maxsize=64)
+def year_table_namer(prefix, suffix, lowercase):
+    """
+    Construye la función que nombra las tablas MySQL por año para unas opciones dadas
+    
+    Las opciones no cambian durante la conversión: las plantillas se separan
+    por {year} y las ramas se resuelven una sola vez, y cada trabajo solo
+    une las piezas con su año.
     
-    return name
+    Args:
+        prefix: Prefijo configurado ('' si no hay); admite {year}
+        suffix: Sufijo configurado ('' si no hay); admite {year}
+        lowercase: Pasar el nombre de la tabla a minúsculas
+        
+    Returns:
+        Función (table_name, year) -> nombre válido para MySQL
+    """
+    def clean(name):
+        return _MYSQL_NAME_SANITIZE_RE.sub('', name.translate(_MYSQL_NAME_TRANSLATION))
+    
+    if not (prefix or suffix):
+        # Nombre por defecto
+        return lambda table_name, year: clean(f"{table_name}_{year}".lower())
+    
+    prefix_parts = prefix.split('{year}')
+    suffix_parts = suffix.split('{year}')
+    # Sin prefijo, el año va pegado al nombre de la tabla
+    separator = '' if prefix else '_'
+    
+    def name_for(table_name, year):
+        year_text = str(year)
+        table_base = table_name.lower() if lowercase else table_name
+        head = year_text.join(prefix_parts) if prefix else ''
+        tail = '' if prefix else year_text
+        return clean(f"{head}{table_base}{separator}{tail}{year_text.join(suffix_parts)}")
+    
+    return name_for
 
 
 def convert_to_mysql_by_year(file_path: str, db_config: dict, naming_config: dict) -> dict:
@@ -2038,15 +2988,10 @@ def convert_to_mysql_by_year(file_path: str, db_config: dict, naming_config: dic
     Returns:
         Dict con resultado de la conversión
     """
-    import streamlit as st
-    import re
-    from src.readers.robust_access_reader import RobustAccessReader
-    from src.writers.mysql_writer import MySQLWriter
-    
     try:
-        # Conectar a MySQL
-        mysql_writer = MySQLWriter(db_config)
-        test_result = mysql_writer.test_connection()
+        # Conectar a MySQL (writer y pool reutilizados entre clics)
+        mysql_writer = mysql_writer_for(db_config)
+        test_result = mysql_writer.test_connection(max_age=MYSQL_CHECK_MAX_AGE)
         
         if not test_result['success']:
             raise Exception(f"No se pudo conectar a MySQL: {test_result['message']}")
@@ -2054,8 +2999,8 @@ def convert_to_mysql_by_year(file_path: str, db_config: dict, naming_config: dic
         st.info("✅ Conectado a MySQL exitosamente")
         
         # Obtener resumen de años
-        access_reader = RobustAccessReader()
-        year_summary = access_reader.get_year_summary(file_path)
+        access_reader = get_access_reader()
+        year_summary = get_access_year_summary(file_path, os.path.getmtime(file_path))
         
         if 'error' in year_summary:
             raise Exception(f"Error obteniendo resumen de años: {year_summary['error']}")
@@ -2065,15 +3010,8 @@ def convert_to_mysql_by_year(file_path: str, db_config: dict, naming_config: dic
         total_rows_inserted = 0
         conversions_by_year = {}
         
-        # Procesar cada tabla y año
-        progress_bar = st.progress(0)
-        total_jobs = sum(
-            len(table_info.get('available_years', []))
-            for table_info in year_summary['tables'].values()
-            if 'error' not in table_info
-        )
-        current_job = 0
-        
+        # Preparar lista de trabajos (tabla, año)
+        jobs = []
         for table_name, table_info in year_summary['tables'].items():
             if 'error' in table_info:
                 st.warning(f"⚠️ Saltando tabla {table_name}: {table_info['error']}")
@@ -2084,83 +3022,177 @@ def convert_to_mysql_by_year(file_path: str, db_config: dict, naming_config: dic
                 continue
             
             for year in table_info['available_years']:
-                try:
-                    current_job += 1
-                    progress_bar.progress(current_job / total_jobs)
-                    
-                    st.write(f"📊 Procesando tabla {table_name}, año {year}...")
-                    
-                    # Leer datos del año específico
-                    df = access_reader.read_by_year(file_path, table_name, year)
-                    
-                    if df.empty:
-                        st.warning(f"⚠️ No hay datos para {table_name}, año {year}")
-                        continue
-                    
-                    # Generar nombre de tabla personalizado
-                    if naming_config and (naming_config.get('table_prefix') or naming_config.get('table_suffix')):
-                        # Usar configuración personalizada
-                        table_base = table_name.lower() if naming_config.get('lowercase_names', True) else table_name
-                        
-                        if naming_config.get('table_prefix'):
-                            prefix = naming_config['table_prefix'].replace('{year}', str(year))
-                            mysql_table_name = f"{prefix}{table_base}"
-                        else:
-                            mysql_table_name = f"{table_base}_{year}"
-                            
-                        if naming_config.get('table_suffix'):
-                            suffix = naming_config['table_suffix'].replace('{year}', str(year))
-                            mysql_table_name = f"{mysql_table_name}{suffix}"
-                    else:
-                        # Nombre por defecto
-                        mysql_table_name = f"{table_name}_{year}".lower()
-                    
-                    # Limpiar nombre para MySQL
-                    mysql_table_name = mysql_table_name.replace('-', '_').replace(' ', '_')
-                    mysql_table_name = re.sub(r'[^a-zA-Z0-9_]', '', mysql_table_name)
-                    
-                    # Escribir a MySQL
-                    write_result = mysql_writer.write(
-                        df, 
-                        mysql_table_name,
-                        if_exists='replace'  # Reemplazar si existe
+                jobs.append((table_name, year))
+        
+        # Opciones de nombre resueltas una vez: cada trabajo solo llama al formateador
+        naming_config = naming_config or {}
+        mysql_table_name_for = year_table_namer(
+            naming_config.get('table_prefix') or '',
+            naming_config.get('table_suffix') or '',
+            naming_config.get('lowercase_names', True)
+        )
+        
+        def upload_year(table_name, year):
+            """Lee un año de una tabla y lo carga en MySQL (se ejecuta en un hilo, sin llamar a Streamlit)"""
+            df = access_reader.read_by_year(file_path, table_name, year)
+            if df.empty:
+                return None, None
+            
+            # Generar nombre de tabla personalizado
+            mysql_table_name = mysql_table_name_for(table_name, year)
+            
+            # Cada hilo reutiliza su propia conexión de carga masiva (las conexiones no se comparten)
+            bulk_connection = worker_connection()
+            try:
+                write_result = mysql_writer.load_dataframe(
+                    df, 
+                    mysql_table_name,
+                    if_exists='swap',  # Cargar aparte y sustituir con RENAME: sin ventana vacía
+                    connection=bulk_connection
+                )
+                bulk_connection.commit()
+            except Exception:
+                # El siguiente trabajo de este hilo abrirá una conexión nueva
+                worker_state.connection = None
+                raise
+            return mysql_table_name, write_result
+        
+        # Una sesión de carga masiva por hilo, abierta con su primer trabajo y cerrada al final
+        worker_state = threading.local()
+        bulk_sessions = []
+        bulk_sessions_lock = threading.Lock()
+        
+        def worker_connection():
+            """Conexión de carga masiva del hilo actual (se abre la primera vez)"""
+            connection = getattr(worker_state, 'connection', None)
+            if connection is None:
+                session = mysql_writer.bulk_session()
+                connection = session.__enter__()
+                with bulk_sessions_lock:
+                    bulk_sessions.append(session)
+                worker_state.connection = connection
+            return connection
+        
+        # Canalización en dos etapas: un hilo lee las tablas de Access en orden (cada
+        # tabla una vez, separada por años) y encola la carga de sus años en el pool de
+        # MySQL, de modo que la lectura de la tabla siguiente se solapa con la subida de
+        # la actual. Como mucho YEAR_READ_AHEAD_TABLES tablas leídas esperan su carga.
+        years_by_table = {}
+        for table_name, year in jobs:
+            years_by_table.setdefault(table_name, []).append(year)
+        finished_jobs = queue.Queue()
+        read_slots = threading.BoundedSemaphore(YEAR_READ_AHEAD_TABLES)
+        
+        def submit_table(executor, table_name, years):
+            """Encola los años de una tabla ya leída; tras el último la descarta y libera su hueco"""
+            remaining = [len(years)]
+            remaining_lock = threading.Lock()
+            
+            def job_done(future, year):
+                finished_jobs.put((future, table_name, year))
+                with remaining_lock:
+                    remaining[0] -= 1
+                    table_finished = remaining[0] == 0
+                if table_finished:
+                    # Sin esto la tabla seguiría en las cachés del lector (completa y por años)
+                    access_reader.evict_table(file_path, table_name)
+                    read_slots.release()
+            
+            for year in years:
+                future = executor.submit(upload_year, table_name, year)
+                future.add_done_callback(lambda f, year=year: job_done(f, year))
+        
+        def read_and_submit(executor):
+            """Etapa de lectura (hilo propio, sin llamar a Streamlit)"""
+            pending = list(years_by_table.items())
+            try:
+                while pending:
+                    table_name, years = pending[0]
+                    read_slots.acquire()
+                    try:
+                        access_reader.read_all_years(file_path, table_name)
+                    except Exception:
+                        # Cada año volverá a intentarlo y registrará el error
+                        pass
+                    submit_table(executor, table_name, years)
+                    pending.pop(0)
+            except Exception as e:
+                # Los trabajos no encolados se dan por fallidos para no bloquear la espera
+                for table_name, years in pending:
+                    for year in years:
+                        failed = Future()
+                        failed.set_exception(e)
+                        finished_jobs.put((failed, table_name, year))
+        
+        # Subir tablas/años en paralelo; la interfaz se actualiza desde el hilo principal,
+        # en lotes: un registro acotado y la barra se refrescan cada pocos trabajos
+        progress_bar = st.progress(0)
+        log_area = st.empty()
+        job_log = deque(maxlen=YEAR_LOG_LINES)
+        if jobs:
+            max_workers = min(db_config.get('max_parallel_tables', YEAR_DEFAULT_WORKERS), len(jobs))
+            refresh_stride = progress_stride(len(jobs))
+            last_refresh = time.monotonic()
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # Etapa de lectura en su propio hilo; los trabajos terminados llegan por la cola
+                    reader = threading.Thread(
+                        target=read_and_submit, args=(executor,), name="year-reader", daemon=True
                     )
-                    
-                    if write_result['success']:
-                        total_tables_inserted += 1
-                        total_rows_inserted += write_result['rows_written']
+                    reader.start()
+                    for completed in range(1, len(jobs) + 1):
+                        future, table_name, year = finished_jobs.get()
                         
-                        conversions_by_year[f"{table_name}_{year}"] = {
-                            'table': table_name,
-                            'year': year,
-                            'mysql_table': mysql_table_name,
-                            'status': 'success',
-                            'rows_inserted': write_result['rows_written'],
-                            'columns': write_result['columns_written']
-                        }
+                        try:
+                            mysql_table_name, write_result = future.result()
+                        except Exception as e:
+                            job_log.append(f"❌ Error procesando {table_name} año {year}: {str(e)}")
+                            conversions_by_year[f"{table_name}_{year}"] = {
+                                'table': table_name,
+                                'year': year,
+                                'status': 'error',
+                                'error': str(e)
+                            }
+                        else:
+                            if write_result is None:
+                                job_log.append(f"⚠️ No hay datos para {table_name}, año {year}")
+                            elif write_result['success']:
+                                total_tables_inserted += 1
+                                total_rows_inserted += write_result['rows_written']
+                                
+                                conversions_by_year[f"{table_name}_{year}"] = {
+                                    'table': table_name,
+                                    'year': year,
+                                    'mysql_table': mysql_table_name,
+                                    'status': 'success',
+                                    'rows_inserted': write_result['rows_written'],
+                                    'columns': write_result['columns_written']
+                                }
+                                
+                                job_log.append(f"✅ {mysql_table_name}: {write_result['rows_written']:,} filas insertadas")
+                            else:
+                                job_log.append(f"❌ Error insertando {mysql_table_name}: {write_result.get('error', 'Error desconocido')}")
+                                conversions_by_year[f"{table_name}_{year}"] = {
+                                    'table': table_name,
+                                    'year': year,
+                                    'mysql_table': mysql_table_name,
+                                    'status': 'error',
+                                    'error': write_result.get('error', 'Error desconocido')
+                                }
                         
-                        st.success(f"✅ {mysql_table_name}: {write_result['rows_written']:,} filas insertadas")
-                    else:
-                        st.error(f"❌ Error insertando {mysql_table_name}: {write_result.get('error', 'Error desconocido')}")
-                        conversions_by_year[f"{table_name}_{year}"] = {
-                            'table': table_name,
-                            'year': year,
-                            'mysql_table': mysql_table_name,
-                            'status': 'error',
-                            'error': write_result.get('error', 'Error desconocido')
-                        }
-                
-                except Exception as e:
-                    st.error(f"❌ Error procesando {table_name} año {year}: {str(e)}")
-                    conversions_by_year[f"{table_name}_{year}"] = {
-                        'table': table_name,
-                        'year': year,
-                        'status': 'error',
-                        'error': str(e)
-                    }
-        
-        # Cerrar conexión MySQL
-        mysql_writer.close()
+                        now = time.monotonic()
+                        if (completed % refresh_stride == 0 or completed == len(jobs)
+                                or now - last_refresh >= YEAR_REFRESH_SECONDS):
+                            progress_bar.progress(completed / len(jobs), text=f"{completed} de {len(jobs)} tablas/años")
+                            log_area.code("\n".join(job_log))
+                            last_refresh = now
+            finally:
+                # Confirmado cada trabajo, cerrar las sesiones de los hilos (restauran sus variables)
+                for session in bulk_sessions:
+                    try:
+                        session.__exit__(None, None, None)
+                    except Exception:
+                        pass
         
         return {
             'input_file': file_path,
@@ -2176,4 +3208,8 @@ def convert_to_mysql_by_year(file_path: str, db_config: dict, naming_config: dic
         
     except Exception as e:
         st.error(f"❌ Error en conversión a MySQL: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+
+if __name__ == "__main__":
+    main()